@@ -64,15 +64,43 @@ bl_info = {
 if "bpy" in locals():
     from importlib import reload
         
-    # Mind the order as updateChecker is a dependency of meshNameSynchronizer
+    # Mind the order as these are dependencies of meshNameSynchronizer
+    reload(httpClient)
     reload(updateChecker)
+    reload(renamePlanner)
+    reload(objectScope)
+    reload(liveSync)
+    reload(runLog)
+    reload(runStats)
+    reload(planCache)
+    reload(renameJournal)
+    reload(namingTemplate)
+    reload(nameIndex)
+    reload(renameManifest)
+    reload(syncRun)
+    reload(syncApi)
     reload(meshNameSynchronizer)
     
     del reload
 
+import time
 import bpy
 from . import meshNameSynchronizer
+from . import httpClient
 from . import updateChecker
+from . import renamePlanner
+from . import objectScope
+from . import liveSync
+from . import runLog
+from . import runStats
+from . import planCache
+from . import renameJournal
+from . import namingTemplate
+from . import nameIndex
+from . import renameManifest
+from . import syncRun
+from . import syncApi
+from bpy.app.handlers import persistent
 
 # Properties ======================================================================================================================
 
@@ -86,7 +114,10 @@ classes = [
     updateChecker.T1NKER_OT_MeshNameSynchronizerUpdateChecker,
     meshNameSynchronizer.T1nkerMeshNameSynchronizerSettings, 
     meshNameSynchronizer.T1nkerMeshNameSynchronizerAddonPreferences, 
-    meshNameSynchronizer.T1NKER_OT_MeshNameSynchronizer    
+    meshNameSynchronizer.T1NKER_OT_MeshNameSynchronizer,
+    meshNameSynchronizer.T1NKER_OT_MeshNameSynchronizerRevert,
+    meshNameSynchronizer.T1NKER_OT_MeshNameSynchronizerReplayManifest,
+    meshNameSynchronizer.T1NKER_OT_MeshNameSynchronizerRevertManifest
 ]
 """
 List of classes requiring registration and unregistration.
@@ -101,6 +132,16 @@ menuLocations = [
 Location to add the menu to.
 """
 
+updateCheckDelaySeconds = 5.0
+"""
+Seconds to wait after registration before checking for updates in the background.
+"""
+
+registrationSeconds = 0.0
+"""
+Time the last `register()` took (seconds). See `benchmarks/startupBenchmark.py`.
+"""
+
 
 # Public functions ================================================================================================================
 
@@ -121,9 +162,13 @@ def menuItem(self, context):
 # Register the plugin -------------------------------------------------------------------------------------------------------------
 def register():
     """
-    Perform registration of the add-on when being enabled.
+    Perform registration of the add-on when being enabled. This runs at each startup of Blender, including headless jobs, so
+    only what's needed is done here, and anything heavy, such as loading an HTTP library, is left for first use.
     """
     
+    global registrationSeconds
+    registrationStarted = time.perf_counter()
+    
     # Make sure to avoid double registration
     unregister()
     
@@ -133,6 +178,19 @@ def register():
     
     bpy.types.Scene.T1nkerMeshNameSynchronizerSettings = bpy.props.PointerProperty(type=meshNameSynchronizer.T1nkerMeshNameSynchronizerSettings)
     
+    # Check for updates in the background once Blender has finished starting up, so that neither startup
+    # nor the synchronizer operator ever waits for the network. Headless jobs never show updates, so don't check there.
+    # Other T1nk-R add-ons checking for updates check this one too, in the same request.
+    if not bpy.app.background:
+        updateChecker.BackgroundUpdateChecker.registerApp()
+        bpy.app.timers.register(_requestUpdateCheck, first_interval=updateCheckDelaySeconds)
+    
+    # Keep names in sync as objects are renamed, if enabled for the scene
+    liveSync.LiveSync.register()
+    
+    # A plan cached or renames journaled for a file are of no use for another one
+    bpy.app.handlers.load_post.append(_onFileLoaded)
+    
     # Add menus to locations specified above
     for location in menuLocations:
         location.append(menuItem)
@@ -152,6 +210,38 @@ def register():
         km = wm.keyconfigs.addon.keymaps.new(name='Outliner', space_type='OUTLINER')
         kmi = km.keymap_items.new(meshNameSynchronizer.T1NKER_OT_MeshNameSynchronizer.bl_idname, 'F3', 'PRESS', ctrl=True, shift=True)
         addon_keymaps.append((km, kmi))
+    
+    registrationSeconds = time.perf_counter() - registrationStarted
+
+# Start update check in the background --------------------------------------------------------------------------------------------
+def _requestUpdateCheck():
+    """
+    Timer callback to start a background update check. See `updateChecker.BackgroundUpdateChecker`.
+    """
+    
+    try:
+        updateChecker.BackgroundUpdateChecker.requestCheck()
+    except:
+        # Failing to check updates shall never disturb the user
+        pass
+    
+    # Run only once
+    return None
+
+# Forget what belongs to the previous file ----------------------------------------------------------------------------------------
+@persistent
+def _onFileLoaded(*args):
+    """
+    Handler forgetting the cached plan and the rename journal when a file is loaded, as they refer to the previous file. 
+    See `planCache.PlanCache` and `renameJournal.RenameJournal`. Settings saved in the file by earlier versions are converted,
+    see `meshNameSynchronizer.T1nkerMeshNameSynchronizerSettings.migrateLegacySettings()`.
+    """
+    
+    planCache.PlanCache.clear()
+    renameJournal.RenameJournal.clear()
+    
+    for scene in bpy.data.scenes:
+        scene.T1nkerMeshNameSynchronizerSettings.migrateLegacySettings()
 
 # Unregister the plugin -----------------------------------------------------------------------------------------------------------
 def unregister():
@@ -168,6 +258,20 @@ def unregister():
             
         addon_keymaps.clear()
         
+        # Stop waiting for update check results
+        if bpy.app.timers.is_registered(_requestUpdateCheck):
+            bpy.app.timers.unregister(_requestUpdateCheck)
+        
+        updateChecker.BackgroundUpdateChecker.shutdown()
+        
+        liveSync.LiveSync.unregister()
+        
+        if _onFileLoaded in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(_onFileLoaded)
+        
+        planCache.PlanCache.clear()
+        renameJournal.RenameJournal.clear()
+        
         del bpy.types.Scene.T1nkerMeshNameSynchronizerSettings
 
         # Unregister classes (in reverse order)
@@ -0,0 +1,751 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for synchronizing names in many Blender files in parallel, without UI.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+#
+# USAGE ***************************************************************************************************************************
+#
+#   blender -b --factory-startup --python batchSync.py -- [options] <.blend files or folders>
+#
+# or, with the `bpy` module installed in a regular Python interpreter:
+#
+#   python batchSync.py [options] <.blend files or folders>
+#
+# The coordinator starts a pool of background Blender workers (one per CPU by default). Workers pull files from a shared queue,
+# synchronize names, and save files only if something has actually been renamed. A JSON summary is written for each file
+# as well as a merged report. Run with `--help` to learn about options.
+#
+# To only check names, such as in CI, run with `--lint` in any Python 3 interpreter, without Blender:
+#
+#   python batchSync.py --lint [options] --drifting-files drifting.txt <.blend files or folders>
+#
+# Files are not opened in Blender, but the names of objects and their data are read from the headers of the blocks of each file 
+# by a pool of processes, and checked against the same rules. The exit code is 1 if any file has names out of sync, and the
+# files listed in `drifting.txt` can be synchronized by a later run with `--files-from drifting.txt`.
+#
+# *********************************************************************************************************************************
+
+from __future__ import annotations
+import argparse
+import concurrent.futures
+import importlib
+import importlib.util
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import types
+
+
+# Constants =======================================================================================================================
+
+resultMarker = "T1NKR-BATCH-RESULT "
+"""
+Prefix of lines by which workers report results on their standard output, to tell them apart from Blender's own output.
+"""
+
+readyMarker = "T1NKR-BATCH-READY"
+"""
+Line printed by workers when they are ready to receive files.
+"""
+
+
+# Public functions ================================================================================================================
+
+# Parse command line --------------------------------------------------------------------------------------------------------------
+def parseArguments(argv: list) -> argparse.Namespace:
+    """
+    Parse command line arguments. When run by Blender, only arguments after `--` are considered.
+
+    Args:
+        argv (list[str]): The command line, typically `sys.argv`.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]
+    else:
+        argv = argv[1:]
+    
+    parser = argparse.ArgumentParser(
+        prog="batchSync.py",
+        description="Synchronize mesh names with object names in many .blend files in parallel."
+    )
+    parser.add_argument("paths", nargs="*", help=".blend files or folders to search recursively for .blend files")
+    parser.add_argument("--files-from", default="", help="Read paths of .blend files from this text file, one per line")
+    parser.add_argument("--prefix", default="", help="Prefix to prepend to data names")
+    parser.add_argument("--suffix", default="", help="Suffix to append to data names")
+    parser.add_argument("--template", default="{prefix}{object}{suffix}", 
+                        help="Template of data names, with fields {prefix}, {suffix}, {object}, {collection}, {type}, {index}, " \
+                            "{parent}, {root}, {depth} and {sibling_index}")
+    parser.add_argument("--pattern", default="", help="Regular expression to replace in object names for {object}")
+    parser.add_argument("--replacement", default="", help="Replacement of matches of --pattern")
+    parser.add_argument("--scope", default="FILE", choices=["FILE", "SCENE", "VIEW_LAYER", "COLLECTION"], 
+                        help="Objects to process in each file (default: FILE)")
+    parser.add_argument("--kinds", default="DATA", 
+                        help="Comma-separated kinds of data to rename: DATA, MATERIAL, ARMATURE, ACTION (default: DATA)")
+    parser.add_argument("--types", default="", help="Comma-separated object types to process, such as MESH,CURVE (default: all)")
+    parser.add_argument("--collision-policy", default="NUMBER", choices=["NUMBER", "SKIP"], help="What to do if a name is taken")
+    parser.add_argument("--shared-data-policy", default="KEEP_MATCHING", choices=["KEEP_MATCHING", "FIRST_NAME", "LAST_NAME"],
+                        help="Which object to name shared data after")
+    parser.add_argument("--dry-run", action="store_true", help="Don't save anything, just report what would be renamed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of parallel workers (default: CPUs)")
+    parser.add_argument("--blender", default="", 
+                        help="Blender executable to run workers with (default: this Python if it can import bpy, 'blender' otherwise)")
+    parser.add_argument("--report-dir", default="", help="Folder to write per-file JSON summaries to")
+    parser.add_argument("--report", default="", help="File to write the merged JSON report to (default: print to stdout)")
+    parser.add_argument("--lint", action="store_true", 
+                        help="Only check names, reading them from the files without Blender, and exit with 1 if any is out " \
+                            "of sync")
+    parser.add_argument("--drifting-files", default="", 
+                        help="With --lint, write paths of files with names out of sync (or failing to read) to this file, " \
+                            "one per line, to pass to --files-from")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    
+    return parser.parse_args(argv)
+
+# Find files to process -----------------------------------------------------------------------------------------------------------
+def collectFiles(paths: list, filesFrom: str = "") -> list:
+    """
+    Collect .blend files from the specified files and folders. Backups such as `.blend1` are not included.
+
+    Args:
+        paths (list[str]): Files and folders. Folders are searched recursively.
+        filesFrom (str, optional): A text file listing further files, one per line. Defaults to none.
+
+    Returns:
+        list[str]: Absolute paths of the .blend files, sorted and without duplicates.
+    """
+    
+    paths = list(paths)
+    if filesFrom:
+        with open(filesFrom, encoding="utf-8") as listFile:
+            paths.extend(line.strip() for line in listFile if line.strip())
+    
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, fileNames in os.walk(path):
+                files.update(os.path.join(folder, fileName) for fileName in fileNames if fileName.lower().endswith(".blend"))
+        elif os.path.isfile(path):
+            files.add(path)
+    
+    return sorted(os.path.abspath(file) for file in files)
+
+# Run the coordinator -------------------------------------------------------------------------------------------------------------
+def runCoordinator(args: argparse.Namespace) -> int:
+    """
+    Distribute files among a pool of worker processes, collect their results, and write reports.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Exit code, 0 if all files have been processed successfully.
+    """
+    
+    argumentError = _argumentError(args)
+    if argumentError:
+        print(argumentError, file=sys.stderr)
+        return 2
+    
+    files = collectFiles(args.paths, args.files_from)
+    if not files:
+        print("No .blend files found", file=sys.stderr)
+        return 2
+    
+    workerCount = max(1, min(args.workers, len(files)))
+    command = _workerCommand(args)
+    
+    pending = queue.Queue()
+    for file in files:
+        pending.put(file)
+    
+    results = []
+    resultsLock = threading.Lock()
+    started = time.perf_counter()
+    
+    def serve():
+        # Each thread owns a worker process, and feeds it from the shared queue until the queue runs dry
+        worker = _WorkerProcess(command)
+        try:
+            while True:
+                try:
+                    file = pending.get_nowait()
+                except queue.Empty:
+                    return
+                
+                result = worker.process(file)
+                _writeFileReport(args.report_dir, result)
+                
+                with resultsLock:
+                    results.append(result)
+                    print(f"[{len(results)}/{len(files)}] {result['status']}: {file}", file=sys.stderr)
+        finally:
+            worker.close()
+    
+    threads = [threading.Thread(target=serve, name=f"batchSync-{i}") for i in range(workerCount)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    results.sort(key=lambda result: result["file"])
+    report = {
+        "files": len(results),
+        "changed": sum(1 for result in results if result.get("renamed", 0) > 0),
+        "saved": sum(1 for result in results if result.get("saved")),
+        "failed": sum(1 for result in results if result["status"] == "error"),
+        "renamed": sum(result.get("renamed", 0) for result in results),
+        "dryRun": args.dry_run,
+        "workers": workerCount,
+        "seconds": round(time.perf_counter() - started, 3),
+        "results": results
+    }
+    
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as reportFile:
+            json.dump(report, reportFile, indent=1)
+    else:
+        print(json.dumps(report, indent=1))
+    
+    return 1 if report["failed"] else 0
+
+# Run a worker --------------------------------------------------------------------------------------------------------------------
+def runWorker(args: argparse.Namespace) -> int:
+    """
+    Process files received on the standard input one by one, and report results on the standard output. Must run where `bpy`
+    is available.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Exit code.
+    """
+    
+    import bpy
+    
+    print(readyMarker, flush=True)
+    
+    for line in sys.stdin:
+        file = line.strip()
+        if not file:
+            break
+        
+        started = time.perf_counter()
+        try:
+            bpy.ops.wm.open_mainfile(filepath=file, load_ui=False)
+            result = syncOpenFile(bpy, args)
+            
+            if result["renamed"] > 0 and not args.dry_run:
+                bpy.ops.wm.save_mainfile(filepath=file)
+                result["saved"] = True
+            
+            result["status"] = "changed" if result["renamed"] > 0 else "unchanged"
+        except Exception as ex:
+            result = {"status": "error", "error": str(ex)}
+        
+        result["file"] = file
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        print(resultMarker + json.dumps(result), flush=True)
+    
+    return 0
+
+# Synchronize names in the open file ----------------------------------------------------------------------------------------------
+def syncOpenFile(bpy, args: argparse.Namespace) -> dict:
+    """
+    Synchronize names in the Blender file currently open, through `syncApi.synchronize()` as `T1NKER_OT_MeshNameSynchronizer` 
+    does.
+
+    Args:
+        bpy (module): Blender's Python module.
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Raises:
+        RuntimeError: If the run has stopped on an error.
+
+    Returns:
+        dict: Summary of what has been renamed.
+    """
+    
+    syncApi = _addonModule("syncApi")
+    
+    settings = syncApi.SyncSettings(
+        prefix=args.prefix, 
+        suffix=args.suffix, 
+        nameTemplate=args.template, 
+        namePattern=args.pattern, 
+        nameReplacement=args.replacement, 
+        collisionPolicy=args.collision_policy, 
+        sharedDataPolicy=args.shared_data_policy, 
+        scope=args.scope, 
+        objectTypes=frozenset(_allowedTypes(args)), 
+        datablockKinds=frozenset(_kinds(args)), 
+        isTestOnly=args.dry_run
+    )
+    result = syncApi.synchronize(None, settings, bpy.context)
+    if result.errors:
+        raise RuntimeError("; ".join(result.errors))
+    
+    records = result.planned if args.dry_run else result.applied
+    
+    # Linked assets are common in batches, they are reported instead of failing the whole file
+    return {
+        "objects": result.stats.objectsScanned,
+        "renamed": len(records),
+        "inSync": result.inSync,
+        "collisions": result.stats.collisions,
+        "redundantWritesAvoided": result.redundantWritesAvoided,
+        "saved": False,
+        "renames": [
+            {"object": record.objectName, "type": record.idType, "from": record.nameBefore, "to": record.nameAfter}
+            for record in records
+        ],
+        "protected": [
+            {"object": item.objectName, "type": item.idType, "name": item.name, "reason": item.detail}
+            for item in result.skipped if item.reason == 'NOT_WRITABLE'
+        ],
+        "failed": [
+            {"object": item.objectName, "type": item.idType, "name": item.name, "error": item.detail}
+            for item in result.skipped if item.reason == 'WRITE_FAILED'
+        ]
+    }
+
+# Lint files ----------------------------------------------------------------------------------------------------------------------
+def runLint(args: argparse.Namespace) -> int:
+    """
+    Check names in files without Blender and without changing anything, reading the names from the files in a pool of processes,
+    and write reports.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Exit code, 0 if all files have been read and have all names in sync.
+    """
+    
+    argumentError = _argumentError(args)
+    if not argumentError and args.scope != 'FILE':
+        argumentError = "Only the whole file (--scope FILE) can be checked with --lint"
+    if not argumentError and _kinds(args) != {'DATA'}:
+        argumentError = "Only object data (--kinds DATA) can be checked with --lint"
+    if not argumentError:
+        unreadableFields = _addonModules()[2].usedFields(_namingRule(args)) & _addonModules()[3].unreadableFields
+        if unreadableFields:
+            argumentError = f"Templates with {', '.join('{' + name + '}' for name in sorted(unreadableFields))} cannot be " \
+                "checked with --lint"
+    
+    if argumentError:
+        print(argumentError, file=sys.stderr)
+        return 2
+    
+    files = collectFiles(args.paths, args.files_from)
+    if not files:
+        print("No .blend files found", file=sys.stderr)
+        return 2
+    
+    workerCount = max(1, min(args.workers, len(files)))
+    results = []
+    started = time.perf_counter()
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workerCount) as executor:
+        futures = [executor.submit(lintFile, file, args) for file in files]
+        
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            _writeFileReport(args.report_dir, result)
+            results.append(result)
+            print(f"[{len(results)}/{len(files)}] {result['status']}: {result['file']}", file=sys.stderr)
+    
+    results.sort(key=lambda result: result["file"])
+    report = {
+        "files": len(results),
+        "drifting": sum(1 for result in results if result["status"] == "drifting"),
+        "failed": sum(1 for result in results if result["status"] == "error"),
+        "outOfSync": sum(result.get("outOfSync", 0) for result in results),
+        "workers": workerCount,
+        "seconds": round(time.perf_counter() - started, 3),
+        "results": results
+    }
+    
+    if args.drifting_files:
+        with open(args.drifting_files, "w", encoding="utf-8") as listFile:
+            listFile.writelines(result["file"] + "\n" for result in results if result["status"] != "in sync")
+    
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as reportFile:
+            json.dump(report, reportFile, indent=1)
+    else:
+        print(json.dumps(report, indent=1))
+    
+    return 1 if report["drifting"] or report["failed"] else 0
+
+# Lint a file ---------------------------------------------------------------------------------------------------------------------
+def lintFile(file: str, args: argparse.Namespace) -> dict:
+    """
+    Read names from a file and check them. Runs in a process of the pool of `runLint()`.
+
+    Args:
+        file (str): Path to the .blend file.
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        dict: Summary of what is out of sync, or of the error.
+    """
+    
+    started = time.perf_counter()
+    try:
+        result = checkNames(_addonModules()[3].readNames(file), args)
+        result["status"] = "drifting" if result["outOfSync"] > 0 else "in sync"
+    except Exception as ex:
+        result = {"status": "error", "error": str(ex)}
+    
+    result["file"] = file
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+# Check names read from a file ----------------------------------------------------------------------------------------------------
+def checkNames(blendNames, args: argparse.Namespace) -> dict:
+    """
+    Plan renames for the names read from a file through `renamePlanner.planObjects()`, as runs do, without renaming anything.
+
+    Args:
+        blendNames (blendHeaders.BlendNames): The names read.
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        dict: Summary of what is out of sync. Data blocks whose name would be changed, and those whose target name is taken 
+        (if not numbered as per `--collision-policy`) are counted as out of sync.
+    """
+    
+    renamePlanner, objectScope, namingTemplate, _ = _addonModules()
+    
+    objects = objectScope.filterTypes(blendNames.objects, _allowedTypes(args))
+    targetNameFor = namingTemplate.compileRule(_namingRule(args), blendNames.objects)
+    namesByType = blendNames.namesByType()
+    plan, protected = renamePlanner.planObjects(
+        objects, targetNameFor, lambda idTypes: namesByType, ('DATA',), args.collision_policy, args.shared_data_policy
+    )
+    
+    unresolved = [candidate for candidate in plan.collisions if not candidate.finalName]
+    
+    return {
+        "version": blendNames.version,
+        "objects": plan.numberOfObjects,
+        "outOfSync": len(plan.renames) + len(unresolved),
+        "inSync": len(plan.inSync),
+        "collisions": len(plan.collisions),
+        "renames": [
+            {"object": candidate.ownerName, "type": candidate.idType, "from": candidate.currentName, "to": candidate.finalName}
+            for candidate in plan.renames
+        ],
+        "unresolved": [
+            {
+                "object": candidate.ownerName, "type": candidate.idType, "name": candidate.currentName, 
+                "taken": candidate.collidesWith
+            }
+            for candidate in unresolved
+        ],
+        "protected": [
+            {"object": candidate.ownerName, "type": candidate.idType, "name": candidate.currentName, "reason": protection}
+            for candidate, protection in protected
+        ]
+    }
+
+# Entry point ---------------------------------------------------------------------------------------------------------------------
+def main(argv: list = None) -> int:
+    """
+    Run as coordinator, or as worker if started so by the coordinator.
+
+    Args:
+        argv (list[str], optional): The command line. Defaults to `sys.argv`.
+
+    Returns:
+        int: Exit code.
+    """
+    
+    args = parseArguments(sys.argv if argv is None else argv)
+    
+    if args.worker:
+        return runWorker(args)
+    
+    return runLint(args) if args.lint else runCoordinator(args)
+
+
+# Private functions ===============================================================================================================
+
+# Import modules of the add-on ----------------------------------------------------------------------------------------------------
+def _addonModules() -> tuple:
+    """
+    Import the modules of the add-on this script needs without Blender.
+
+    Returns:
+        tuple: The `renamePlanner`, `objectScope`, `namingTemplate` and `blendHeaders` modules.
+    """
+    
+    return tuple(_addonModule(name) for name in ("renamePlanner", "objectScope", "namingTemplate", "blendHeaders"))
+
+# Import a module of the add-on ---------------------------------------------------------------------------------------------------
+def _addonModule(name: str):
+    """
+    Import a module of the add-on. When run as a script, the add-on's folder is loaded as a package without running its 
+    `__init__.py`, which would register UI classes.
+
+    Args:
+        name (str): Name of the module, such as `renamePlanner`.
+
+    Returns:
+        module: The module.
+    """
+    
+    if __package__:
+        return importlib.import_module(f".{name}", __package__)
+    
+    packageName = "t1nkrMeshNameSynchronizerBatch"
+    if packageName not in sys.modules:
+        package = types.ModuleType(packageName)
+        package.__path__ = [os.path.dirname(os.path.abspath(__file__))]
+        sys.modules[packageName] = package
+    
+    return importlib.import_module(f"{packageName}.{name}")
+
+# Check arguments -----------------------------------------------------------------------------------------------------------------
+def _argumentError(args: argparse.Namespace) -> str:
+    """
+    Tell what is wrong with the naming rule and the kinds of data specified, if anything.
+
+    Returns:
+        str: The error message, or an empty string if they are valid.
+    """
+    
+    namingError = _addonModules()[2].validationError(_namingRule(args))
+    if namingError:
+        return namingError
+    
+    unknownKinds = _kinds(args) - {kind for kind, _, _ in _addonModules()[0].datablockKinds}
+    if unknownKinds:
+        return f"Unknown kinds of data: {', '.join(sorted(unknownKinds))}"
+    
+    return ""
+
+# Get kinds of data ---------------------------------------------------------------------------------------------------------------
+def _kinds(args: argparse.Namespace) -> set:
+    """Get the kinds of data to rename specified on the command line, see `renamePlanner.datablockKinds`"""
+    return {kind.strip().upper() for kind in args.kinds.split(",") if kind.strip()}
+
+# Get object types ----------------------------------------------------------------------------------------------------------------
+def _allowedTypes(args: argparse.Namespace) -> set:
+    """Get the object types to process specified on the command line, all types if none"""
+    
+    return {objectType.strip().upper() for objectType in args.types.split(",") if objectType.strip()} \
+        or _addonModules()[1].allObjectTypes
+
+# Get the naming rule -------------------------------------------------------------------------------------------------------------
+def _namingRule(args: argparse.Namespace):
+    """
+    Get the naming rule specified on the command line.
+
+    Returns:
+        namingTemplate.NamingRule: The rule.
+    """
+    
+    return _addonModules()[2].NamingRule(
+        template=args.template, prefix=args.prefix, suffix=args.suffix, pattern=args.pattern, replacement=args.replacement
+    )
+
+# Form the command starting a worker ----------------------------------------------------------------------------------------------
+def _workerCommand(args: argparse.Namespace) -> list:
+    """
+    Form the command line starting a worker process with the same options as the coordinator.
+    """
+    
+    options = [
+        "--worker",
+        "--prefix", args.prefix,
+        "--suffix", args.suffix,
+        "--template", args.template,
+        "--pattern", args.pattern,
+        "--replacement", args.replacement,
+        "--scope", args.scope,
+        "--types", args.types,
+        "--kinds", args.kinds,
+        "--collision-policy", args.collision_policy,
+        "--shared-data-policy", args.shared_data_policy
+    ]
+    if args.dry_run:
+        options.append("--dry-run")
+    
+    script = os.path.abspath(__file__)
+    blender = args.blender
+    
+    if not blender:
+        if "bpy" in sys.modules and sys.modules["bpy"].app.binary_path:
+            # Running in Blender, start workers with the same Blender
+            blender = sys.modules["bpy"].app.binary_path
+        elif importlib.util.find_spec("bpy") is not None:
+            # The bpy module is available in this interpreter, no need for a Blender executable
+            return [sys.executable, script, *options]
+        else:
+            blender = "blender"
+    
+    return [blender, "-b", "--factory-startup", "--python", script, "--", *options]
+
+# Write the report of a file ------------------------------------------------------------------------------------------------------
+def _writeFileReport(reportDir: str, result: dict):
+    """
+    Write the JSON summary of a file into the report folder, if one is specified.
+    """
+    
+    if not reportDir:
+        return
+    
+    os.makedirs(reportDir, exist_ok=True)
+    
+    # Flatten the path to avoid collisions of files having the same name in different folders
+    reportName = result["file"].replace(":", "").replace("\\", "/").strip("/").replace("/", "__") + ".json"
+    with open(os.path.join(reportDir, reportName), "w", encoding="utf-8") as reportFile:
+        json.dump(result, reportFile, indent=1)
+
+
+# A worker process ################################################################################################################
+class _WorkerProcess:
+    """
+    A background Blender (or Python with `bpy`) process processing files sent to it one by one. The process is restarted if it
+    dies, such as when Blender crashes on a corrupt file.
+    """
+    
+    def __init__(self, command: list):
+        self.command = command
+        """The command line starting the process"""
+        
+        self.handle: subprocess.Popen = None
+        """The running process, if any"""
+    
+    # Process a file --------------------------------------------------------------------------------------------------------------
+    def process(self, file: str) -> dict:
+        """
+        Send a file to the worker and wait for the result.
+
+        Args:
+            file (str): Path to the .blend file.
+
+        Returns:
+            dict: The result reported by the worker, or an error result if the worker died.
+        """
+        
+        try:
+            if self.handle is None or self.handle.poll() is not None:
+                self._start()
+            
+            self.handle.stdin.write(file + "\n")
+            self.handle.stdin.flush()
+            
+            for line in self.handle.stdout:
+                if line.startswith(resultMarker):
+                    return json.loads(line[len(resultMarker):])
+            
+            error = f"Worker exited with code {self.handle.wait()}"
+        except Exception as ex:
+            error = f"Worker failed: {ex}"
+        
+        self.close()
+        return {"file": file, "status": "error", "error": error}
+    
+    # Stop the worker -------------------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Ask the worker to quit, and make sure it does.
+        """
+        
+        if self.handle is None:
+            return
+        
+        try:
+            if self.handle.poll() is None:
+                self.handle.stdin.write("\n")
+                self.handle.stdin.flush()
+                self.handle.stdin.close()
+                self.handle.wait(timeout=30)
+        except Exception:
+            self.handle.kill()
+        
+        self.handle = None
+    
+    # Start the worker ------------------------------------------------------------------------------------------------------------
+    def _start(self):
+        """
+        Start the worker process and wait until it's ready.
+        """
+        
+        self.handle = subprocess.Popen(
+            self.command, 
+            stdin=subprocess.PIPE, 
+            stdout=subprocess.PIPE, 
+            stderr=subprocess.DEVNULL, 
+            text=True, 
+            encoding="utf-8", 
+            bufsize=1
+        )
+        
+        for line in self.handle.stdout:
+            if line.strip() == readyMarker:
+                return
+        
+        raise RuntimeError(f"Worker exited with code {self.handle.wait()} before becoming ready")
+
+
+# Entry point #####################################################################################################################
+
+if __name__ == "__main__":
+    sys.exit(main())
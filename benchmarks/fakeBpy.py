@@ -0,0 +1,588 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is a lightweight stand-in for the parts of Blender's bpy module the add-on uses, to run benchmarks without Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+#
+# Only what the add-on touches is provided, and behavior is modeled closely enough to make measurements meaningful. For
+# example, datablock names are unique per type, and taking a name already in use results in a numbered variant, as in
+# Blender. Name writes are counted in `stats`.
+#
+# *********************************************************************************************************************************
+
+from __future__ import annotations
+import itertools
+import os
+import sys
+import types
+
+
+# Statistics ######################################################################################################################
+class Stats:
+    """
+    Counters of operations performed on the stand-in.
+    """
+    
+    def __init__(self):
+        self.nameWrites = 0
+        """Number of times a datablock name has been set"""
+        
+        self.undoPushes = 0
+        """Number of undo steps pushed"""
+    
+    def reset(self):
+        """Reset all counters"""
+        self.__init__()
+
+stats = Stats()
+"""Counters of operations performed on the stand-in"""
+
+_pointers = itertools.count(0x10000, 0x100)
+"""Fake memory addresses of datablocks"""
+
+
+# Datablocks ######################################################################################################################
+class ID:
+    """
+    Stand-in for `bpy.types.ID`.
+    """
+    
+    __slots__ = ("_name", "_collection", "_pointer", "id_type", "library", "override_library", "session_uid", "users", 
+                 "is_embedded_data", "is_missing", "__weakref__")
+    
+    def __init__(self, collection: IDCollection, name: str, idType: str):
+        self._collection = collection
+        self._pointer = next(_pointers)
+        self._name = None
+        self.id_type = idType
+        self.library = None
+        self.override_library = None
+        self.session_uid = self._pointer >> 8
+        self.users = 0
+        self.is_embedded_data = False
+        self.is_missing = False
+        collection._add(self, name)
+    
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    @name.setter
+    def name(self, value: str):
+        if self.library is not None:
+            raise AttributeError(f'bpy_struct: attribute "name" from "{type(self).__name__}" is read-only')
+        stats.nameWrites += 1
+        self._collection._rename(self, value)
+    
+    @property
+    def name_full(self) -> str:
+        return self._name
+    
+    @property
+    def original(self) -> ID:
+        return self
+    
+    def as_pointer(self) -> int:
+        return self._pointer
+    
+    def __repr__(self):
+        return f"<{type(self).__name__} '{self._name}'>"
+
+
+class Mesh(ID):
+    """Stand-in for `bpy.types.Mesh`"""
+    __slots__ = ("materials",)
+    
+    def __init__(self, collection, name):
+        super().__init__(collection, name, 'MESH')
+        self.materials = []
+
+
+class Material(ID):
+    """Stand-in for `bpy.types.Material`"""
+    __slots__ = ()
+    
+    def __init__(self, collection, name):
+        super().__init__(collection, name, 'MATERIAL')
+
+
+class Action(ID):
+    """Stand-in for `bpy.types.Action`"""
+    __slots__ = ()
+    
+    def __init__(self, collection, name):
+        super().__init__(collection, name, 'ACTION')
+
+
+class Armature(ID):
+    """Stand-in for `bpy.types.Armature`"""
+    __slots__ = ()
+    
+    def __init__(self, collection, name):
+        super().__init__(collection, name, 'ARMATURE')
+
+
+class Object(ID):
+    """Stand-in for `bpy.types.Object`"""
+    
+    __slots__ = ("_data", "type", "parent", "instance_type", "instance_collection", "animation_data", "material_slots", 
+                 "modifiers", "users_collection")
+    
+    def __init__(self, collection, name, data):
+        super().__init__(collection, name, 'OBJECT')
+        self._data = None
+        self.data = data
+        self.type = 'EMPTY' if data is None else data.id_type
+        self.parent = None
+        self.instance_type = 'NONE'
+        self.instance_collection = None
+        self.animation_data = None
+        self.material_slots = []
+        self.modifiers = []
+        self.users_collection = []
+    
+    @property
+    def data(self):
+        return self._data
+    
+    @data.setter
+    def data(self, value):
+        if self._data is not None:
+            self._data.users -= 1
+        self._data = value
+        if value is not None:
+            value.users += 1
+    
+    @property
+    def children(self) -> tuple:
+        return tuple(obj for obj in self._collection if obj.parent is self)
+    
+    def find_armature(self):
+        return None
+
+
+class Collection(ID):
+    """Stand-in for `bpy.types.Collection`"""
+    
+    __slots__ = ("objects", "children")
+    
+    def __init__(self, collection, name):
+        super().__init__(collection, name, 'COLLECTION')
+        self.objects = CollectionObjects(self)
+        self.children = CollectionChildren()
+
+
+class CollectionObjects(list):
+    """Stand-in for `bpy.types.CollectionObjects`"""
+    
+    def __init__(self, owner: Collection):
+        super().__init__()
+        self.owner = owner
+    
+    def link(self, obj: Object):
+        self.append(obj)
+        obj.users_collection.append(self.owner)
+
+
+class CollectionChildren(list):
+    """Stand-in for `bpy.types.CollectionChildren`"""
+    
+    def link(self, collection: Collection):
+        self.append(collection)
+
+
+# Collections of datablocks #######################################################################################################
+class IDCollection:
+    """
+    Stand-in for `bpy.types.BlendData*` collections, such as `bpy.data.meshes`. Names are unique within a collection.
+    """
+    
+    def __init__(self, idClass: type):
+        self._idClass = idClass
+        self._byName = {}
+    
+    def new(self, name: str, *args) -> ID:
+        return self._idClass(self, name, *args)
+    
+    def remove(self, datablock: ID):
+        del self._byName[datablock._name]
+    
+    def keys(self) -> list:
+        return list(self._byName.keys())
+    
+    def get(self, name: str, default=None):
+        return self._byName.get(name, default)
+    
+    def clear(self):
+        self._byName.clear()
+    
+    def __getitem__(self, name: str) -> ID:
+        return self._byName[name]
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._byName
+    
+    def __iter__(self):
+        return iter(list(self._byName.values()))
+    
+    def __len__(self) -> int:
+        return len(self._byName)
+    
+    # Give a unique name to a datablock -------------------------------------------------------------------------------------------
+    def _uniqueName(self, name: str, datablock: ID) -> str:
+        """
+        Find the name Blender would give, that is, the name itself if free, otherwise the first free numbered variant.
+        """
+        
+        name = name.encode("utf-8")[:63].decode("utf-8", errors="ignore")
+        holder = self._byName.get(name)
+        if holder is None or holder is datablock:
+            return name
+        
+        number = 1
+        while True:
+            suffix = f".{number:03d}"
+            candidate = name.encode("utf-8")[:63 - len(suffix)].decode("utf-8", errors="ignore") + suffix
+            if candidate not in self._byName:
+                return candidate
+            number += 1
+    
+    def _add(self, datablock: ID, name: str):
+        name = self._uniqueName(name, datablock)
+        datablock._name = name
+        self._byName[name] = datablock
+    
+    def _rename(self, datablock: ID, name: str):
+        name = self._uniqueName(name, datablock)
+        del self._byName[datablock._name]
+        datablock._name = name
+        self._byName[name] = datablock
+
+
+class BlendData:
+    """
+    Stand-in for `bpy.types.BlendData`, that is, `bpy.data`.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Forget all datablocks"""
+        self.meshes = IDCollection(Mesh)
+        self.materials = IDCollection(Material)
+        self.actions = IDCollection(Action)
+        self.armatures = IDCollection(Armature)
+        self.objects = IDCollection(Object)
+        self.collections = IDCollection(Collection)
+        self.scenes = IDCollection(Scene)
+        self.filepath = ""
+
+
+class Scene(ID):
+    """Stand-in for `bpy.types.Scene`"""
+    
+    __slots__ = ("collection", "_properties", "__dict__")
+    
+    def __init__(self, collection, name):
+        super().__init__(collection, name, 'SCENE')
+        self.collection = Collection(IDCollection(Collection), "Scene Collection")
+        self._properties = {}
+    
+    def __getitem__(self, key):
+        return self._properties[key]
+    
+    def __setitem__(self, key, value):
+        self._properties[key] = value
+    
+    def get(self, key, default=None):
+        return self._properties.get(key, default)
+
+
+class ViewLayer:
+    """Stand-in for `bpy.types.ViewLayer`"""
+    
+    def __init__(self, scene: Scene):
+        self._scene = scene
+    
+    @property
+    def objects(self) -> list:
+        seen = set()
+        result = []
+        stack = [self._scene.collection]
+        while stack:
+            collection = stack.pop()
+            for obj in collection.objects:
+                if obj.as_pointer() not in seen:
+                    seen.add(obj.as_pointer())
+                    result.append(obj)
+            stack.extend(collection.children)
+        return result
+
+
+class Context:
+    """Stand-in for `bpy.types.Context`"""
+    
+    def __init__(self):
+        self.blend_data = data
+        self.scene = None
+        self.view_layer = None
+        self.collection = None
+        self.selected_ids = []
+        self.selected_objects = []
+        self.window_manager = types.SimpleNamespace(
+            progress_begin=lambda *args: None, 
+            progress_update=lambda *args: None, 
+            progress_end=lambda *args: None,
+            # Key configurations are not available in background mode
+            keyconfigs=types.SimpleNamespace(addon=None)
+        )
+        self.preferences = types.SimpleNamespace(addons={})
+        self.window = None
+
+
+# Blender types and properties ####################################################################################################
+
+class bpy_struct:
+    """Stand-in for `bpy.types.bpy_struct`"""
+    
+    def __init__(self):
+        # Initialize properties declared as annotations with their defaults
+        for klass in reversed(type(self).__mro__):
+            for name, value in getattr(klass, "__annotations__", {}).items():
+                # Annotations are strings in modules using `from __future__ import annotations`, Blender evaluates them
+                if isinstance(value, str):
+                    try:
+                        value = eval(value, vars(sys.modules[klass.__module__]))
+                    except Exception:
+                        continue
+                
+                if isinstance(value, _Property):
+                    setattr(self, name, value.default())
+
+
+class Operator(bpy_struct):
+    """Stand-in for `bpy.types.Operator`"""
+    
+    def __init__(self, *args, **kwargs):
+        bpy_struct.__init__(self)
+        self.reports = []
+        self.layout = None
+    
+    def report(self, kind, message):
+        # Operators of the add-on define their own `__init__()` without calling this one
+        self.__dict__.setdefault("reports", []).append((set(kind), message))
+
+
+class PropertyGroup(bpy_struct):
+    """Stand-in for `bpy.types.PropertyGroup`"""
+
+
+class AddonPreferences(bpy_struct):
+    """Stand-in for `bpy.types.AddonPreferences`"""
+
+
+class _Property:
+    """A property declared with one of the `bpy.props` functions"""
+    
+    def __init__(self, kind: str, **options):
+        self.kind = kind
+        self.options = options
+    
+    def default(self):
+        if "default" in self.options:
+            value = self.options["default"]
+            return set(value) if isinstance(value, (set, frozenset)) else value
+        if self.kind == "PointerProperty":
+            return self.options["type"]()
+        if self.kind == "CollectionProperty":
+            return []
+        return {"StringProperty": "", "BoolProperty": False, "IntProperty": 0, "FloatProperty": 0.0}.get(self.kind)
+
+
+class _Menu:
+    """Stand-in for menus, such as `bpy.types.OUTLINER_MT_context_menu`, which items can be added to"""
+    
+    def __init_subclass__(cls):
+        cls.items = []
+    
+    @classmethod
+    def append(cls, function):
+        cls.items.append(function)
+    
+    @classmethod
+    def remove(cls, function):
+        cls.items.remove(function)
+
+
+def _propertyFunction(kind: str):
+    return lambda **options: _Property(kind, **options)
+
+
+def _persistent(function):
+    function._bpy_persistent = True
+    return function
+
+
+class _Timers:
+    """Stand-in for `bpy.app.timers`. Timers run only when `runTimers()` is called."""
+    
+    def __init__(self):
+        self.registered = {}
+    
+    def register(self, function, first_interval=0.0, persistent=False):
+        self.registered[function] = first_interval
+    
+    def unregister(self, function):
+        del self.registered[function]
+    
+    def is_registered(self, function) -> bool:
+        return function in self.registered
+    
+    def runTimers(self):
+        """Run due timers once, as Blender's event loop would"""
+        for function in list(self.registered):
+            interval = function()
+            if interval is None:
+                self.registered.pop(function, None)
+            else:
+                self.registered[function] = interval
+
+
+# Module assembly #################################################################################################################
+
+data = BlendData()
+"""Stand-in for `bpy.data`"""
+
+context = Context()
+"""Stand-in for `bpy.context`"""
+
+
+# Build a fresh file --------------------------------------------------------------------------------------------------------------
+def newFile() -> Scene:
+    """
+    Forget all datablocks, and make a file with a single scene which is active in the context.
+
+    Returns:
+        Scene: The scene.
+    """
+    
+    data.reset()
+    stats.reset()
+    
+    scene = data.scenes.new("Scene")
+    context.blend_data = data
+    context.scene = scene
+    context.view_layer = ViewLayer(scene)
+    context.collection = scene.collection
+    context.selected_ids = []
+    context.selected_objects = []
+    
+    return scene
+
+# Install the stand-in ------------------------------------------------------------------------------------------------------------
+def install() -> types.ModuleType:
+    """
+    Install the stand-in as the `bpy` module, unless a real `bpy` module is already imported.
+
+    Returns:
+        types.ModuleType: The `bpy` module.
+    """
+    
+    if "bpy" in sys.modules:
+        return sys.modules["bpy"]
+    
+    bpy = types.ModuleType("bpy")
+    bpy.isStandIn = True
+    bpy.data = data
+    bpy.context = context
+    
+    bpy.types = types.ModuleType("bpy.types")
+    for klass in (ID, Mesh, Material, Action, Armature, Object, Collection, Scene, ViewLayer, Context, Operator, 
+                  PropertyGroup, AddonPreferences, bpy_struct):
+        setattr(bpy.types, klass.__name__, klass)
+    for name in ("Panel", "Menu", "UIList"):
+        setattr(bpy.types, name, type(name, (bpy_struct,), {}))
+    for name in ("OUTLINER_MT_context_menu", "OUTLINER_MT_object", "OUTLINER_MT_edit_datablocks"):
+        setattr(bpy.types, name, type(name, (_Menu,), {}))
+    
+    bpy.props = types.ModuleType("bpy.props")
+    for kind in ("StringProperty", "BoolProperty", "IntProperty", "FloatProperty", "EnumProperty", "PointerProperty",
+                 "CollectionProperty"):
+        setattr(bpy.props, kind, _propertyFunction(kind))
+    
+    bpy.app = types.ModuleType("bpy.app")
+    bpy.app.binary_path = ""
+    bpy.app.version = (4, 2, 0)
+    bpy.app.background = True
+    bpy.app.timers = _Timers()
+    bpy.app.handlers = types.ModuleType("bpy.app.handlers")
+    bpy.app.handlers.persistent = _persistent
+    for name in ("depsgraph_update_post", "load_post", "undo_post", "redo_post", "save_pre"):
+        setattr(bpy.app.handlers, name, [])
+    
+    bpy.utils = types.ModuleType("bpy.utils")
+    bpy.utils.register_class = lambda klass: None
+    bpy.utils.unregister_class = lambda klass: None
+    bpy.utils.user_resource = lambda kind, path="", create=False: os.path.join(os.path.expanduser("~"), ".config", "blender", path)
+    
+    bpy.path = types.ModuleType("bpy.path")
+    bpy.path.abspath = lambda path: os.path.abspath(path[2:] if path.startswith("//") else path)
+    
+    def undoPush(message=""):
+        stats.undoPushes += 1
+        return {'FINISHED'}
+    
+    bpy.ops = types.SimpleNamespace(ed=types.SimpleNamespace(undo_push=undoPush))
+    
+    for name, module in (("bpy", bpy), ("bpy.types", bpy.types), ("bpy.props", bpy.props), ("bpy.app", bpy.app), 
+                         ("bpy.app.handlers", bpy.app.handlers), ("bpy.utils", bpy.utils), ("bpy.path", bpy.path)):
+        sys.modules[name] = module
+    
+    newFile()
+    
+    return bpy
@@ -0,0 +1,521 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for checking the names-only lint of .blend files on synthetic files written without Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+#
+# USAGE ***************************************************************************************************************************
+#
+#   python benchmarks/lintBenchmark.py [--files 200] [--objects 100] [--geometry-bytes 4096]
+#
+# Writes synthetic .blend files (holding objects, meshes with dummy geometry, linked meshes and the description of structures) in
+# each layout `blendHeaders` supports, checks that the names are read back as written, then runs `batchSync.py --lint` on a
+# library of such files, some with names out of sync, and checks its exit code, report and list of drifting files. Each scenario
+# is reported as passed or failed, and the exit code is non-zero if any failed. Neither Blender nor `bpy` is needed.
+#
+# *********************************************************************************************************************************
+
+from __future__ import annotations
+import argparse
+import gzip
+import importlib.util
+import json
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from runBenchmarks import addonDir, addonModule
+
+
+# Writer of synthetic .blend files ################################################################################################
+class BlendWriter:
+    """
+    Writes .blend files with objects and meshes only, in the layout of the file header and blocks used by Blender, and with a
+    minimal description of structures (SDNA) having the members read by `blendHeaders` among others.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, pointerSize: int = 8, byteOrder: str = "<", largeHeads: bool = False, nameSize: int = 66, 
+                 withOverrides: bool = True, compression: str = ""):
+        self.pointerSize = pointerSize
+        self.byteOrder = byteOrder
+        self.largeHeads = largeHeads
+        self.nameSize = nameSize
+        self.withOverrides = withOverrides
+        self.compression = compression
+        
+        idMembers = [("void", "*next"), ("void", "*prev"), ("ID", "*newid"), ("Library", "*lib")]
+        if withOverrides:
+            idMembers.append(("void", "*override_library"))
+        idMembers += [("char", f"name[{nameSize}]"), ("short", "flag"), ("short", "_pad"), ("int", "us")]
+        
+        self.structs = {
+            "ID": idMembers,
+            "Library": [("ID", "id"), ("char", "filepath[1024]")],
+            "Object": [("ID", "id"), ("void", "*adt"), ("short", "type"), ("short", "partype"), ("Object", "*parent"), 
+                       ("void", "(*drawfunc)()"), ("void", "*data"), ("float", "loc[3]"), ("float", "obmat[4][4]")],
+            "Mesh": [("ID", "id"), ("void", "*adt"), ("int", "totvert"), ("int", "_pad")]
+        }
+        self.typeNames = ["char", "short", "int", "float", "void", *self.structs]
+        self.typeSizes = {"char": 1, "short": 2, "int": 4, "float": 4, "void": 0}
+        
+        self.layouts = {}
+        for structName, members in self.structs.items():
+            offsets = {}
+            offset = 0
+            for typeName, name in members:
+                offsets[name] = offset
+                offset += self._sizeOf(typeName, name)
+            self.layouts[structName] = offsets
+            self.typeSizes[structName] = offset
+    
+    # Public functions ============================================================================================================
+    
+    # Write a file ----------------------------------------------------------------------------------------------------------------
+    def write(self, path: str, objects: list, meshes: list, libraries: list = (), geometryBytes: int = 0):
+        """
+        Write a file.
+
+        Args:
+            path (str): Path to the file.
+            objects (list[dict]): Objects with `name`, `address`, `type` (as stored), `data` and `parent` (addresses, 0 for 
+                none) and `override` (`True` for library overrides).
+            meshes (list[dict]): Meshes with `name`, `address` and `library` (address of the library, 0 if local). Linked 
+                meshes are written as placeholders.
+            libraries (list[dict], optional): Libraries with `name` and `address`.
+            geometryBytes (int, optional): Size of a block of dummy geometry written after each local mesh.
+        """
+        
+        if self.largeHeads:
+            header = b"BLENDER17-01" + (b"v" if self.byteOrder == "<" else b"V") + b"0500"
+        else:
+            header = b"BLENDER" + (b"-" if self.pointerSize == 8 else b"_") + (b"v" if self.byteOrder == "<" else b"V") + b"402"
+        
+        blocks = [header]
+        
+        for library in libraries:
+            blocks.append(self._block(b"LI\0\0", "Library", library["address"], {"id": ("LI", library["name"], 0, 0)}))
+        
+        for obj in objects:
+            blocks.append(self._block(b"OB\0\0", "Object", obj["address"], {
+                "id": ("OB", obj["name"], 0, 1 if obj.get("override") else 0),
+                "type": obj["type"], 
+                "*parent": obj["parent"], 
+                "*data": obj["data"]
+            }))
+        
+        for mesh in meshes:
+            if mesh.get("library"):
+                blocks.append(self._block(b"ID\0\0", "ID", mesh["address"], {"": ("ME", mesh["name"], mesh["library"], 0)}))
+                continue
+            
+            blocks.append(self._block(b"ME\0\0", "Mesh", mesh["address"], {"id": ("ME", mesh["name"], 0, 0)}))
+            if geometryBytes:
+                blocks.append(self._head(b"DATA", geometryBytes, mesh["address"] + 8, 0) + bytes(geometryBytes))
+        
+        sdna = self._sdna()
+        blocks.append(self._head(b"DNA1", len(sdna), 0, 0) + sdna)
+        blocks.append(self._head(b"ENDB", 0, 0, 0))
+        
+        data = b"".join(blocks)
+        
+        if self.compression == "gzip":
+            data = gzip.compress(data, compresslevel=1)
+        elif self.compression == "zstd":
+            import zstandard
+            data = zstandard.ZstdCompressor().compress(data)
+        
+        with open(path, "wb") as blendFile:
+            blendFile.write(data)
+    
+    # Private functions ===========================================================================================================
+    
+    # Get size of a member --------------------------------------------------------------------------------------------------------
+    def _sizeOf(self, typeName: str, name: str) -> int:
+        size = self.pointerSize if name[0] in "*(" else self.typeSizes[typeName]
+        for dimension in name.replace("]", "").split("[")[1:]:
+            size *= int(dimension)
+        return size
+    
+    # Make a block header ---------------------------------------------------------------------------------------------------------
+    def _head(self, code: bytes, length: int, address: int, sdnaIndex: int) -> bytes:
+        if self.largeHeads:
+            return struct.pack(self.byteOrder + "4siQqq", code, sdnaIndex, address, length, 1)
+        
+        return struct.pack(self.byteOrder + ("4siQii" if self.pointerSize == 8 else "4siIii"), code, length, address, sdnaIndex, 1)
+    
+    # Make a block of an ID -------------------------------------------------------------------------------------------------------
+    def _block(self, code: bytes, structName: str, address: int, values: dict) -> bytes:
+        pointer = self.byteOrder + ("Q" if self.pointerSize == 8 else "I")
+        layout = self.layouts[structName]
+        body = bytearray(self.typeSizes[structName])
+        
+        for member, value in values.items():
+            if member in ("id", ""):
+                # The ID, as a tuple of the ID code, the name, the address of the library and the override flag
+                base = layout["id"] if member == "id" else 0
+                idLayout = self.layouts["ID"]
+                idCode, name, library, override = value
+                
+                storedName = (idCode + name).encode("utf-8")[:self.nameSize - 1]
+                nameOffset = base + idLayout[f"name[{self.nameSize}]"]
+                body[nameOffset:nameOffset + len(storedName)] = storedName
+                struct.pack_into(pointer, body, base + idLayout["*lib"], library)
+                if self.withOverrides:
+                    struct.pack_into(pointer, body, base + idLayout["*override_library"], override)
+            elif member.startswith("*"):
+                struct.pack_into(pointer, body, layout[member], value)
+            else:
+                struct.pack_into(self.byteOrder + "h", body, layout[member], value)
+        
+        return self._head(code, len(body), address, list(self.structs).index(structName)) + bytes(body)
+    
+    # Make the description of structures ------------------------------------------------------------------------------------------
+    def _sdna(self) -> bytes:
+        names = []
+        for members in self.structs.values():
+            names.extend(name for _, name in members if name not in names)
+        
+        def strings(tag: bytes, items: list) -> bytes:
+            data = tag + struct.pack(self.byteOrder + "i", len(items)) + b"".join(item.encode("ascii") + b"\0" for item in items)
+            return data + bytes(-len(data) % 4)
+        
+        data = b"SDNA" + strings(b"NAME", names) + strings(b"TYPE", self.typeNames)
+        
+        sizes = b"TLEN" + struct.pack(f"{self.byteOrder}{len(self.typeNames)}H", *(self.typeSizes[t] for t in self.typeNames))
+        data += sizes + bytes(-len(sizes) % 4)
+        
+        data += b"STRC" + struct.pack(self.byteOrder + "i", len(self.structs))
+        for structName, members in self.structs.items():
+            data += struct.pack(self.byteOrder + "hh", self.typeNames.index(structName), len(members))
+            for typeName, name in members:
+                data += struct.pack(self.byteOrder + "hh", self.typeNames.index(typeName), names.index(name))
+        
+        return data
+
+
+# Contents of synthetic files #####################################################################################################
+
+# Make the contents of a file -----------------------------------------------------------------------------------------------------
+def makeContents(objectCount: int, drifting: int = 0, linked: int = 0) -> tuple:
+    """
+    Make objects and meshes named in sync, except for some.
+
+    Args:
+        objectCount (int): Number of mesh objects. Every tenth is parented to the previous object.
+        drifting (int, optional): Number of meshes to name out of sync. Defaults to none.
+        linked (int, optional): Number of objects to use meshes linked from a library, named out of sync. Defaults to none.
+
+    Returns:
+        tuple: Objects, meshes and libraries to pass to `BlendWriter.write()`.
+    """
+    
+    objects = []
+    meshes = []
+    libraries = [{"name": "library.blend", "address": 0x9000}]
+    
+    for index in range(objectCount):
+        objectAddress = 0x100000 + index * 0x100
+        meshAddress = 0x800000 + index * 0x100
+        name = f"Asset{index:05d}"
+        isLinked = index < linked
+        
+        objects.append({
+            "name": name, "address": objectAddress, "type": 1, "data": meshAddress, 
+            "parent": objectAddress - 0x100 if index % 10 == 9 else 0
+        })
+        meshes.append({
+            "name": f"Mesh{index:05d}" if isLinked or index >= objectCount - drifting else name, 
+            "address": meshAddress, 
+            "library": libraries[0]["address"] if isLinked else 0
+        })
+    
+    return objects, meshes, libraries
+
+
+# Scenarios #######################################################################################################################
+class Scenarios:
+    """
+    Checks of reading names and of linting libraries of files, in a temporary folder.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, folder: str, args: argparse.Namespace):
+        self.folder = folder
+        self.args = args
+        self.failures = []
+        self.blendHeaders = addonModule("blendHeaders")
+    
+    # Public functions ============================================================================================================
+    
+    # Run all scenarios -----------------------------------------------------------------------------------------------------------
+    def run(self) -> list:
+        """
+        Run all scenarios.
+
+        Returns:
+            list[str]: Descriptions of failed expectations.
+        """
+        
+        for scenario in (self.layouts, self.zstd, self.errors, self.lint, self.lintInSync, self.lintRefused):
+            failuresBefore = len(self.failures)
+            started = time.perf_counter()
+            outcome = scenario()
+            seconds = time.perf_counter() - started
+            outcome = outcome or ("PASS" if len(self.failures) == failuresBefore else "FAIL")
+            print(f"{outcome} {scenario.__name__} ({seconds:.2f} s)", file=sys.stderr)
+        
+        return self.failures
+    
+    # Scenarios ===================================================================================================================
+    
+    # Read each layout ------------------------------------------------------------------------------------------------------------
+    def layouts(self):
+        """Names are read back as written, whatever the pointer size, byte order, header format and compression"""
+        
+        variants = {
+            "64-bit": BlendWriter(),
+            "32-bit big-endian without overrides": BlendWriter(pointerSize=4, byteOrder=">", withOverrides=False),
+            "large headers and long names": BlendWriter(largeHeads=True, nameSize=258),
+            "gzip": BlendWriter(compression="gzip")
+        }
+        
+        for variant, writer in variants.items():
+            self._checkRoundTrip(variant, writer)
+    
+    # Read files compressed with Zstandard ----------------------------------------------------------------------------------------
+    def zstd(self):
+        """Files compressed with Zstandard are read if a library to decompress them is available"""
+        
+        if importlib.util.find_spec("zstandard") is None:
+            return "SKIP"
+        
+        self._checkRoundTrip("zstd", BlendWriter(compression="zstd"))
+    
+    # Reject other files ----------------------------------------------------------------------------------------------------------
+    def errors(self):
+        """Files which are not .blend files, or are truncated, are rejected with an error"""
+        
+        path = os.path.join(self.folder, "errors.blend")
+        
+        with open(path, "wb") as blendFile:
+            blendFile.write(b"Not a blend file")
+        self._expectError(path, "not a .blend file")
+        
+        BlendWriter().write(path, *makeContents(3), geometryBytes=64)
+        with open(path, "rb") as blendFile:
+            data = blendFile.read()
+        with open(path, "wb") as blendFile:
+            blendFile.write(data[:len(data) // 2])
+        self._expectError(path, "truncated")
+    
+    # Lint a library --------------------------------------------------------------------------------------------------------------
+    def lint(self):
+        """Drifting files are found, reported and listed, and the exit code tells so"""
+        
+        library = os.path.join(self.folder, "library")
+        os.makedirs(library)
+        
+        expected = set()
+        writer = BlendWriter()
+        for index in range(self.args.files):
+            path = os.path.join(library, f"asset{index:05d}.blend")
+            drifting = 2 if index % 5 == 0 else 0
+            writer.write(path, *makeContents(self.args.objects, drifting=drifting, linked=3), 
+                         geometryBytes=self.args.geometry_bytes)
+            if drifting:
+                expected.add(path)
+        
+        brokenPath = os.path.join(library, "broken.blend")
+        with open(brokenPath, "wb") as blendFile:
+            blendFile.write(b"BLENDER-v402")
+        expected.add(brokenPath)
+        
+        process, report, listed = self._runLint([library])
+        
+        self._expect(process.returncode == 1, f"exit code is 1 on drift, got {process.returncode}")
+        self._expect(listed == expected, f"{len(expected)} files listed as drifting or failed, got {len(listed)}")
+        
+        if report is None:
+            return
+        
+        drifting = [result for result in report["results"] if result["status"] == "drifting"]
+        self._expect(report["failed"] == 1, f"1 file failed, got {report['failed']}")
+        self._expect(report["outOfSync"] == 2 * len(drifting), f"2 names out of sync per drifting file, got {report['outOfSync']}")
+        self._expect(all(len(result["protected"]) == 3 for result in drifting), "linked meshes are reported as protected")
+        self._expect(all(result["renames"][0]["to"] == result["renames"][0]["object"] for result in drifting), 
+                     "renames are to the name of the object")
+        
+        megabytes = sum(os.path.getsize(os.path.join(library, name)) for name in os.listdir(library)) / 2 ** 20
+        print(f"  {report['files']} files, {megabytes:.1f} MiB in {report['seconds']:.2f} s with {report['workers']} workers", 
+              file=sys.stderr)
+    
+    # Lint files in sync ----------------------------------------------------------------------------------------------------------
+    def lintInSync(self):
+        """Files in sync pass"""
+        
+        library = os.path.join(self.folder, "library")
+        paths = [os.path.join(library, f"asset{index:05d}.blend") for index in range(1, self.args.files) if index % 5]
+        
+        filesFrom = os.path.join(self.folder, "inSync.txt")
+        with open(filesFrom, "w", encoding="utf-8") as listFile:
+            listFile.writelines(path + "\n" for path in paths)
+        
+        process, report, listed = self._runLint(["--files-from", filesFrom])
+        
+        self._expect(process.returncode == 0, f"exit code is 0 if all is in sync, got {process.returncode}")
+        self._expect(not listed, f"no files listed as drifting, got {len(listed)}")
+    
+    # Refuse what cannot be checked -----------------------------------------------------------------------------------------------
+    def lintRefused(self):
+        """Templates with fields that cannot be computed from the names read are refused"""
+        
+        process, _, _ = self._runLint(["--template", "{collection}_{object}", os.path.join(self.folder, "library")])
+        self._expect(process.returncode == 2, f"exit code is 2 for {{collection}}, got {process.returncode}")
+    
+    # Private functions ===========================================================================================================
+    
+    # Write and read back a file --------------------------------------------------------------------------------------------------
+    def _checkRoundTrip(self, variant: str, writer: BlendWriter):
+        path = os.path.join(self.folder, "roundTrip.blend")
+        objects, meshes, libraries = makeContents(20, drifting=2, linked=2)
+        objects[5]["override"] = True
+        writer.write(path, objects, meshes, libraries, geometryBytes=1000)
+        
+        names = self.blendHeaders.readNames(path)
+        
+        self._expect([obj.name for obj in names.objects] == [obj["name"] for obj in objects], f"{variant}: object names")
+        self._expect(all(obj.type == 'MESH' for obj in names.objects), f"{variant}: object types")
+        self._expect([obj.data.name for obj in names.objects] == [mesh["name"] for mesh in meshes], f"{variant}: data names")
+        self._expect(names.objects[9].parent is names.objects[8] and names.objects[8].children == [names.objects[9]], 
+                     f"{variant}: parents")
+        self._expect([obj.data.library for obj in names.objects[:3]] == ["library.blend", "library.blend", None], 
+                     f"{variant}: libraries")
+        self._expect(names.objects[5].override_library is (True if writer.withOverrides else None), f"{variant}: overrides")
+        self._expect(names.version == ("5.0" if writer.largeHeads else "4.2"), f"{variant}: version")
+    
+    # Expect an error -------------------------------------------------------------------------------------------------------------
+    def _expectError(self, path: str, message: str):
+        try:
+            self.blendHeaders.readNames(path)
+            self._expect(False, f"error '{message}' raised")
+        except ValueError as ex:
+            self._expect(message in str(ex), f"error '{message}' raised, got '{ex}'")
+    
+    # Run the lint ----------------------------------------------------------------------------------------------------------------
+    def _runLint(self, arguments: list) -> tuple:
+        reportPath = os.path.join(self.folder, "report.json")
+        listPath = os.path.join(self.folder, "drifting.txt")
+        for path in (reportPath, listPath):
+            if os.path.exists(path):
+                os.remove(path)
+        
+        process = subprocess.run(
+            [sys.executable, os.path.join(addonDir, "batchSync.py"), "--lint", "--report", reportPath, 
+             "--drifting-files", listPath, *arguments],
+            capture_output=True, text=True
+        )
+        
+        report = None
+        if os.path.exists(reportPath):
+            with open(reportPath, encoding="utf-8") as reportFile:
+                report = json.load(reportFile)
+        
+        listed = set()
+        if os.path.exists(listPath):
+            with open(listPath, encoding="utf-8") as listFile:
+                listed = {line.strip() for line in listFile if line.strip()}
+        
+        return process, report, listed
+    
+    # Check an expectation --------------------------------------------------------------------------------------------------------
+    def _expect(self, condition: bool, description: str):
+        if not condition:
+            self.failures.append(description)
+            print(f"  failed: {description}", file=sys.stderr)
+
+
+# Entry point #####################################################################################################################
+
+# Main ----------------------------------------------------------------------------------------------------------------------------
+def main(argv: list = None) -> int:
+    """
+    Run all scenarios and report results.
+
+    Args:
+        argv (list[str], optional): The command line. Defaults to `sys.argv`.
+
+    Returns:
+        int: Exit code, 1 if any scenario failed.
+    """
+    
+    argv = sys.argv if argv is None else argv
+    
+    parser = argparse.ArgumentParser(prog="lintBenchmark.py", description="Check the names-only lint on synthetic .blend files.")
+    parser.add_argument("--files", type=int, default=200, help="Number of files in the library to lint")
+    parser.add_argument("--objects", type=int, default=100, help="Number of objects in each file")
+    parser.add_argument("--geometry-bytes", type=int, default=4096, help="Size of dummy geometry of each mesh in bytes")
+    args = parser.parse_args(argv[1:])
+    
+    with tempfile.TemporaryDirectory() as folder:
+        failures = Scenarios(folder, args).run()
+    
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
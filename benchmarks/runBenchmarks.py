@@ -0,0 +1,466 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for running benchmarks of the synchronizer on synthetic scenes.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+#
+# USAGE ***************************************************************************************************************************
+#
+#   python benchmarks/runBenchmarks.py [--sizes 1000,10000,100000] [--save-baseline]
+#
+# or, to measure with Blender instead of the stand-in of bpy:
+#
+#   blender -b --factory-startup --python benchmarks/runBenchmarks.py -- [options]
+#
+# Wall time, number of name writes and peak memory are measured for each phase of a synchronization, and for the operator's
+# `execute()` as a whole. Results are compared with the baseline stored in `benchmarks/baselines`. The exit code is non-zero if
+# the numbers of renames, collisions or writes regressed, which are the same on each machine. Times and memory exceeding the 
+# baseline beyond the tolerance are only reported, as they depend on the machine. Run with `--help` to learn about options.
+#
+# *********************************************************************************************************************************
+
+from __future__ import annotations
+import argparse
+import contextlib
+import gc
+import importlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeBpy
+from syntheticScene import SceneParameters, buildScene
+
+
+# Constants =======================================================================================================================
+
+addonDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+"""Folder of the add-on"""
+
+packageName = "t1nkrMeshNameSynchronizerBenchmark"
+"""Name the add-on is imported as"""
+
+defaultBaseline = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "synchronizer.json")
+"""Default baseline file"""
+
+
+# Public functions ================================================================================================================
+
+# Import a module of the add-on ---------------------------------------------------------------------------------------------------
+def addonModule(name: str) -> types.ModuleType:
+    """
+    Import a module of the add-on. The add-on's folder is loaded as a package without running its `__init__.py`, which would 
+    register UI classes.
+
+    Args:
+        name (str): Name of the module, such as `renamePlanner`.
+
+    Returns:
+        types.ModuleType: The module.
+    """
+    
+    if packageName not in sys.modules:
+        package = types.ModuleType(packageName)
+        package.__path__ = [addonDir]
+        package.bl_info = {"version": (0, 0, 0)}
+        sys.modules[packageName] = package
+    
+    return importlib.import_module(f"{packageName}.{name}")
+
+# Measure phases ------------------------------------------------------------------------------------------------------------------
+def measurePhases(bpy, parameters: SceneParameters, nameTemplate: str = None) -> dict:
+    """
+    Build a scene and synchronize it phase by phase, measuring wall time and name writes of each phase.
+
+    Args:
+        bpy (module): Blender's Python module or its stand-in.
+        parameters (SceneParameters): The scene to build.
+        nameTemplate (str, optional): Naming template. Defaults to the default template of the add-on.
+
+    Returns:
+        dict: Measurements.
+    """
+    
+    renamePlanner = addonModule("renamePlanner")
+    objectScope = addonModule("objectScope")
+    namingTemplate = addonModule("namingTemplate")
+    
+    _newFile(bpy)
+    buildScene(bpy, parameters)
+    writesBefore = _nameWrites(bpy)
+    
+    timings = {}
+    
+    def timed(phase, function):
+        started = time.perf_counter()
+        result = function()
+        timings[phase] = time.perf_counter() - started
+        return result
+    
+    objects = timed("gather", lambda: list(objectScope.iterObjects(bpy.context, 'FILE')))
+    rule = namingTemplate.NamingRule(template=nameTemplate or namingTemplate.defaultTemplate)
+    candidates, ignored = timed("snapshot", lambda: renamePlanner.snapshot(objects, namingTemplate.compileRule(rule, bpy.data.objects)))
+    existingNames = timed("index", lambda: renamePlanner.existingNamesIn(bpy.data, {c.idType for c in candidates}))
+    plan = timed("plan", lambda: renamePlanner.planRenames(candidates, existingNames))
+    timed("apply", lambda: renamePlanner.applyPlan(plan))
+    
+    return {
+        "seconds": timings,
+        "renames": len(plan.renames),
+        "writes": _nameWrites(bpy) - writesBefore if _nameWrites(bpy) is not None else len(plan.steps),
+        "collisions": len(plan.collisions),
+        "redundantWritesAvoided": plan.redundantWritesAvoided
+    }
+
+# Measure the operator ------------------------------------------------------------------------------------------------------------
+def measureExecute(bpy, parameters: SceneParameters, trackMemory: bool = False, nameTemplate: str = None) -> dict:
+    """
+    Build a scene and run `T1NKER_OT_MeshNameSynchronizer.execute()` on all objects of the file.
+
+    Args:
+        bpy (module): Blender's Python module or its stand-in.
+        parameters (SceneParameters): The scene to build.
+        trackMemory (bool, optional): Measure peak memory allocated by the run. Makes the run slower. Defaults to `False`.
+        nameTemplate (str, optional): Naming template. Defaults to the default template of the add-on.
+
+    Returns:
+        dict: Measurements, or `None` if the operator cannot be run.
+    """
+    
+    _newFile(bpy)
+    buildScene(bpy, parameters)
+    writesBefore = _nameWrites(bpy)
+    
+    if getattr(bpy, "isStandIn", False):
+        synchronizer = addonModule("meshNameSynchronizer")
+        bpy.context.scene.T1nkerMeshNameSynchronizerSettings = synchronizer.T1nkerMeshNameSynchronizerSettings()
+        bpy.context.scene.T1nkerMeshNameSynchronizerSettings.scope = 'FILE'
+        if nameTemplate:
+            bpy.context.scene.T1nkerMeshNameSynchronizerSettings.nameTemplate = nameTemplate
+        operator = synchronizer.T1NKER_OT_MeshNameSynchronizer()
+        run = lambda: operator.execute(bpy.context)
+    elif hasattr(bpy.context.scene, "T1nkerMeshNameSynchronizerSettings"):
+        # Blender with the add-on enabled
+        bpy.context.scene.T1nkerMeshNameSynchronizerSettings.scope = 'FILE'
+        if nameTemplate:
+            bpy.context.scene.T1nkerMeshNameSynchronizerSettings.nameTemplate = nameTemplate
+        run = lambda: bpy.ops.t1nker.meshnamesynchronizer('EXEC_DEFAULT')
+    else:
+        return None
+    
+    gc.collect()
+    if trackMemory:
+        tracemalloc.start()
+    
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run()
+    seconds = time.perf_counter() - started
+    
+    result = {"seconds": seconds, "writes": _nameWrites(bpy) - writesBefore if _nameWrites(bpy) is not None else None}
+    
+    if trackMemory:
+        result["peakMemoryBytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    
+    return result
+
+# Run all benchmarks --------------------------------------------------------------------------------------------------------------
+def runBenchmarks(bpy, sizes: list, template: SceneParameters, repeat: int = 3, trackMemory: bool = True, 
+                  nameTemplate: str = None) -> dict:
+    """
+    Run benchmarks for scenes of each size. Times are the best of `repeat` runs, each on a freshly built scene.
+
+    Args:
+        bpy (module): Blender's Python module or its stand-in.
+        sizes (list[int]): Number of objects in scenes.
+        template (SceneParameters): Parameters of scenes other than the number of objects.
+        repeat (int, optional): Number of runs to take the best time of. Defaults to 3.
+        trackMemory (bool, optional): Measure peak memory in an additional run. Defaults to `True`.
+        nameTemplate (str, optional): Naming template. Defaults to the default template of the add-on.
+
+    Returns:
+        dict: Results by size.
+    """
+    
+    results = {}
+    
+    for size in sizes:
+        parameters = SceneParameters(**dict(template.asDict(), objects=size))
+        
+        phases = [measurePhases(bpy, parameters, nameTemplate) for _ in range(repeat)]
+        best = dict(phases[0], seconds={phase: min(run["seconds"][phase] for run in phases) for phase in phases[0]["seconds"]})
+        
+        try:
+            runs = [measureExecute(bpy, parameters, nameTemplate=nameTemplate) for _ in range(repeat)]
+            execute = None if runs[0] is None else dict(runs[0], seconds=min(run["seconds"] for run in runs))
+            if execute is not None and trackMemory:
+                execute["peakMemoryBytes"] = measureExecute(bpy, parameters, trackMemory=True, nameTemplate=nameTemplate)["peakMemoryBytes"]
+        except ImportError as ex:
+            # Such as when a dependency of the operator's module is not installed
+            execute = {"skipped": str(ex)}
+        
+        results[str(size)] = {"phases": best, "execute": execute}
+        print(f"{size:>9} objects: {_describe(results[str(size)])}", file=sys.stderr)
+    
+    return results
+
+# Compare with baseline -----------------------------------------------------------------------------------------------------------
+def compareWithBaseline(results: dict, baseline: dict) -> list:
+    """
+    Find counts differing from the baseline in a bad way. Synthetic scenes are generated from a fixed seed, so counts are the
+    same on each run and machine: the numbers of renames and collisions must match the baseline, the number of writes must not
+    exceed it, and the number of redundant writes avoided must not go below it. Times are not compared here, as they depend on
+    the machine and its load, see `compareTimes()`.
+
+    Args:
+        results (dict): Results as returned by `runBenchmarks()`.
+        baseline (dict): Results stored earlier.
+
+    Returns:
+        list[str]: Descriptions of regressions.
+    """
+    
+    regressions = []
+    
+    for size, result in results.items():
+        base = baseline.get(size)
+        if base is None:
+            continue
+        
+        phases, basePhases = result["phases"], base["phases"]
+        
+        if phases["writes"] > basePhases["writes"]:
+            regressions.append(f"{size} objects: {phases['writes']} writes vs. {basePhases['writes']}")
+        
+        for count in ("renames", "collisions"):
+            if count in basePhases and phases[count] != basePhases[count]:
+                regressions.append(f"{size} objects: {phases[count]} {count} vs. {basePhases[count]}")
+        
+        if phases["redundantWritesAvoided"] < basePhases.get("redundantWritesAvoided", 0):
+            regressions.append(
+                f"{size} objects: {phases['redundantWritesAvoided']} redundant writes avoided vs. "
+                f"{basePhases['redundantWritesAvoided']}"
+            )
+    
+    return regressions
+
+# Compare times with baseline -----------------------------------------------------------------------------------------------------
+def compareTimes(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Find times and memory use exceeding the baseline by more than `tolerance` (a ratio). These are only reported, as the 
+    baseline may have been measured on another machine, and short phases vary a lot between runs.
+
+    Args:
+        results (dict): Results as returned by `runBenchmarks()`.
+        baseline (dict): Results stored earlier.
+        tolerance (float): Allowed relative increase of times and memory.
+
+    Returns:
+        list[str]: Descriptions of measurements exceeding the baseline.
+    """
+    
+    slower = []
+    
+    for size, result in results.items():
+        base = baseline.get(size)
+        if base is None:
+            continue
+        
+        for phase, seconds in result["phases"]["seconds"].items():
+            baseSeconds = base["phases"]["seconds"].get(phase)
+            if baseSeconds and seconds > baseSeconds * (1 + tolerance):
+                slower.append(f"{size} objects, phase '{phase}': {seconds:.4f} s vs. {baseSeconds:.4f} s")
+        
+        execute, baseExecute = result.get("execute") or {}, base.get("execute") or {}
+        if "seconds" in execute and "seconds" in baseExecute:
+            if execute["seconds"] > baseExecute["seconds"] * (1 + tolerance):
+                slower.append(f"{size} objects, execute: {execute['seconds']:.4f} s vs. {baseExecute['seconds']:.4f} s")
+        if "peakMemoryBytes" in execute and "peakMemoryBytes" in baseExecute:
+            if execute["peakMemoryBytes"] > baseExecute["peakMemoryBytes"] * (1 + tolerance):
+                slower.append(f"{size} objects, execute: peak memory {execute['peakMemoryBytes']} vs. {baseExecute['peakMemoryBytes']} bytes")
+    
+    return slower
+
+# Entry point ---------------------------------------------------------------------------------------------------------------------
+def main(argv: list = None) -> int:
+    """
+    Parse the command line, run benchmarks, and compare results with, or save them as the baseline.
+
+    Args:
+        argv (list[str], optional): The command line. Defaults to `sys.argv`.
+
+    Returns:
+        int: Exit code, 1 if a regression has been found.
+    """
+    
+    argv = sys.argv if argv is None else argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else argv[1:]
+    
+    defaults = SceneParameters()
+    parser = argparse.ArgumentParser(prog="runBenchmarks.py", description="Benchmark the synchronizer on synthetic scenes.")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated numbers of objects (1000000 is supported)")
+    parser.add_argument("--shared", type=float, default=defaults.sharedDataRatio, help="Ratio of objects sharing data")
+    parser.add_argument("--in-sync", type=float, default=defaults.inSyncRatio, help="Ratio of objects already in sync")
+    parser.add_argument("--collisions", type=float, default=defaults.collisionRate, help="Ratio of objects whose name is taken")
+    parser.add_argument("--swaps", type=float, default=defaults.swapRatio, help="Ratio of objects with swapped names")
+    parser.add_argument("--name-length", type=int, default=defaults.nameLength, help="Length of object names")
+    parser.add_argument("--nesting-depth", type=int, default=defaults.nestingDepth, help="Depth of parenting chains of objects")
+    parser.add_argument("--name-template", default="", help="Naming template, such as {root}_{parent}_{sibling_index:02d}")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs to take the best time of")
+    parser.add_argument("--no-memory", action="store_true", help="Don't measure peak memory")
+    parser.add_argument("--baseline", default=defaultBaseline, help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Save results as the baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Relative increase of times and memory to report")
+    parser.add_argument("--output", default="", help="Also write results to this file")
+    args = parser.parse_args(argv)
+    
+    bpy = fakeBpy.install()
+    
+    template = SceneParameters(
+        sharedDataRatio=args.shared, inSyncRatio=args.in_sync, collisionRate=args.collisions, swapRatio=args.swaps, 
+        nameLength=args.name_length, nestingDepth=args.nesting_depth
+    )
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    
+    report = {
+        "environment": {
+            "bpy": "stand-in" if getattr(bpy, "isStandIn", False) else f"Blender {'.'.join(map(str, bpy.app.version))}",
+            "python": platform.python_version(),
+            "machine": platform.machine()
+        },
+        "scene": {name: value for name, value in template.asDict().items() if name != "objects"},
+        "nameTemplate": args.name_template,
+        "results": runBenchmarks(
+            bpy, sizes, template, repeat=args.repeat, trackMemory=not args.no_memory, nameTemplate=args.name_template
+        )
+    }
+    
+    if args.output:
+        _writeJson(args.output, report)
+    
+    if args.save_baseline:
+        _writeJson(args.baseline, report)
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+    
+    if not os.path.isfile(args.baseline):
+        print(f"No baseline found at {args.baseline}, run with --save-baseline to make one", file=sys.stderr)
+        return 0
+    
+    with open(args.baseline, encoding="utf-8") as baselineFile:
+        baseline = json.load(baselineFile)
+    
+    if baseline.get("environment", {}).get("bpy") != report["environment"]["bpy"] or baseline.get("scene") != report["scene"] \
+            or baseline.get("nameTemplate", "") != report["nameTemplate"]:
+        print("Baseline was measured with a different bpy or scene parameters, results are not comparable", file=sys.stderr)
+        return 0
+    
+    for slower in compareTimes(report["results"], baseline["results"], args.tolerance):
+        print(f"SLOWER: {slower}", file=sys.stderr)
+    
+    regressions = compareWithBaseline(report["results"], baseline["results"])
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    
+    return 1 if regressions else 0
+
+
+# Private functions ===============================================================================================================
+
+# Start a new file ----------------------------------------------------------------------------------------------------------------
+def _newFile(bpy):
+    """Start an empty file"""
+    
+    if getattr(bpy, "isStandIn", False):
+        fakeBpy.newFile()
+    else:
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+# Get number of name writes -------------------------------------------------------------------------------------------------------
+def _nameWrites(bpy) -> int:
+    """Number of name writes so far, or `None` if not known (with Blender)"""
+    return fakeBpy.stats.nameWrites if getattr(bpy, "isStandIn", False) else None
+
+# Describe results ----------------------------------------------------------------------------------------------------------------
+def _describe(result: dict) -> str:
+    """One-line description of results for a size"""
+    
+    phases = result["phases"]
+    text = ", ".join(f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in phases["seconds"].items())
+    text += f"; {phases['writes']} writes for {phases['renames']} renames"
+    
+    execute = result.get("execute")
+    if execute and "seconds" in execute:
+        text += f"; execute {execute['seconds'] * 1000:.1f} ms"
+        if "peakMemoryBytes" in execute:
+            text += f", peak {execute['peakMemoryBytes'] / 1048576:.1f} MiB"
+    elif execute:
+        text += f"; execute skipped ({execute['skipped']})"
+    
+    return text
+
+# Write JSON ----------------------------------------------------------------------------------------------------------------------
+def _writeJson(path: str, content: dict):
+    """Write a JSON file, creating its folder if needed"""
+    
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as jsonFile:
+        json.dump(content, jsonFile, indent=1)
+
+
+# Entry point #####################################################################################################################
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for measuring how long loading and registering the add-on takes.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+#
+# USAGE ***************************************************************************************************************************
+#
+#   python benchmarks/startupBenchmark.py [--repeat 10] [--save-baseline]
+#
+# Each measurement is taken in a fresh Python process, with the stand-in of bpy, so that modules are not yet imported, just like
+# when Blender starts. The time to import the add-on and the time `register()` takes are measured, along with the modules the
+# add-on loads. Results are compared with the baseline stored in `benchmarks/baselines`, and the exit code is non-zero if any
+# time regressed beyond the tolerance, or if a module which must only be loaded on first use (see `deferredModules`) has been
+# loaded. Run with `--help` to learn about options.
+#
+# To take a single measurement with Blender:
+#
+#   blender -b --factory-startup --python benchmarks/startupBenchmark.py -- --measure
+#
+# *********************************************************************************************************************************
+
+from __future__ import annotations
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeBpy
+
+
+# Constants =======================================================================================================================
+
+addonDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+"""Folder of the add-on"""
+
+packageName = "t1nkrMeshNameSynchronizerStartup"
+"""Name the add-on is imported as"""
+
+defaultBaseline = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "startup.json")
+"""Default baseline file"""
+
+deferredModules = ["requests", "urllib3", "urllib.request", "ssl", "http.client", "charset_normalizer", "chardet"]
+"""Modules which must not be loaded by loading and registering the add-on, only on first use"""
+
+
+# Public functions ================================================================================================================
+
+# Measure startup -----------------------------------------------------------------------------------------------------------------
+def measureStartup() -> dict:
+    """
+    Import and register the add-on, measuring each. Meaningful only in a fresh process.
+
+    Returns:
+        dict: Measurements.
+    """
+    
+    bpy = fakeBpy.install()
+    modulesBefore = set(sys.modules)
+    
+    started = time.perf_counter()
+    spec = importlib.util.spec_from_file_location(
+        packageName, os.path.join(addonDir, "__init__.py"), submodule_search_locations=[addonDir]
+    )
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[packageName] = addon
+    spec.loader.exec_module(addon)
+    importSeconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    addon.register()
+    registerSeconds = time.perf_counter() - started
+    
+    loaded = set(sys.modules) - modulesBefore
+    
+    addon.unregister()
+    
+    return {
+        "importSeconds": importSeconds,
+        "registerSeconds": registerSeconds,
+        "totalSeconds": importSeconds + registerSeconds,
+        "modulesLoaded": len([name for name in loaded if not name.startswith(packageName)]),
+        "deferredModulesLoaded": sorted(name for name in deferredModules if name in loaded),
+        "bpy": "stand-in" if getattr(bpy, "isStandIn", False) else f"Blender {'.'.join(map(str, bpy.app.version))}"
+    }
+
+# Run measurements ----------------------------------------------------------------------------------------------------------------
+def runMeasurements(repeat: int) -> dict:
+    """
+    Measure startup in fresh processes, and take the best times.
+
+    Args:
+        repeat (int): Number of processes to measure.
+
+    Returns:
+        dict: Best times, and modules loaded as seen in the first process.
+    """
+    
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--measure"], capture_output=True, text=True, check=True
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    
+    return dict(runs[0], **{name: min(run[name] for run in runs) for name in ("importSeconds", "registerSeconds", "totalSeconds")})
+
+# Main ----------------------------------------------------------------------------------------------------------------------------
+def main(argv: list = None) -> int:
+    """
+    Parse the command line, measure startup, and compare results with, or save them as the baseline.
+
+    Args:
+        argv (list[str], optional): The command line. Defaults to `sys.argv`.
+
+    Returns:
+        int: Exit code, 1 if a regression has been found.
+    """
+    
+    argv = sys.argv if argv is None else argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else argv[1:]
+    
+    parser = argparse.ArgumentParser(prog="startupBenchmark.py", description="Measure loading and registering the add-on.")
+    parser.add_argument("--repeat", type=int, default=10, help="Number of fresh processes to take the best time of")
+    parser.add_argument("--measure", action="store_true", help="Take a single measurement in this process and print it")
+    parser.add_argument("--baseline", default=defaultBaseline, help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Save results as the baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative increase of times")
+    args = parser.parse_args(argv)
+    
+    if args.measure:
+        print(json.dumps(measureStartup()))
+        return 0
+    
+    results = runMeasurements(args.repeat)
+    results["environment"] = {"python": platform.python_version(), "machine": platform.machine()}
+    
+    print(
+        f"import {results['importSeconds'] * 1000:.1f} ms, register {results['registerSeconds'] * 1000:.2f} ms, "
+        f"{results['modulesLoaded']} module(s) loaded", 
+        file=sys.stderr
+    )
+    
+    regressions = []
+    if results["deferredModulesLoaded"]:
+        regressions.append(f"modules loaded at startup instead of on first use: {', '.join(results['deferredModulesLoaded'])}")
+    
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as baselineFile:
+            json.dump(results, baselineFile, indent=1)
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+    elif os.path.isfile(args.baseline):
+        with open(args.baseline, encoding="utf-8") as baselineFile:
+            baseline = json.load(baselineFile)
+        
+        for name in ("importSeconds", "registerSeconds", "totalSeconds"):
+            if results[name] > baseline[name] * (1 + args.tolerance):
+                regressions.append(f"{name} {results[name] * 1000:.2f} ms, baseline {baseline[name] * 1000:.2f} ms")
+    
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    
+    return 1 if regressions else 0
+
+
+# Entry point #####################################################################################################################
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for checking behaviors of synchronization runs with the stand-in of bpy.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+#
+# USAGE ***************************************************************************************************************************
+#
+#   python benchmarks/syncScenarios.py
+#
+# Runs scenarios of synchronization with the stand-in of bpy, each checking a behavior which is easy to break without noticing,
+# such as reusing plans of earlier runs. Each scenario is reported as passed or failed, and the exit code is non-zero if any 
+# failed.
+#
+# *********************************************************************************************************************************
+
+from __future__ import annotations
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeBpy
+from runBenchmarks import addonModule
+
+
+# Scenarios #######################################################################################################################
+class Scenarios:
+    """
+    Synchronization scenarios, each in a new file.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, bpy):
+        self.bpy = bpy
+        self.failures = []
+        
+        self.syncApi = addonModule("syncApi")
+        self.planCache = addonModule("planCache")
+    
+    # Public functions ============================================================================================================
+    
+    # Run all scenarios -----------------------------------------------------------------------------------------------------------
+    def run(self) -> list:
+        """
+        Run all scenarios.
+
+        Returns:
+            list[str]: Descriptions of failed expectations.
+        """
+        
+        for scenario in (self.staleCollision, self.staleNumbering, self.staleOwner, self.undoSteps):
+            fakeBpy.newFile()
+            self.planCache.PlanCache.clear()
+            
+            failuresBefore = len(self.failures)
+            started = time.perf_counter()
+            scenario()
+            seconds = time.perf_counter() - started
+            outcome = "PASS" if len(self.failures) == failuresBefore else "FAIL"
+            print(f"{outcome} {scenario.__name__} ({seconds:.2f} s)", file=sys.stderr)
+        
+        return self.failures
+    
+    # Scenarios ===================================================================================================================
+    
+    # Collision gone before applying a plan with SKIP -----------------------------------------------------------------------------
+    def staleCollision(self):
+        """A plan skipping a name taken by a datablock not processed is not reused once the name is freed"""
+        
+        self._applyAfterFreeing('SKIP')
+    
+    # Collision gone before applying a plan with NUMBER ---------------------------------------------------------------------------
+    def staleNumbering(self):
+        """A plan numbering a name taken by a datablock not processed is not reused once the name is freed"""
+        
+        self._applyAfterFreeing('NUMBER')
+    
+    # Owner of shared data renamed before applying --------------------------------------------------------------------------------
+    def staleOwner(self):
+        """A plan naming a shared datablock after one of its owners is not reused once the owners are renamed"""
+        
+        bpy = self.bpy
+        mesh = bpy.data.meshes.new("Mesh")
+        first = bpy.data.objects.new("A", mesh)
+        second = bpy.data.objects.new("B", mesh)
+        first.parent = bpy.data.objects.new("P1", None)
+        second.parent = bpy.data.objects.new("P2", None)
+        
+        settings = dict(nameTemplate="{parent}", sharedDataPolicy='FIRST_NAME')
+        dryRun = self.syncApi.synchronize([first, second], self.syncApi.SyncSettings(isTestOnly=True, **settings))
+        self._expect([record.nameAfter for record in dryRun.planned] == ["P1"], "dry run names the mesh after 'A'")
+        
+        # Target names stay the same, only the owner chosen changes
+        first.name = "Z"
+        
+        result = self.syncApi.synchronize([first, second], self.syncApi.SyncSettings(**settings))
+        self._expect(not result.stats.planReused, "stale plan not reused")
+        self._expect(mesh.name == "P2", f"mesh named 'P2', got '{mesh.name}'")
+        self._expect([record.objectName for record in result.applied] == ["B"], 
+                     f"rename reported for 'B', got {[record.objectName for record in result.applied]}")
+    
+    # Make undo steps only when needed --------------------------------------------------------------------------------------------
+    def undoSteps(self):
+        """Completed runs finish, but only those writing names without the journal make an undo step"""
+        
+        bpy = self.bpy
+        synchronizer = addonModule("meshNameSynchronizer")
+        settings = synchronizer.T1nkerMeshNameSynchronizerSettings()
+        settings.scope = 'FILE'
+        bpy.context.scene.T1nkerMeshNameSynchronizerSettings = settings
+        
+        for index in range(3):
+            bpy.data.objects.new(f"Object{index}", bpy.data.meshes.new(f"Mesh{index}"))
+        
+        for description, isTestOnly, useRenameJournal, expectedPushes in (
+            ("test run", True, False, 0), ("run", False, False, 1), ("run with nothing to rename", False, False, 0)
+        ):
+            settings.isTestOnly = isTestOnly
+            settings.useRenameJournal = useRenameJournal
+            pushesBefore = fakeBpy.stats.undoPushes
+            
+            with contextlib.redirect_stdout(io.StringIO()):
+                status = synchronizer.T1NKER_OT_MeshNameSynchronizer().execute(bpy.context)
+            
+            self._expect(status == {'FINISHED'}, f"{description} finishes, got {status}")
+            self._expect(fakeBpy.stats.undoPushes - pushesBefore == expectedPushes, 
+                         f"{description} makes {expectedPushes} undo step(s)")
+        
+        bpy.data.objects.new("Object3", bpy.data.meshes.new("Mesh3"))
+        settings.useRenameJournal = True
+        pushesBefore = fakeBpy.stats.undoPushes
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            status = synchronizer.T1NKER_OT_MeshNameSynchronizer().execute(bpy.context)
+        
+        self._expect(status == {'FINISHED'}, f"journaled run finishes, got {status}")
+        self._expect(fakeBpy.stats.undoPushes == pushesBefore, "journaled run makes no undo step")
+        self._expect(bpy.data.objects["Object3"].data.name == "Object3", "journaled run renames")
+    
+    # Private functions ===========================================================================================================
+    
+    # Apply a plan after the holder of a name is renamed --------------------------------------------------------------------------
+    def _applyAfterFreeing(self, collisionPolicy: str):
+        bpy = self.bpy
+        obj = bpy.data.objects.new("Foo", bpy.data.meshes.new("Mesh"))
+        holder = bpy.data.meshes.new("Foo")
+        
+        settings = self.syncApi.SyncSettings(collisionPolicy=collisionPolicy, isTestOnly=True)
+        dryRun = self.syncApi.synchronize([obj], settings)
+        self._expect(len(dryRun.planned) == (1 if collisionPolicy == 'NUMBER' else 0), f"{collisionPolicy}: dry run collides")
+        
+        # The holder is not processed, so renaming it changes nothing the plan is fingerprinted by
+        holder.name = "Other"
+        
+        result = self.syncApi.synchronize([obj], self.syncApi.SyncSettings(collisionPolicy=collisionPolicy))
+        self._expect(not result.stats.planReused, f"{collisionPolicy}: stale plan not reused")
+        self._expect(obj.data.name == "Foo", f"{collisionPolicy}: mesh named 'Foo', got '{obj.data.name}'")
+    
+    # Check an expectation --------------------------------------------------------------------------------------------------------
+    def _expect(self, condition: bool, description: str):
+        if not condition:
+            self.failures.append(description)
+            print(f"  failed: {description}", file=sys.stderr)
+
+
+# Entry point #####################################################################################################################
+
+# Main ----------------------------------------------------------------------------------------------------------------------------
+def main() -> int:
+    """
+    Run all scenarios and report results.
+
+    Returns:
+        int: Exit code, 1 if any scenario failed.
+    """
+    
+    failures = Scenarios(fakeBpy.install()).run()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
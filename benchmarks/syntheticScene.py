@@ -0,0 +1,152 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for generating synthetic scenes for benchmarks.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+from __future__ import annotations
+import random
+from dataclasses import dataclass, asdict
+
+
+# Scene parameters ################################################################################################################
+@dataclass
+class SceneParameters:
+    """
+    Parameters of a synthetic scene. Ratios apply to the objects of the scene, and are exclusive of each other except for
+    `sharedDataRatio`.
+    """
+    
+    objects: int = 1000
+    """Number of objects"""
+    
+    sharedDataRatio: float = 0.1
+    """Ratio of objects sharing their mesh with the previous object (linked duplicates)"""
+    
+    inSyncRatio: float = 0.5
+    """Ratio of objects whose mesh is already named after them"""
+    
+    collisionRate: float = 0.01
+    """Ratio of objects whose name is taken by an unrelated mesh"""
+    
+    swapRatio: float = 0.02
+    """Ratio of objects whose mesh name is swapped with that of another object"""
+    
+    nameLength: int = 16
+    """Length of object names"""
+    
+    nestingDepth: int = 0
+    """Number of ancestors of the deepest objects, objects are parented in chains of this many plus one, 0 for no parenting"""
+    
+    seed: int = 0
+    """Seed of the random generator, to make scenes reproducible"""
+    
+    def asDict(self) -> dict:
+        return asdict(self)
+
+
+# Public functions ================================================================================================================
+
+# Build a scene -------------------------------------------------------------------------------------------------------------------
+def buildScene(bpy, parameters: SceneParameters) -> list:
+    """
+    Populate the current file with a synthetic scene, using only the `bpy` API, so that it works both with Blender and the 
+    stand-in in `fakeBpy`. Objects are linked to the active scene's collection.
+
+    Args:
+        bpy (module): Blender's Python module or its stand-in.
+        parameters (SceneParameters): The parameters of the scene.
+
+    Returns:
+        list[bpy.types.Object]: The objects made.
+    """
+    
+    generator = random.Random(parameters.seed)
+    sceneObjects = bpy.context.scene.collection.objects
+    
+    def objectName(index: int) -> str:
+        stem = f"Obj{index:07d}"
+        return (stem + "x" * parameters.nameLength)[:max(parameters.nameLength, len(stem))]
+    
+    objects = []
+    index = 0
+    
+    while index < parameters.objects:
+        name = objectName(index)
+        roll = generator.random()
+        
+        if objects and generator.random() < parameters.sharedDataRatio:
+            # Linked duplicate of the previous object
+            objects.append(bpy.data.objects.new(name, objects[-1].data))
+            index += 1
+        elif roll < parameters.inSyncRatio:
+            objects.append(bpy.data.objects.new(name, bpy.data.meshes.new(name)))
+            index += 1
+        elif roll < parameters.inSyncRatio + parameters.collisionRate:
+            # An unrelated mesh takes the name of the object
+            bpy.data.meshes.new(name)
+            objects.append(bpy.data.objects.new(name, bpy.data.meshes.new(f"Mesh{index:07d}")))
+            index += 1
+        elif roll < parameters.inSyncRatio + parameters.collisionRate + parameters.swapRatio and index + 1 < parameters.objects:
+            # Two objects with their mesh names swapped
+            otherName = objectName(index + 1)
+            objects.append(bpy.data.objects.new(name, bpy.data.meshes.new(otherName)))
+            objects.append(bpy.data.objects.new(otherName, bpy.data.meshes.new(name)))
+            index += 2
+        else:
+            objects.append(bpy.data.objects.new(name, bpy.data.meshes.new(f"Mesh{index:07d}")))
+            index += 1
+    
+    for obj in objects:
+        sceneObjects.link(obj)
+    
+    if parameters.nestingDepth > 0:
+        for position in range(1, len(objects)):
+            if position % (parameters.nestingDepth + 1) != 0:
+                objects[position].parent = objects[position - 1]
+    
+    return objects
@@ -0,0 +1,425 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for checking how update checks behave against a local stub of the update checking service.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+#
+# USAGE ***************************************************************************************************************************
+#
+#   python benchmarks/updateCheckStub.py
+#
+# Starts a local HTTP server standing in for the update checking service, which answers promptly, slowly, with errors or with
+# `304 Not Modified` as told, with or without accepting batched requests, and runs update checks against it through 
+# `updateChecker.BackgroundUpdateChecker`, with the stand-in of bpy and a temporary cache file. Another T1nk-R add-on is 
+# simulated by registering it with `updateChecker.UpdateCheckCoordinator`. Each scenario is reported as passed or failed, and
+# the exit code is non-zero if any failed. Nothing is sent to the real service.
+#
+# *********************************************************************************************************************************
+
+from __future__ import annotations
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeBpy
+from runBenchmarks import addonModule, packageName
+
+
+# Stub of the update checking service #############################################################################################
+class StubService(BaseHTTPRequestHandler):
+    """
+    Request handler answering update checks as set in `mode`, and counting requests.
+    """
+    
+    mode: str = "healthy"
+    """How to answer: `healthy`, `slow`, `failing` or `notModified`"""
+    
+    slowSeconds: float = 2.0
+    """Time to wait before answering in `slow` mode"""
+    
+    requests: list = []
+    """Headers of requests received"""
+    
+    bodies: list = []
+    """Bodies of requests received"""
+    
+    batchesSupported: bool = True
+    """Tells whether to answer batched requests, or refuse them as an older service would"""
+    
+    latestVersion: str = "9.9.9"
+    """Latest version to report"""
+    
+    # Answer a request ------------------------------------------------------------------------------------------------------------
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        StubService.requests.append(dict(self.headers))
+        StubService.bodies.append(body)
+        
+        if StubService.mode == "slow":
+            time.sleep(StubService.slowSeconds)
+        
+        if StubService.mode == "failing":
+            self.send_response(503)
+            self.end_headers()
+            return
+        
+        if StubService.mode == "notModified" and self.headers.get("If-None-Match"):
+            self.send_response(304)
+            self.send_header("ETag", '"stub"')
+            self.end_headers()
+            return
+        
+        answer = {
+            "repository": {"latestVersion": StubService.latestVersion, "latestVersionName": f"v{StubService.latestVersion}"},
+            "updateAvailable": True
+        }
+        
+        if "appInfos" in body:
+            if not StubService.batchesSupported:
+                self.send_response(400)
+                self.end_headers()
+                return
+            
+            answer = {"results": [dict(answer, repoSlug=appInfo["repoSlug"]) for appInfo in body["appInfos"]]}
+        
+        body = json.dumps(answer).encode("utf-8")
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"stub"')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    # Keep quiet ------------------------------------------------------------------------------------------------------------------
+    def log_message(self, *args):
+        pass
+
+
+# Scenarios #######################################################################################################################
+class Scenarios:
+    """
+    Update checks against the stub, each simulating a new Blender session sharing the on-disk cache with the previous ones.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, bpy, configFolder: str, serviceUrl: str, offlineUrl: str):
+        self.bpy = bpy
+        self.configFolder = configFolder
+        self.serviceUrl = serviceUrl
+        self.offlineUrl = offlineUrl
+        self.failures = []
+        
+        self.updateChecker = addonModule("updateChecker")
+        self.checker = self.updateChecker.BackgroundUpdateChecker
+        self.cache = self.updateChecker.UpdateCheckCache
+        self.coordinator = self.updateChecker.UpdateCheckCoordinator.shared()
+        self.otherSlug = "T1nkR-Other-Addon"
+        self.otherVersion = "1.0.0"
+        self.checker.requestTimeoutSeconds = 0.5
+        
+        self.updateInfo = self.updateChecker.T1nkerMeshNameSynchronizerUpdateInfo()
+        bpy.context.preferences.addons[packageName] = types.SimpleNamespace(
+            preferences=types.SimpleNamespace(updateInfo=self.updateInfo)
+        )
+    
+    # Public functions ============================================================================================================
+    
+    # Run all scenarios -----------------------------------------------------------------------------------------------------------
+    def run(self) -> list:
+        """
+        Run all scenarios in order, as each builds on the cache left by the previous one.
+
+        Returns:
+            list[str]: Descriptions of failed expectations.
+        """
+        
+        for scenario in (self.healthy, self.notModified, self.slow, self.backingOff, self.failing, self.offline, 
+                         self.recovery, self.batched, self.batchRefused, self.coalesced, self.disabled):
+            failuresBefore = len(self.failures)
+            started = time.perf_counter()
+            scenario()
+            seconds = time.perf_counter() - started
+            outcome = "PASS" if len(self.failures) == failuresBefore else "FAIL"
+            print(f"{outcome} {scenario.__name__} ({seconds:.2f} s)", file=sys.stderr)
+        
+        return self.failures
+    
+    # A healthy service answers ---------------------------------------------------------------------------------------------------
+    def healthy(self):
+        StubService.mode = "healthy"
+        self._expect(self._check(), "check started")
+        self._expect(self.updateInfo.updateAvailable and self.updateInfo.latestVersion == StubService.latestVersion, 
+                     "update info delivered")
+        self._expect("failures" not in self._entry(), "no failure recorded")
+    
+    # An unchanged answer is confirmed --------------------------------------------------------------------------------------------
+    def notModified(self):
+        StubService.mode = "notModified"
+        self.updateInfo.checkFrequencyDays = 0
+        self._expect(self._check(), "check started")
+        self._expect(StubService.requests[-1].get("If-None-Match") == '"stub"', "conditional request sent")
+        self._expect("failures" not in self._entry(), "no failure recorded")
+    
+    # A slow service times out, and the failure is recorded -----------------------------------------------------------------------
+    def slow(self):
+        StubService.mode = "slow"
+        started = time.perf_counter()
+        self._expect(self._check(), "check started")
+        self._expect(time.perf_counter() - started < StubService.slowSeconds, "timed out before the answer")
+        self._expect(self._entry().get("failures") == 1, "failure recorded")
+        self._expect(self.cache.isBackingOff(self._entry()), "backing off")
+    
+    # Checks are not tried again while backing off --------------------------------------------------------------------------------
+    def backingOff(self):
+        StubService.mode = "healthy"
+        requestsBefore = len(StubService.requests)
+        self._expect(not self._check(), "no check started")
+        self._expect(len(StubService.requests) == requestsBefore, "no request sent")
+    
+    # Repeated failures open the circuit breaker ----------------------------------------------------------------------------------
+    def failing(self):
+        StubService.mode = "failing"
+        for _ in range(self.cache.failureThreshold - 1):
+            self._expireBackoff()
+            self._expect(self._check(), "check started")
+        
+        entry = self._entry()
+        self._expect(entry.get("failures") == self.cache.failureThreshold, "failures counted")
+        self._expect(self.cache.isCircuitOpen(entry), "circuit breaker open")
+        self._expect(not self.cache.isCircuitOpen(entry, now=datetime.now() + timedelta(seconds=self.cache.openCircuitSeconds)),
+                     "circuit breaker half-open later")
+    
+    # An unreachable service is recorded as a failure -----------------------------------------------------------------------------
+    def offline(self):
+        os.environ[self.updateChecker.UpdateCheckingInfo.serviceUrlVariable] = self.offlineUrl
+        self._expireBackoff()
+        self._expect(self._check(), "check started")
+        self._expect("connect" in self._entry().get("lastError", ""), "connection error recorded")
+        self._expect(self.cache.isCircuitOpen(self._entry()), "circuit breaker open again")
+        os.environ[self.updateChecker.UpdateCheckingInfo.serviceUrlVariable] = self.serviceUrl
+    
+    # A success closes the circuit breaker ----------------------------------------------------------------------------------------
+    def recovery(self):
+        StubService.mode = "healthy"
+        self._expireBackoff()
+        self._expect(self._check(), "check started")
+        self._expect("failures" not in self._entry(), "failures forgotten")
+        self._expect(not self.cache.isBackingOff(self._entry()), "not backing off")
+    
+    # Add-ons due are checked in a single request ---------------------------------------------------------------------------------
+    def batched(self):
+        StubService.mode = "healthy"
+        self.coordinator.registerApp(self.otherSlug, self.otherVersion)
+        requestsBefore = len(StubService.requests)
+        
+        self._expect(self._check(), "check started")
+        self._expect(len(StubService.requests) == requestsBefore + 1, "single request sent")
+        self._expect(len(StubService.bodies[-1].get("appInfos", [])) == 2, "both add-ons in the request")
+        self._expect(self.updateInfo.latestVersion == StubService.latestVersion, "update info delivered")
+        self._expect(self.cache.isFresh(self._entry(self.otherSlug, self.otherVersion), 1), "other add-on's info cached")
+        self._expect(self.coordinator.takeResult(self.otherSlug) is not None, "other add-on's result kept for it")
+    
+    # Add-ons are checked one by one if the service refuses batches ---------------------------------------------------------------
+    def batchRefused(self):
+        StubService.batchesSupported = False
+        self._expireEntry(self.otherSlug, self.otherVersion)
+        requestsBefore = len(StubService.requests)
+        
+        self._expect(self._check(), "check started")
+        self._expect(len(StubService.requests) == requestsBefore + 3, "batch refused, then one request per add-on")
+        self._expect(not self.coordinator.supportsBatches, "batches not tried again")
+        self._expect(self.cache.isFresh(self._entry(self.otherSlug, self.otherVersion), 1), "other add-on's info cached")
+        
+        StubService.batchesSupported = True
+        self.coordinator.supportsBatches = True
+    
+    # Checks requested while one is running are not repeated ----------------------------------------------------------------------
+    def coalesced(self):
+        StubService.mode = "slow"
+        StubService.slowSeconds = 0.2
+        self._expireEntry(self.otherSlug, self.otherVersion)
+        requestsBefore = len(StubService.requests)
+        
+        self.checker._startedThisSession = False
+        self._expect(self.checker.requestCheck(self.bpy.context), "check started")
+        
+        # Joins the running check if already started, or is checked in the same request if not
+        self.coordinator.request(self.otherSlug, self.otherVersion, self.cache.defaultPath())
+        self._expect(self.coordinator.isPending(self.otherSlug), "other add-on waits for the result")
+        self._waitForCheck()
+        self.bpy.app.timers.runTimers()
+        
+        self._expect(len(StubService.requests) == requestsBefore + 1, "single request sent")
+        self._expect((self.coordinator.takeResult(self.otherSlug) or {}).get("succeeded"), "other add-on's result delivered")
+        
+        self.coordinator.unregisterApp(self.otherSlug)
+        StubService.mode = "healthy"
+        StubService.slowSeconds = 2.0
+    
+    # Checks can be disabled ------------------------------------------------------------------------------------------------------
+    def disabled(self):
+        requestsBefore = len(StubService.requests)
+        
+        os.environ[self.checker.disablingVariable] = "1"
+        self._expect(not self._check(force=True), "disabled by environment variable")
+        del os.environ[self.checker.disablingVariable]
+        
+        self.updateInfo.checkForUpdates = False
+        self._expect(not self._check(force=True), "disabled in preferences")
+        self.updateInfo.checkForUpdates = True
+        
+        self._expect(len(StubService.requests) == requestsBefore, "no request sent")
+    
+    # Private functions ===========================================================================================================
+    
+    # Perform a check in a new session --------------------------------------------------------------------------------------------
+    def _check(self, force: bool = False) -> bool:
+        """Request a check as a new session would, and wait for its result to be delivered"""
+        
+        self.checker._startedThisSession = False
+        started = self.checker.requestCheck(self.bpy.context, force=force)
+        
+        if started:
+            self._waitForCheck()
+            self.bpy.app.timers.runTimers()
+        
+        return started
+    
+    # Wait for the running check --------------------------------------------------------------------------------------------------
+    def _waitForCheck(self):
+        """Wait for the coordinator's worker thread to finish, if running"""
+        
+        worker = self.coordinator.worker
+        if worker is not None:
+            worker.join()
+    
+    # Get the cache entry ---------------------------------------------------------------------------------------------------------
+    def _entry(self, repoSlug: str = None, currentVersion: str = None) -> dict:
+        """The cache entry of an add-on, this one by default"""
+        
+        return self.cache.getEntry(
+            self.cache.defaultPath(), 
+            self.cache.key(
+                repoSlug or self.updateChecker.UpdateCheckingInfo._repoSlug, currentVersion or self.updateInfo.currentVersion
+            )
+        ) or {}
+    
+    # Pretend information has expired ---------------------------------------------------------------------------------------------
+    def _expireEntry(self, repoSlug: str, currentVersion: str):
+        """Move the time of the last check of an add-on to the past, as if its information has expired"""
+        
+        entry = dict(self._entry(repoSlug, currentVersion), checkedAt="2000-01-01 00:00:00")
+        self.cache.storeEntry(self.cache.defaultPath(), self.cache.key(repoSlug, currentVersion), entry)
+    
+    # Pretend time has passed -----------------------------------------------------------------------------------------------------
+    def _expireBackoff(self):
+        """Move the time of the next allowed check to the past, as if time has passed"""
+        
+        entry = dict(self._entry(), retryAfter="2000-01-01 00:00:00")
+        self.cache.storeEntry(
+            self.cache.defaultPath(), 
+            self.cache.key(self.updateChecker.UpdateCheckingInfo._repoSlug, self.updateInfo.currentVersion), 
+            entry
+        )
+    
+    # Check an expectation --------------------------------------------------------------------------------------------------------
+    def _expect(self, condition: bool, description: str):
+        if not condition:
+            self.failures.append(description)
+            print(f"  failed: {description}", file=sys.stderr)
+
+
+# Entry point #####################################################################################################################
+
+# Main ----------------------------------------------------------------------------------------------------------------------------
+def main() -> int:
+    """
+    Start the stub, run all scenarios and report results.
+
+    Returns:
+        int: Exit code, 1 if any scenario failed.
+    """
+    
+    bpy = fakeBpy.install()
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubService)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    # A port nothing listens on, to simulate being offline
+    offline = ThreadingHTTPServer(("127.0.0.1", 0), StubService)
+    offlineUrl = f"http://127.0.0.1:{offline.server_port}/getUpdateInfo"
+    offline.server_close()
+    
+    with tempfile.TemporaryDirectory() as configFolder:
+        # Keep the cache of the user intact
+        bpy.utils.user_resource = lambda kind, path="", create=False: os.path.join(configFolder, path)
+        os.makedirs(os.path.join(configFolder, "t1nkr"), exist_ok=True)
+        
+        serviceUrl = f"http://127.0.0.1:{server.server_port}/getUpdateInfo"
+        os.environ[addonModule("updateChecker").UpdateCheckingInfo.serviceUrlVariable] = serviceUrl
+        os.environ.pop(addonModule("updateChecker").BackgroundUpdateChecker.disablingVariable, None)
+        
+        failures = Scenarios(bpy, configFolder, serviceUrl, offlineUrl).run()
+    
+    server.shutdown()
+    
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,605 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for reading the names of objects and their data from .blend files without Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+from __future__ import annotations
+import contextlib
+import gzip
+import os
+import re
+import struct
+from dataclasses import dataclass, field
+
+
+# Constants =======================================================================================================================
+
+objectTypeCodes = {
+    0: 'EMPTY',
+    1: 'MESH',
+    2: 'CURVE',
+    3: 'SURFACE',
+    4: 'FONT',
+    5: 'META',
+    10: 'LIGHT',
+    11: 'CAMERA',
+    12: 'SPEAKER',
+    13: 'LIGHT_PROBE',
+    22: 'LATTICE',
+    25: 'ARMATURE',
+    26: 'GPENCIL',
+    27: 'CURVES',
+    28: 'POINTCLOUD',
+    29: 'VOLUME',
+    30: 'GREASEPENCIL'
+}
+"""
+Object types (see `objectScope.objectTypes`) by the value stored in .blend files.
+"""
+
+idTypeCodes = {
+    b"ME": 'MESH',
+    b"CU": 'CURVE',
+    b"CV": 'CURVES',
+    b"MB": 'META',
+    b"LT": 'LATTICE',
+    b"AR": 'ARMATURE',
+    b"CA": 'CAMERA',
+    b"LA": 'LIGHT',
+    b"LP": 'LIGHT_PROBE',
+    b"SK": 'SPEAKER',
+    b"VO": 'VOLUME',
+    b"PT": 'POINTCLOUD',
+    b"GD": 'GREASEPENCIL',
+    b"GP": 'GREASEPENCIL_V3'
+}
+"""
+ID types (`bpy.types.ID.id_type`) of object data by the code of their blocks in .blend files, which is also the first two 
+characters of their names as stored.
+"""
+
+unreadableFields = frozenset({"collection", "index", "sibling_index"})
+"""
+Fields of naming templates (see `namingTemplate.fields`) which cannot be computed from the names read, as collections are not 
+read, and objects are not in the order Blender would process them.
+"""
+
+_blockCodesRead = {b"OB\0\0", b"LI\0\0", b"ID\0\0"}
+"""Codes of blocks read besides those of object data: objects, libraries and placeholders of linked data blocks"""
+
+_gzipMagic = b"\x1f\x8b"
+"""First bytes of files compressed with gzip, as by Blender before 3.0"""
+
+_zstdMagic = b"\x28\xb5\x2f\xfd"
+"""First bytes of files compressed with Zstandard, as by Blender 3.0 and later"""
+
+_memberName = re.compile(r"[*(]*(\w+)")
+"""Gets the bare name of a member from names in SDNA such as `*next`, `name[66]` or `(*func)()`"""
+
+
+# A data block read ###############################################################################################################
+@dataclass(eq=False)
+class DatablockHeader:
+    """
+    Name and identity of a data block read from a .blend file. Attributes are named as those of `bpy.types.ID`, so that the
+    data block can be planned for by `renamePlanner` like one in Blender.
+    """
+    
+    name: str
+    """Name of the data block, without the ID code"""
+    
+    id_type: str
+    """ID type of the data block, see `idTypeCodes`"""
+    
+    address: int
+    """Address of the data block in Blender's memory when the file was saved, unique within the file"""
+    
+    library: str = None
+    """Name of the library the data block is linked from, `None` if it's local"""
+    
+    override_library: bool = None
+    """`True` if the data block is a library override, `None` otherwise"""
+    
+    # Get identity ----------------------------------------------------------------------------------------------------------------
+    def as_pointer(self) -> int:
+        """Identity of the data block, see `renamePlanner.datablockKey()`"""
+        return self.address
+
+
+# An object read ##################################################################################################################
+@dataclass(eq=False)
+class ObjectHeader:
+    """
+    Name, type and relations of an object read from a .blend file. Attributes are named as those of `bpy.types.Object`, so that
+    the object can be processed by `namingTemplate` and `renamePlanner` like one in Blender, except for its collections, which
+    are not read.
+    """
+    
+    name: str
+    """Name of the object, without the ID code"""
+    
+    type: str
+    """Type of the object, see `objectTypeCodes`. Empty for objects linked from libraries, whose details are not stored."""
+    
+    address: int
+    """Address of the object in Blender's memory when the file was saved, unique within the file"""
+    
+    data: DatablockHeader = None
+    """The data of the object, if it has any"""
+    
+    parent: ObjectHeader = None
+    """The parent of the object, if it has any"""
+    
+    children: list = field(default_factory=list)
+    """Objects whose parent is this object"""
+    
+    users_collection: tuple = ()
+    """Always empty, as collections are not read"""
+    
+    library: str = None
+    """Name of the library the object is linked from, `None` if it's local"""
+    
+    override_library: bool = None
+    """`True` if the object is a library override, `None` otherwise"""
+    
+    # Get identity ----------------------------------------------------------------------------------------------------------------
+    def as_pointer(self) -> int:
+        """Identity of the object, as used by `namingTemplate` for hierarchy fields"""
+        return self.address
+
+
+# Names read from a file ##########################################################################################################
+@dataclass
+class BlendNames:
+    """
+    The objects and object data of a .blend file, as read by `readNames()`.
+    """
+    
+    version: str = ""
+    """Version of Blender the file was saved by, such as `4.2`"""
+    
+    objects: list = field(default_factory=list)
+    """All objects, including linked ones, as `ObjectHeader` objects in the order stored"""
+    
+    datablocks: list = field(default_factory=list)
+    """All object data, including linked ones and those not used by any object, as `DatablockHeader` objects"""
+    
+    # Collect names taken ---------------------------------------------------------------------------------------------------------
+    def namesByType(self) -> dict:
+        """
+        Collect the names of all data blocks by ID type, like `renamePlanner.existingNamesIn()` does in Blender.
+
+        Returns:
+            dict[str, set[str]]: Names of data blocks by ID type.
+        """
+        
+        names = {}
+        for datablock in self.datablocks:
+            names.setdefault(datablock.id_type, set()).add(datablock.name)
+        
+        return names
+
+
+# Public functions ================================================================================================================
+
+# Read names from a file ----------------------------------------------------------------------------------------------------------
+def readNames(path: str) -> BlendNames:
+    """
+    Read the names of the objects and their data from a .blend file, without Blender and without loading geometry or anything 
+    else. Only the headers of blocks are read, plus the blocks of objects and object data (which hold their names and relations 
+    only, as geometry is stored in other blocks) and the description of structures (SDNA) needed to interpret them. Other blocks 
+    are skipped without reading them.
+    
+    Files compressed with gzip are supported, and so are those compressed with Zstandard, if Python has `compression.zstd` 
+    (3.14 and later) or the `zstandard` package is installed (as in Blender). Compressed files have to be decompressed, though,
+    while skipping blocks.
+
+    Args:
+        path (str): Path to the .blend file.
+
+    Raises:
+        ValueError: If the file is not a .blend file, it's truncated, or its format is not supported.
+        OSError: If the file cannot be read.
+
+    Returns:
+        BlendNames: The names read.
+    """
+    
+    with contextlib.ExitStack() as stack:
+        stream = _open(path, stack)
+        layout = _FileLayout.read(stream, path)
+        
+        blocks = []
+        sdna = None
+        
+        while True:
+            head = stream.read(layout.headSize)
+            if len(head) < layout.headSize:
+                raise ValueError(f"'{path}' is truncated")
+            
+            code, length, address, sdnaIndex = layout.unpackHead(head)
+            
+            if code == b"ENDB":
+                break
+            
+            if code == b"DNA1":
+                sdna = _Sdna(_readExactly(stream, length, path), layout)
+            elif code in _blockCodesRead or (code[:2] in idTypeCodes and code[2:] == b"\0\0"):
+                blocks.append((code, address, sdnaIndex, _readExactly(stream, length, path)))
+            else:
+                stream.seek(length, os.SEEK_CUR)
+    
+    if sdna is None:
+        raise ValueError(f"'{path}' has no description of structures (SDNA)")
+    
+    return _interpret(blocks, sdna, layout)
+
+
+# Private functions ===============================================================================================================
+
+# Open a file ---------------------------------------------------------------------------------------------------------------------
+def _open(path: str, stack: contextlib.ExitStack):
+    """Open a .blend file for reading, decompressing it if it's compressed, and register it to be closed with the stack"""
+    
+    file = stack.enter_context(open(path, "rb"))
+    magic = file.read(4)
+    file.seek(0)
+    
+    if magic[:2] == _gzipMagic:
+        return stack.enter_context(gzip.GzipFile(fileobj=file))
+    
+    if magic == _zstdMagic:
+        return stack.enter_context(_zstdReader(file, path))
+    
+    return file
+
+# Decompress Zstandard ------------------------------------------------------------------------------------------------------------
+def _zstdReader(file, path: str):
+    """Get a stream decompressing a file compressed with Zstandard, with whichever library is available"""
+    
+    try:
+        from compression import zstd
+        return zstd.ZstdFile(file)
+    except ImportError:
+        pass
+    
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError(f"'{path}' is compressed with Zstandard, install the 'zstandard' package to read it") from None
+    
+    # Blender writes several frames to be able to seek in the file
+    return zstandard.ZstdDecompressor().stream_reader(file, read_across_frames=True)
+
+# Read a block --------------------------------------------------------------------------------------------------------------------
+def _readExactly(stream, length: int, path: str) -> bytes:
+    """Read the specified number of bytes, failing if the file ends before"""
+    
+    data = stream.read(length)
+    if len(data) < length:
+        raise ValueError(f"'{path}' is truncated")
+    
+    return data
+
+# Interpret blocks ----------------------------------------------------------------------------------------------------------------
+def _interpret(blocks: list, sdna: _Sdna, layout: _FileLayout) -> BlendNames:
+    """Make objects and data blocks of the blocks read, and resolve the pointers between them"""
+    
+    names = BlendNames(version=layout.version)
+    
+    idMembers = sdna.members("ID")
+    nameOffset, nameSize = idMembers["name"]
+    libraryOffset = idMembers["lib"][0]
+    overrideOffset = idMembers["override_library"][0] if "override_library" in idMembers else None
+    
+    libraries = {}
+    objects = []
+    datablocks = {}
+    
+    for code, address, sdnaIndex, body in blocks:
+        structName, members = sdna.struct(sdnaIndex)
+        
+        # The ID is the first member of each ID structure, but don't rely on that
+        base = 0 if structName == "ID" else members["id"][0]
+        
+        storedName = body[base + nameOffset:base + nameOffset + nameSize].split(b"\0", 1)[0]
+        idCode, name = storedName[:2], storedName[2:].decode("utf-8", errors="replace")
+        
+        if code == b"LI\0\0":
+            libraries[address] = name
+            continue
+        
+        library = layout.pointer(body, base + libraryOffset) or None
+        isOverride = True if overrideOffset is not None and layout.pointer(body, base + overrideOffset) else None
+        
+        if idCode == b"OB":
+            obj = ObjectHeader(name=name, type="", address=address, library=library, override_library=isOverride)
+            
+            # Placeholders of linked objects hold the ID only
+            if code == b"OB\0\0":
+                obj.type = objectTypeCodes.get(layout.short(body, members["type"][0]), "")
+                obj.data = layout.pointer(body, members["data"][0])
+                obj.parent = layout.pointer(body, members["parent"][0])
+            
+            objects.append(obj)
+        elif idCode in idTypeCodes:
+            datablocks[address] = DatablockHeader(
+                name=name, id_type=idTypeCodes[idCode], address=address, library=library, override_library=isOverride
+            )
+    
+    # Pointers are resolved once everything is read, as blocks can be in any order
+    objectsByAddress = {obj.address: obj for obj in objects}
+    
+    for obj in objects:
+        obj.data = datablocks.get(obj.data) if obj.data else None
+        obj.parent = objectsByAddress.get(obj.parent) if obj.parent else None
+        
+        if obj.parent is not None:
+            obj.parent.children.append(obj)
+        
+        if obj.library is not None:
+            obj.library = libraries.get(obj.library, "")
+    
+    for datablock in datablocks.values():
+        if datablock.library is not None:
+            datablock.library = libraries.get(datablock.library, "")
+    
+    names.objects = objects
+    names.datablocks = list(datablocks.values())
+    
+    return names
+
+
+# Layout of a file ################################################################################################################
+class _FileLayout:
+    """
+    Pointer size, byte order and block header format of a .blend file, as told by its file header.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, pointerSize: int, byteOrder: str, version: str, largeHeads: bool):
+        
+        self.pointerSize = pointerSize
+        """Size of pointers in bytes, 4 or 8"""
+        
+        self.byteOrder = byteOrder
+        """Byte order as in `struct` formats, `<` or `>`"""
+        
+        self.version = version
+        """Version of Blender the file was saved by, such as `4.2`"""
+        
+        # Blender 5.0 and later write 64-bit lengths, and order fields differently
+        self._head = struct.Struct(byteOrder + ("4siQqq" if largeHeads else f"4si{'Q' if pointerSize == 8 else 'I'}ii"))
+        self._largeHeads = largeHeads
+        self._pointer = struct.Struct(byteOrder + ("Q" if pointerSize == 8 else "I"))
+        self._short = struct.Struct(byteOrder + "h")
+        
+        self.headSize = self._head.size
+        """Size of block headers in bytes"""
+    
+    # Read file header ------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def read(stream, path: str) -> _FileLayout:
+        """
+        Read the file header, such as `BLENDER-v402` (saved by Blender 4.2 with 8-byte pointers in little-endian byte order) or
+        `BLENDER17-01v0500` (saved by Blender 5.0 in version 1 of the format with 17 bytes of file header).
+        """
+        
+        header = stream.read(12)
+        if len(header) < 12 or header[:7] != b"BLENDER":
+            raise ValueError(f"'{path}' is not a .blend file")
+        
+        if header[7:9].isdigit():
+            header += stream.read(int(header[7:9]) - 12)
+            if header[9:10] != b"-" or header[10:12] != b"01":
+                raise ValueError(f"'{path}' is in an unsupported format ({header.decode('ascii', errors='replace')})")
+            
+            pointerSize, byteOrder, version, largeHeads = 8, header[12:13], header[13:], True
+        else:
+            pointerSize, byteOrder, version, largeHeads = 8 if header[7:8] == b"-" else 4, header[8:9], header[9:], False
+        
+        if byteOrder not in (b"v", b"V") or not version.isdigit():
+            raise ValueError(f"'{path}' is not a .blend file")
+        
+        version = int(version)
+        return _FileLayout(pointerSize, "<" if byteOrder == b"v" else ">", f"{version // 100}.{version % 100}", largeHeads)
+    
+    # Public functions ============================================================================================================
+    
+    # Unpack a block header -------------------------------------------------------------------------------------------------------
+    def unpackHead(self, head: bytes) -> tuple:
+        """Get the code, length, address and structure index of a block from its header"""
+        
+        if self._largeHeads:
+            code, sdnaIndex, address, length, _ = self._head.unpack(head)
+        else:
+            code, length, address, sdnaIndex, _ = self._head.unpack(head)
+        
+        return code, length, address, sdnaIndex
+    
+    # Read a pointer --------------------------------------------------------------------------------------------------------------
+    def pointer(self, body: bytes, offset: int) -> int:
+        """Read a pointer from a block"""
+        return self._pointer.unpack_from(body, offset)[0]
+    
+    # Read a short integer --------------------------------------------------------------------------------------------------------
+    def short(self, body: bytes, offset: int) -> int:
+        """Read a short integer from a block"""
+        return self._short.unpack_from(body, offset)[0]
+
+
+# Description of structures #######################################################################################################
+class _Sdna:
+    """
+    The description of structures (SDNA) stored in a .blend file, telling the layout of the structures written by the version
+    of Blender which saved the file.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, body: bytes, layout: _FileLayout):
+        """
+        Parse the SDNA.
+
+        Args:
+            body (bytes): The body of the `DNA1` block.
+            layout (_FileLayout): The layout of the file.
+        """
+        
+        self._byteOrder = layout.byteOrder
+        self._pointerSize = layout.pointerSize
+        
+        if body[:4] != b"SDNA":
+            raise ValueError("Invalid description of structures (SDNA)")
+        
+        self._names, offset = self._readStrings(body, 4, b"NAME")
+        self._typeNames, offset = self._readStrings(body, offset, b"TYPE")
+        
+        self._expect(body, offset, b"TLEN")
+        self._typeSizes = struct.unpack_from(f"{self._byteOrder}{len(self._typeNames)}H", body, offset + 4)
+        offset = _align(offset + 4 + 2 * len(self._typeNames))
+        
+        self._expect(body, offset, b"STRC")
+        structCount = struct.unpack_from(self._byteOrder + "i", body, offset + 4)[0]
+        offset += 8
+        
+        self._structs = []
+        """Structures as tuples of the type index and a tuple of type and name indexes of members, by structure index"""
+        
+        for _ in range(structCount):
+            typeIndex, memberCount = struct.unpack_from(self._byteOrder + "hh", body, offset)
+            self._structs.append((typeIndex, struct.unpack_from(f"{self._byteOrder}{2 * memberCount}h", body, offset + 4)))
+            offset += 4 + 4 * memberCount
+        
+        self._structIndexes = {self._typeNames[typeIndex]: index for index, (typeIndex, _) in enumerate(self._structs)}
+        self._members = {}
+    
+    # Public functions ============================================================================================================
+    
+    # Get a structure by index ----------------------------------------------------------------------------------------------------
+    def struct(self, index: int) -> tuple:
+        """
+        Get a structure by its index, as stored in block headers.
+
+        Returns:
+            tuple: The name of the structure, and its members as returned by `members()`.
+        """
+        
+        name = self._typeNames[self._structs[index][0]]
+        return name, self.members(name)
+    
+    # Get members of a structure --------------------------------------------------------------------------------------------------
+    def members(self, structName: str) -> dict:
+        """
+        Get the offset and size of each member of a structure, computed once per structure.
+
+        Args:
+            structName (str): Name of the structure, such as `Object`.
+
+        Returns:
+            dict[str, tuple[int, int]]: Offsets and sizes of members in bytes, by bare name, such as `data` for `*data`.
+        """
+        
+        members = self._members.get(structName)
+        if members is not None:
+            return members
+        
+        if structName not in self._structIndexes:
+            raise ValueError(f"Structure '{structName}' is missing from the description of structures (SDNA)")
+        
+        members = {}
+        offset = 0
+        memberIndexes = self._structs[self._structIndexes[structName]][1]
+        
+        for typeIndex, nameIndex in zip(memberIndexes[::2], memberIndexes[1::2]):
+            name = self._names[nameIndex]
+            
+            size = self._pointerSize if name[0] in "*(" else self._typeSizes[typeIndex]
+            for dimension in re.findall(r"\[(\d+)\]", name):
+                size *= int(dimension)
+            
+            members[_memberName.match(name).group(1)] = (offset, size)
+            offset += size
+        
+        self._members[structName] = members
+        return members
+    
+    # Private functions ===========================================================================================================
+    
+    # Read a list of strings ------------------------------------------------------------------------------------------------------
+    def _readStrings(self, body: bytes, offset: int, tag: bytes) -> tuple:
+        """Read a tagged list of strings, and return them with the aligned offset following them"""
+        
+        self._expect(body, offset, tag)
+        count = struct.unpack_from(self._byteOrder + "i", body, offset + 4)[0]
+        offset += 8
+        
+        strings = []
+        for _ in range(count):
+            end = body.index(b"\0", offset)
+            strings.append(body[offset:end].decode("ascii"))
+            offset = end + 1
+        
+        return strings, _align(offset)
+    
+    # Check a tag -----------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _expect(body: bytes, offset: int, tag: bytes):
+        """Fail if the tag expected is not found"""
+        
+        if body[offset:offset + 4] != tag:
+            raise ValueError(f"Invalid description of structures (SDNA), {tag.decode()} is missing")
+
+
+# Align an offset -----------------------------------------------------------------------------------------------------------------
+def _align(offset: int) -> int:
+    """Round an offset up to a multiple of 4, as lists in SDNA are aligned"""
+    return (offset + 3) & ~3
@@ -0,0 +1,259 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for sending HTTP requests of update checks, loading an HTTP library only on first use.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+
+from __future__ import annotations
+import importlib
+import json
+import socket
+import threading
+from dataclasses import dataclass, field
+
+
+# Errors ##########################################################################################################################
+
+class HttpError(Exception):
+    """A request could not be completed, or has been answered with an error status"""
+    
+    def __init__(self, message: str, status: int = None):
+        super().__init__(message)
+        
+        self.status = status
+        """HTTP status of the response, or `None` if no response has been received"""
+
+
+class HttpTimeout(HttpError):
+    """No response has been received in time"""
+
+
+# Response ########################################################################################################################
+
+@dataclass
+class HttpResponse:
+    """
+    A response, independent of the library which has received it.
+    """
+    
+    status: int
+    """HTTP status code"""
+    
+    headers: dict = field(default_factory=dict)
+    """Headers of the response, with lowercase names"""
+    
+    body: bytes = b""
+    """Body of the response"""
+    
+    # Public functions ============================================================================================================
+    
+    # Parse the body --------------------------------------------------------------------------------------------------------------
+    def json(self):
+        """Parse the body as JSON"""
+        return json.loads(self.body.decode("utf-8"))
+    
+    # Fail for error statuses -----------------------------------------------------------------------------------------------------
+    def raiseForStatus(self):
+        """
+        Raise `HttpError` if the status is 400 or above.
+
+        Raises:
+            HttpError: If the status is 400 or above.
+        """
+        
+        if self.status >= 400:
+            raise HttpError(f"HTTP error {self.status}", status=self.status)
+
+
+# HTTP client #####################################################################################################################
+class HttpClient:
+    """
+    Sends HTTP requests with `requests` if it's installed, or with `urllib` of the standard library otherwise. `requests` pulls
+    in `urllib3`, charset detection and `ssl`, which takes noticeable time, so either library is imported on the first request 
+    instead of when the add-on is loaded. A single `requests.Session` is kept alive to reuse connections across requests.
+    
+    Safe to call from a worker thread, as it doesn't access `bpy`.
+    """
+    
+    _lock = threading.Lock()
+    """Guards the state below"""
+    
+    _requests = None
+    """The `requests` module once loaded, or `False` if it's not available"""
+    
+    _session = None
+    """Pooled `requests.Session` reused by all requests"""
+    
+    # Public functions ============================================================================================================
+    
+    # Send a JSON document --------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def postJson(url: str, payload, headers: dict = None, timeout: float = 5.0) -> HttpResponse:
+        """
+        Send a JSON document in a POST request. Responses with error statuses are returned, not raised, see 
+        `HttpResponse.raiseForStatus()`.
+
+        Args:
+            url (str): Address to send the request to.
+            payload: Document to send as JSON.
+            headers (dict, optional): Additional headers. Defaults to none.
+            timeout (float, optional): Seconds to wait for connecting and for the response. Defaults to 5.
+
+        Raises:
+            HttpTimeout: If no response is received in time.
+            HttpError: If the request cannot be sent, or no response is received.
+
+        Returns:
+            HttpResponse: The response.
+        """
+        
+        headers = dict(headers or {}, **{"Content-Type": "application/json"})
+        
+        session = HttpClient._getSession()
+        if session is not None:
+            return HttpClient._postWithRequests(session, url, payload, headers, timeout)
+        
+        return HttpClient._postWithUrllib(url, payload, headers, timeout)
+    
+    # Tell which library is used --------------------------------------------------------------------------------------------------
+    @staticmethod
+    def backend() -> str:
+        """Name of the library used to send requests, loading it if not loaded yet"""
+        return "requests" if HttpClient._getSession() is not None else "urllib"
+    
+    # Close pooled connections ----------------------------------------------------------------------------------------------------
+    @staticmethod
+    def close():
+        """Close pooled connections. A new session is made for the next request."""
+        
+        with HttpClient._lock:
+            session, HttpClient._session = HttpClient._session, None
+        
+        if session is not None:
+            try:
+                session.close()
+            except Exception:
+                pass
+    
+    # Private functions ===========================================================================================================
+    
+    # Get the pooled session ------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _getSession():
+        """Get the `requests.Session` shared by all requests, loading `requests` on first use. `None` if not installed."""
+        
+        with HttpClient._lock:
+            if HttpClient._requests is None:
+                try:
+                    HttpClient._requests = importlib.import_module("requests")
+                except ImportError:
+                    HttpClient._requests = False
+            
+            if HttpClient._requests is False:
+                return None
+            
+            if HttpClient._session is None:
+                HttpClient._session = HttpClient._requests.Session()
+                HttpClient._session.headers.update({'Connection': 'keep-alive'})
+            
+            return HttpClient._session
+    
+    # Send with requests ----------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _postWithRequests(session, url: str, payload, headers: dict, timeout: float) -> HttpResponse:
+        """Send a JSON document with `requests`, see `postJson()`"""
+        
+        exceptions = HttpClient._requests.exceptions
+        
+        try:
+            response = session.post(url, headers=headers, json=payload, timeout=timeout)
+        except exceptions.Timeout as ex:
+            raise HttpTimeout(f"No response in {timeout} s") from ex
+        except exceptions.RequestException as ex:
+            raise HttpError(str(ex)) from ex
+        
+        return HttpResponse(
+            status=response.status_code, 
+            headers={name.lower(): value for name, value in response.headers.items()}, 
+            body=response.content
+        )
+    
+    # Send with urllib ------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _postWithUrllib(url: str, payload, headers: dict, timeout: float) -> HttpResponse:
+        """Send a JSON document with `urllib`, see `postJson()`"""
+        
+        # Imported here, as `urllib.request` loads `ssl`
+        import urllib.error
+        import urllib.request
+        
+        request = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"), headers=headers, method="POST")
+        
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return HttpResponse(
+                    status=response.status, 
+                    headers={name.lower(): value for name, value in response.headers.items()}, 
+                    body=response.read()
+                )
+        except urllib.error.HTTPError as ex:
+            # Error statuses and 304 Not Modified are raised by urllib, but are responses nonetheless
+            with ex:
+                return HttpResponse(
+                    status=ex.code, 
+                    headers={name.lower(): value for name, value in ex.headers.items()}, 
+                    body=ex.read()
+                )
+        except (socket.timeout, TimeoutError) as ex:
+            raise HttpTimeout(f"No response in {timeout} s") from ex
+        except urllib.error.URLError as ex:
+            if isinstance(ex.reason, (socket.timeout, TimeoutError)):
+                raise HttpTimeout(f"No response in {timeout} s") from ex
+            raise HttpError(str(ex.reason)) from ex
+        except OSError as ex:
+            raise HttpError(str(ex)) from ex
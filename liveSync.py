@@ -0,0 +1,355 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for keeping names in sync automatically as objects are renamed or added.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+from __future__ import annotations
+import bpy
+from bpy.app.handlers import persistent
+from . import renamePlanner
+from . import objectScope
+from . import namingTemplate
+from . import runLog
+
+
+# Live synchronization ############################################################################################################
+class LiveSync:
+    """
+    Keeps data names in sync with object names in the active scene as artists rename or add objects, if enabled by 
+    `T1nkerMeshNameSynchronizerSettings.liveSync`.
+    
+    A `depsgraph_update_post` handler records which objects have been updated, and a `bpy.app.timers` callback processes them 
+    in a batch shortly after the last burst of updates. This coalesces bursts, such as pasting thousands of objects, into a 
+    single sync, and keeps renaming out of the depsgraph handler. An index of object name and data name by object tracks
+    the state after the last sync, so that only objects whose names have actually changed are processed, and updates caused 
+    by the sync itself are ignored.
+    
+    As only changed objects are processed, names are only kept in sync for naming templates depending on object names only 
+    (see `namingTemplate.dependsOnNamesOnly()`). Fields such as `{index}` would be computed for the changed objects alone, so 
+    live sync is paused for such templates.
+    """
+    
+    throttleSeconds: float = 0.25
+    """Time to wait after an update for further updates before syncing (seconds)"""
+    
+    _index: dict = {}
+    """Object name and data name of managed objects after the last sync, by object pointer"""
+    
+    _pending: set = set()
+    """Names of objects updated since the last sync"""
+    
+    _rescan: bool = True
+    """Tells whether all objects of the scene shall be checked on the next sync, such as after objects have been added"""
+    
+    _objectCount: int = -1
+    """Number of objects in the file after the last sync, to detect added and removed objects cheaply"""
+    
+    # Public functions ============================================================================================================
+    
+    # Install handlers ------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def register():
+        """
+        Install the depsgraph, file load and undo handlers. Handlers return quickly if live sync is not enabled for the scene.
+        """
+        
+        LiveSync.reset()
+        
+        if LiveSync._onDepsgraphUpdate not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(LiveSync._onDepsgraphUpdate)
+        
+        for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+            if LiveSync._onFileChanged not in handlers:
+                handlers.append(LiveSync._onFileChanged)
+    
+    # Remove handlers -------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def unregister():
+        """
+        Remove handlers and the pending timer, if any.
+        """
+        
+        if LiveSync._onDepsgraphUpdate in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(LiveSync._onDepsgraphUpdate)
+        
+        for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+            if LiveSync._onFileChanged in handlers:
+                handlers.remove(LiveSync._onFileChanged)
+        
+        if bpy.app.timers.is_registered(LiveSync._flush):
+            bpy.app.timers.unregister(LiveSync._flush)
+        
+        LiveSync.reset()
+    
+    # Forget cached state ---------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def reset():
+        """
+        Forget the index, so that the next sync checks all objects of the scene.
+        """
+        
+        LiveSync._index = {}
+        LiveSync._pending = set()
+        LiveSync._rescan = True
+        LiveSync._objectCount = -1
+    
+    # Tell if live sync can keep names in sync ------------------------------------------------------------------------------------
+    @staticmethod
+    def isSupported(settings) -> bool:
+        """
+        Tell if names formed by the settings can be kept in sync by processing changed objects only, see 
+        `namingTemplate.dependsOnNamesOnly()`.
+
+        Args:
+            settings (T1nkerMeshNameSynchronizerSettings): The scene's settings.
+
+        Returns:
+            bool: `True` if live sync can be used with the settings.
+        """
+        
+        return namingTemplate.dependsOnNamesOnly(settings.namingRule())
+    
+    # React to turning live sync on or off ----------------------------------------------------------------------------------------
+    @staticmethod
+    def onToggled(settings):
+        """
+        Sync all objects of the scene when live sync is turned on, as they may have been changed in the meantime.
+
+        Args:
+            settings (T1nkerMeshNameSynchronizerSettings): The scene's settings.
+        """
+        
+        LiveSync.reset()
+        
+        if settings.liveSync:
+            LiveSync.schedule()
+    
+    # Request a sync --------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def schedule():
+        """
+        Schedule a sync unless one is already scheduled. Subsequent requests within `throttleSeconds` are served by the same sync.
+        """
+        
+        if not bpy.app.timers.is_registered(LiveSync._flush):
+            bpy.app.timers.register(LiveSync._flush, first_interval=LiveSync.throttleSeconds)
+    
+    # Private functions ===========================================================================================================
+    
+    # Record updates --------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    @persistent
+    def _onDepsgraphUpdate(scene, depsgraph):
+        """
+        Record updated objects. Called by Blender after each depsgraph update, so this must be cheap.
+        """
+        
+        settings = getattr(scene, "T1nkerMeshNameSynchronizerSettings", None)
+        if settings is None or not settings.liveSync:
+            return
+        
+        if not depsgraph.id_type_updated('OBJECT'):
+            return
+        
+        # Updates not changing names, including those caused by the last sync, need no sync
+        index = LiveSync._index
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object):
+                obj = update.id.original
+                if index.get(obj.as_pointer()) != LiveSync._namesOf(obj):
+                    LiveSync._pending.add(obj.name)
+        
+        # Objects added or removed
+        if len(bpy.data.objects) != LiveSync._objectCount:
+            LiveSync._rescan = True
+        
+        if LiveSync._pending or LiveSync._rescan:
+            LiveSync.schedule()
+    
+    # Forget everything when a file is loaded or changed by undo ------------------------------------------------------------------
+    @staticmethod
+    @persistent
+    def _onFileChanged(*args):
+        """
+        Forget the index when a file is loaded, or undo or redo is performed, as object pointers and names may no longer be
+        valid.
+        """
+        
+        LiveSync.reset()
+    
+    # Sync in a batch -------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _flush():
+        """
+        Timer callback syncing the objects updated since the last sync.
+
+        Returns:
+            None to run only once.
+        """
+        
+        context = bpy.context
+        settings = getattr(context.scene, "T1nkerMeshNameSynchronizerSettings", None)
+        if settings is None or not settings.liveSync:
+            LiveSync._pending = set()
+            return None
+        
+        pending = LiveSync._pending
+        LiveSync._pending = set()
+        
+        if LiveSync._rescan:
+            LiveSync._rescan = False
+            objects = objectScope.iterObjects(context, 'SCENE', settings.objectTypes)
+        else:
+            allowedTypes = set(settings.objectTypes)
+            objects = (
+                obj for obj in (bpy.data.objects.get(name) for name in pending) 
+                if obj is not None and obj.type in allowedTypes
+            )
+        
+        # Only process objects whose object or data name has changed since the last sync
+        index = LiveSync._index
+        changed = [obj for obj in objects if index.get(obj.as_pointer()) != LiveSync._namesOf(obj)]
+        
+        LiveSync._objectCount = len(bpy.data.objects)
+        
+        if not changed:
+            return None
+        
+        # Invalid templates (such as while being edited) and those depending on more than object names are not synced
+        if not LiveSync.isSupported(settings):
+            return None
+        
+        # Shared datablocks are named after one of their users as per the shared data policy, like in runs, so all users count
+        changed = LiveSync._withUsersSharingData(changed, context, settings)
+        
+        plan, _ = renamePlanner.planObjects(
+            changed, 
+            settings.targetNameFunction(), 
+            lambda idTypes: renamePlanner.existingNamesIn(bpy.data, idTypes), 
+            settings.datablockKinds, 
+            settings.collisionPolicy, 
+            settings.sharedDataPolicy
+        )
+        
+        # A datablock failing to be renamed must not stop the others, nor break the handler
+        failures = renamePlanner.FailedWrites()
+        renamePlanner.applyPlan(plan, failures)
+        
+        for obj in changed:
+            index[obj.as_pointer()] = LiveSync._namesOf(obj)
+        
+        with runLog.RunLog(level=runLog.INFO if settings.isVerbose else runLog.WARNING, sampleSize=settings.logSampleSize) as log:
+            if log.wants(runLog.INFO):
+                for candidate in plan.renames:
+                    if id(candidate) not in failures.errors:
+                        log.record(runLog.INFO, "LIVE RENAMED", "{type} of '{object}': '{name}' --> '{to}'",
+                                   object=candidate.ownerName, type=candidate.idType, name=candidate.currentName, 
+                                   to=candidate.finalName)
+            
+            for candidate, error in failures.errors.values():
+                log.record(runLog.ERROR, "RENAME FAILED", "{type} of '{object}': '{name}' could not be renamed: {error}",
+                           object=candidate.ownerName, type=candidate.idType, name=candidate.currentName, error=error)
+            
+            log.summarizeOmitted()
+        
+        return None
+    
+    # Add objects sharing data ----------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _withUsersSharingData(objects: list, context, settings) -> list:
+        """
+        Add the objects of the scene sharing a datablock with any of some objects, so that they are planned together, and 
+        `renamePlanner.mergeSharedDatablocks()` picks the same object to name the datablock after as a run does. The scene is 
+        only scanned if any of the datablocks has several users.
+
+        Args:
+            objects (list[bpy.types.Object]): The objects to sync.
+            context (bpy.types.Context): The context.
+            settings (T1nkerMeshNameSynchronizerSettings): The scene's settings.
+
+        Returns:
+            list[bpy.types.Object]: The objects, followed by those sharing their data, if any.
+        """
+        
+        getters = renamePlanner.datablockGettersFor(settings.datablockKinds)
+        
+        def keysOf(obj) -> set:
+            datablocks = (getDatablock(obj) for _, getDatablock in getters)
+            return {renamePlanner.datablockKey(datablock) for datablock in datablocks if datablock is not None}
+        
+        shared = set()
+        for obj in objects:
+            for _, getDatablock in getters:
+                datablock = getDatablock(obj)
+                if datablock is not None and datablock.users > 1:
+                    shared.add(renamePlanner.datablockKey(datablock))
+        
+        if not shared:
+            return objects
+        
+        included = {obj.as_pointer() for obj in objects}
+        return objects + [
+            obj for obj in objectScope.iterObjects(context, 'SCENE', settings.objectTypes)
+            if obj.as_pointer() not in included and not shared.isdisjoint(keysOf(obj))
+        ]
+    
+    # Get names to index ----------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _namesOf(obj) -> tuple:
+        """
+        Get the names tracked of an object.
+
+        Args:
+            obj (bpy.types.Object): The object.
+
+        Returns:
+            tuple: The name of the object, and that of its data, or `None` if it has no data.
+        """
+        
+        data = obj.data
+        return (obj.name, data.name if data is not None else None)
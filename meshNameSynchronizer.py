@@ -47,10 +47,20 @@
 #
 # *********************************************************************************************************************************
 
-from datetime import datetime
+import time
 import bpy
 from . import updateChecker
-from bpy.props import StringProperty, BoolProperty, PointerProperty
+from . import renamePlanner
+from . import objectScope
+from . import liveSync
+from . import runStats
+from . import namingTemplate
+from . import planCache
+from . import renameJournal
+from . import syncRun
+from . import syncApi
+from . import renameManifest
+from bpy.props import StringProperty, BoolProperty, PointerProperty, EnumProperty, IntProperty
 from bpy.types import Operator, AddonPreferences, PropertyGroup
 
 
@@ -77,14 +87,83 @@ class T1nkerMeshNameSynchronizerSettings(PropertyGroup):
     A suffix for the mesh name. This is appended after the parent object's name. Leave empty to not add anything.
     """
     
-    meshesOnly: BoolProperty(
-        name="Apply only to meshes, leave others",
-        description="Check to sync only mesh names, clear to include cameras, lights etc.",
-        default=False
+    nameTemplate: StringProperty(
+        name="Name template",
+        description="How to form mesh names. Fields: " + ", ".join(f"{{{field}}}: {text}" for field, text in namingTemplate.fields.items()),
+        default=namingTemplate.defaultTemplate
+    ) # type: ignore
+    """
+    Template of mesh names, such as `{prefix}{object}{suffix}`. See `namingTemplate.fields` for fields available.
+    """
+    
+    namePattern: StringProperty(
+        name="Replace in object name",
+        description="Regular expression to replace in object names before using them as {object}, such as \\.\\d+$ to drop numbering. Leave empty to use names as they are",
+        default=""
+    ) # type: ignore
+    """
+    Regular expression to replace in object names for the `{object}` field. Leave empty to use names as they are.
+    """
+    
+    nameReplacement: StringProperty(
+        name="Replace with",
+        description="What to replace matches with, where \\1 refers to the first group",
+        default=""
+    ) # type: ignore
+    """
+    Replacement of matches of `namePattern`, as in Python's `re.sub()`.
+    """
+    
+    collisionPolicy: EnumProperty(
+        name="If name is taken",
+        description="What to do if the name a mesh shall get is already taken by another one",
+        items=renamePlanner.collisionPolicies,
+        default='NUMBER'
     ) # type: ignore
     """
-    If `True`, only meshes of objects of the mesh type will be processed, otherwise data blocks of everything,
-    such as cameras and lights.
+    Tells how to resolve collisions, that is, when the name to give is already taken. See `renamePlanner.collisionPolicies`.
+    """
+    
+    sharedDataPolicy: EnumProperty(
+        name="Shared meshes",
+        description="Which object to name a mesh after if it's shared by several objects (linked duplicates)",
+        items=renamePlanner.sharedDataPolicies,
+        default='KEEP_MATCHING'
+    ) # type: ignore
+    """
+    Tells which object to name a shared mesh after. See `renamePlanner.sharedDataPolicies`.
+    """
+    
+    scope: EnumProperty(
+        name="Objects to process",
+        description="Where to look for objects whose data shall be renamed",
+        items=objectScope.scopeModes,
+        default='SELECTION'
+    ) # type: ignore
+    """
+    Where to look for objects to process. See `objectScope.scopeModes`.
+    """
+    
+    objectTypes: EnumProperty(
+        name="Object types",
+        description="Types of objects to process. Data of other objects is left as is",
+        items=objectScope.objectTypes,
+        options={'ENUM_FLAG'},
+        default=set(objectScope.allObjectTypes)
+    ) # type: ignore
+    """
+    Set of object types to process, such as meshes, cameras and lights. See `objectScope.objectTypes`.
+    """
+    
+    datablockKinds: EnumProperty(
+        name="Data to rename",
+        description="Kinds of data blocks of objects to name after the objects, all in a single pass",
+        items=renamePlanner.datablockKinds,
+        options={'ENUM_FLAG'},
+        default={'DATA'}
+    ) # type: ignore
+    """
+    Set of kinds of datablocks to rename, such as the object data and the first material. See `renamePlanner.datablockKinds`.
     """
 
     isVerbose: BoolProperty(
@@ -98,13 +177,100 @@ class T1nkerMeshNameSynchronizerSettings(PropertyGroup):
     
     isTestOnly: BoolProperty(        
         name="Just a test", 
-        description="Don't do anything, just show what you would do",
+        description="Don't do anything, just show what you would do. To apply the changes, run again with this unchecked, " \
+            "which reuses the plan (runs can't be adjusted via Adjust Last Operation)",
         default=False
     ) # type: ignore    
     """
     Controls if actions are actually taken or just simulated.
     """
     
+    logSampleSize: IntProperty(
+        name="Max. lines per kind",
+        description="Maximum number of lines to show in the System Console per kind of message, 0 for no limit. The rest is counted only",
+        default=100,
+        min=0
+    ) # type: ignore
+    """
+    Maximum number of log lines to show per category. See `runLog.RunLog`.
+    """
+    
+    reportFilePath: StringProperty(
+        name="Report file",
+        description="Write a detailed report of each object processed to this file (JSON Lines). Leave empty to not write any",
+        subtype='FILE_PATH',
+        default=""
+    ) # type: ignore
+    """
+    Path of a JSON Lines file to write all log records to, regardless of verbosity and sampling. Empty to not write one.
+    """
+    
+    manifestFilePath: StringProperty(
+        name="Manifest file",
+        description="Write a manifest of all renames to this file as they are performed, to replay them on other files or " \
+            "revert them later with Replay/Revert Rename Manifest. Leave empty to not write any",
+        subtype='FILE_PATH',
+        default=""
+    ) # type: ignore
+    """
+    Path of a file to stream all writes of a run to, see `renameManifest.ManifestWriter`. Empty to not write one.
+    """
+    
+    useRenameJournal: BoolProperty(
+        name="Revert via journal instead of undo",
+        description="Don't make an undo step, which is a snapshot of the whole file, but keep a journal of renames in memory " \
+            "to revert the last runs with Revert Last Mesh Name Sync. Saves memory in huge files. Note that undoing an " \
+            "operation made before such a run also undoes its renames",
+        default=False
+    ) # type: ignore
+    """
+    If `True`, runs don't make undo steps, but journal their renames to revert them. See `renameJournal.RenameJournal`.
+    """
+    
+    useNameIndex: BoolProperty(
+        name="Remember objects in sync",
+        description="Remember objects in sync in the scene, and skip them in later runs as long as their names don't change. " \
+            "Not used if names depend on collections or the order of objects",
+        default=False
+    ) # type: ignore
+    """
+    If `True`, objects in sync are remembered in a custom property of the scene and skipped in later runs until they change.
+    See `nameIndex.NameIndex`.
+    """
+    
+    showProgress: BoolProperty(
+        name="Show progress",
+        description="Run in steps between updates of the UI, showing progress. Press ESC to cancel, names already written " \
+            "are kept consistent and can be reverted",
+        default=True
+    ) # type: ignore
+    """
+    If `True`, runs started from the UI are performed in slices between UI updates, showing progress and letting the user
+    cancel them. See `syncRun.SyncRun`.
+    """
+    
+    isProfiling: BoolProperty(
+        name="Profile run",
+        description="Save a cProfile profile and a tracemalloc memory snapshot of the run to the folder of the report file, " \
+            "or to the temporary folder. Makes the run considerably slower",
+        default=False
+    ) # type: ignore
+    """
+    If `True`, the run is profiled and profiling results are saved. See `runStats.RunProfiler`.
+    """
+    
+    liveSync: BoolProperty(
+        name="Live sync",
+        description="Keep data names of objects in this scene in sync automatically as you rename or add objects. Only works "
+                    "with templates using {prefix}, {suffix}, {object} and {type} only",
+        default=False,
+        update=lambda self, context: liveSync.LiveSync.onToggled(self)
+    ) # type: ignore
+    """
+    If `True`, data names are synchronized automatically when objects of the scene are renamed or added. 
+    See `liveSync.LiveSync`.
+    """
+    
     everInitialized: BoolProperty(        
         name="Already initialized", 
         description="",
@@ -114,6 +280,61 @@ class T1nkerMeshNameSynchronizerSettings(PropertyGroup):
     This is not intended for the UI. This stores whether the add-on has been initialized for the scene or not, to get
     default values set in add-on preferences.
     """
+    
+    # Public functions ============================================================================================================
+    
+    # Migrate settings of earlier versions ----------------------------------------------------------------------------------------
+    def migrateLegacySettings(self):
+        """
+        Convert settings saved by earlier versions of the add-on, which are left in the file as ID properties. Currently, 
+        `meshesOnly` (whether to process meshes only) is turned into `objectTypes`. Settings converted are removed, so calling 
+        this again does nothing.
+        """
+        
+        meshesOnly = self.get("meshesOnly")
+        if meshesOnly is None:
+            return
+        
+        if meshesOnly:
+            self.objectTypes = {'MESH'}
+        
+        del self["meshesOnly"]
+    
+    # Get the naming rule ---------------------------------------------------------------------------------------------------------
+    def namingRule(self) -> namingTemplate.NamingRule:
+        """
+        Take a snapshot of the settings determining names.
+
+        Returns:
+            namingTemplate.NamingRule: The settings as plain values.
+        """
+        
+        return namingTemplate.NamingRule(
+            template=self.nameTemplate, 
+            prefix=self.prefix, 
+            suffix=self.suffix, 
+            pattern=self.namePattern, 
+            replacement=self.nameReplacement
+        )
+    
+    # Get the naming function -----------------------------------------------------------------------------------------------------
+    def targetNameFunction(self, objects=None):
+        """
+        Get a function computing the name an object's data shall get. Settings are read and the template is compiled once, 
+        so that calling the function for many objects does not access them again. Get a new function for each run.
+
+        Args:
+            objects (Iterable[bpy.types.Object], optional): All objects of the file, to find siblings of objects in a single
+                pass. See `namingTemplate.compileRule()`. Defaults to none.
+
+        Raises:
+            ValueError: If the template or the regular expression is invalid.
+
+        Returns:
+            Callable[[bpy.types.Object], str]: The function.
+        """
+        
+        return namingTemplate.compileRule(self.namingRule(), objects)
         
 
 # Addon preferences ###############################################################################################################
@@ -155,8 +376,13 @@ class T1nkerMeshNameSynchronizerAddonPreferences(AddonPreferences):
         layout.label(text="Default settings")                
         layout.prop(self.settings, "prefix")        
         layout.prop(self.settings, "suffix")
+        layout.prop(self.settings, "nameTemplate")
+        layout.prop(self.settings, "namePattern")
+        layout.prop(self.settings, "nameReplacement")
         
         # Log verbosity and test mode is intentionally not added
+        
+        layout.prop(self.updateInfo, "checkForUpdates")
                 
         # Update available button
         #
@@ -164,8 +390,8 @@ class T1nkerMeshNameSynchronizerAddonPreferences(AddonPreferences):
         try: # to see if we know anything about updates
             updateInfo = context.preferences.addons[__package__].preferences.updateInfo
             
-            # Note that checking update is part of executing the main operator, that is, performing at least
-            # one synchronization. Until that no updates will be detected. Updates are not checked each time
+            # Note that checking update is started in the background when the add-on is registered or the main operator's
+            # dialog is shown. Until the check completes no updates will be detected. Updates are not checked each time
             # this dialog is drawn, but as set in `updateInfo.T1nkerMeshNameSynchronizerUpdateInfo.checkFrequencyDays`.
             if updateInfo.updateAvailable:
                 # Draw update button and tip
@@ -185,6 +411,12 @@ class T1nkerMeshNameSynchronizerAddonPreferences(AddonPreferences):
 class T1NKER_OT_MeshNameSynchronizer(Operator):    
     """
     Synchronize mesh names with parent object names
+    
+    The operator doesn't have the `UNDO` option, but makes an undo step itself, and only if names have been written without
+    the rename journal (see `syncRun.SyncRun.needsUndoStep`), so that test runs, runs with nothing to rename and journaled runs
+    don't take a snapshot of the whole file. The trade-off is that Blender doesn't offer the Adjust Last Operation panel to 
+    redo runs, which needs the `UNDO` option. Run again instead, such as after a test run, which reuses the plan of the last 
+    run, see `planCache.PlanCache`.
     """
     
     # Properties ==================================================================================================================
@@ -193,11 +425,18 @@ class T1NKER_OT_MeshNameSynchronizer(Operator):
     bl_idname = "t1nker.meshnamesynchronizer"
     bl_label = "Synchronize Mesh Names (T1nk-R Utils)"
     bl_description = "Synchronize mesh names with parent object names"
-    bl_options = {'REGISTER', 'UNDO'}    
+    bl_options = {'REGISTER'}    
     bl_location = "Outliner"
     bl_space_type = "OUTLINER"
     bl_region_type = "WINDOW"
     bl_category = "T1nk-R Utils"
+    
+    # Running in slices -----------------------------------------------------------------------------------------------------------
+    timerStepSeconds = 0.01
+    """Interval of timer events performing slices of a run, see `modal()`"""
+    
+    timeSliceSeconds = 0.016
+    """Time budget of a slice of a run, about a frame at 60 Hz, see `modal()`"""
         
     # Lifecycle management ========================================================================================================
     
@@ -211,6 +450,19 @@ class T1NKER_OT_MeshNameSynchronizer(Operator):
         """
         Copy of the operator settings specific to the Blender file (scene)
         """
+        
+        self.stats: runStats.RunStats = None
+        """
+        Timing and counts of the last run of `execute()`
+        """
+        
+        self.updateCheckSeconds = 0.0
+        """
+        Time spent requesting an update check in `invoke()`
+        """
+        
+        self._run: syncRun.SyncRun = None
+        self._timer = None
             
     # Public functions ============================================================================================================
         
@@ -254,6 +506,16 @@ class T1NKER_OT_MeshNameSynchronizer(Operator):
         
         box.row().prop(self.settings, "prefix")
         box.row().prop(self.settings, "suffix")        
+        box.row().prop(self.settings, "nameTemplate")
+        box.row().prop(self.settings, "namePattern")
+        box.row().prop(self.settings, "nameReplacement")
+        
+        templateError = namingTemplate.validationError(self.settings.namingRule())
+        if templateError:
+            box.row().label(text=templateError, icon='ERROR')
+        
+        box.row().prop(self.settings, "collisionPolicy")
+        box.row().prop(self.settings, "sharedDataPolicy")
         
         # Setting scope
         #
@@ -263,7 +525,11 @@ class T1NKER_OT_MeshNameSynchronizer(Operator):
         # Fix that heading specified above is not shown
         box.row().label(text="Scope")
         
-        box.row().prop(self.settings, "meshesOnly")  
+        box.row().prop(self.settings, "scope")
+        box.row().label(text="Object types")
+        box.grid_flow(columns=3, even_columns=True).prop(self.settings, "objectTypes")
+        box.row().label(text="Data to rename")
+        box.grid_flow(columns=2, even_columns=True).prop(self.settings, "datablockKinds")
         
         # Operation settings
         #
@@ -275,6 +541,19 @@ class T1NKER_OT_MeshNameSynchronizer(Operator):
         
         box.row().prop(self.settings, "isTestOnly")  
         box.row().prop(self.settings, "isVerbose")
+        box.row().prop(self.settings, "logSampleSize")
+        box.row().prop(self.settings, "reportFilePath")
+        box.row().prop(self.settings, "manifestFilePath")
+        box.row().prop(self.settings, "showProgress")
+        box.row().prop(self.settings, "isProfiling")
+        box.row().prop(self.settings, "liveSync")
+        if self.settings.liveSync and not liveSync.LiveSync.isSupported(self.settings):
+            box.row().label(text="Live sync is paused, the template uses fields other than object names", icon='INFO')
+        box.row().prop(self.settings, "useRenameJournal")
+        box.row().prop(self.settings, "useNameIndex")
+        
+        if renameJournal.RenameJournal.hasEntries():
+            box.row().operator(T1NKER_OT_MeshNameSynchronizerRevert.bl_idname, icon='LOOP_BACK')
         
         # Help and update buttons
         #
@@ -297,8 +576,8 @@ class T1NKER_OT_MeshNameSynchronizer(Operator):
         try:
             updateInfo = context.preferences.addons[__package__].preferences.updateInfo
             
-            # Note that checking update is part of executing the main operator, that is, performing at least
-            # one synchronization. Until that no updates will be detected. Updates are not checked each time
+            # Note that checking update is started in the background when the add-on is registered or the main operator's
+            # dialog is shown. Until the check completes no updates will be detected. Updates are not checked each time
             # this dialog is drawn, but as set in `updateInfo.T1nkerMeshNameSynchronizerUpdateInfo.checkFrequencyDays`.
             if updateInfo.updateAvailable:
                 # Update button            
@@ -330,13 +609,28 @@ class T1NKER_OT_MeshNameSynchronizer(Operator):
         """
         
         self.settings = context.scene.T1nkerMeshNameSynchronizerSettings
+        self.settings.migrateLegacySettings()
         
         # For first run in the session, load default settings
         if not self.settings.everInitialized:
             self.settings.prefix = context.preferences.addons[__package__].preferences.settings.prefix
             self.settings.suffix = context.preferences.addons[__package__].preferences.settings.suffix
+            self.settings.nameTemplate = context.preferences.addons[__package__].preferences.settings.nameTemplate
+            self.settings.namePattern = context.preferences.addons[__package__].preferences.settings.namePattern
+            self.settings.nameReplacement = context.preferences.addons[__package__].preferences.settings.nameReplacement
             self.settings.everInitialized = True
-            
+        
+        # Check for updates time to time, as specified in `updateInfo.T1nkerMeshNameSynchronizerUpdateInfo.checkFrequencyDays`.
+        # The check runs in the background and at most once per session, so this returns immediately.
+        updateCheckStarted = time.perf_counter()
+        try:
+            updateChecker.BackgroundUpdateChecker.requestCheck(context)
+        except:
+            # Don't mess up anything if update checking doesn't work, just ignore the error
+            pass
+        finally:
+            # Reported as part of the statistics of `execute()`
+            self.updateCheckSeconds = time.perf_counter() - updateCheckStarted
  
         # Show dialog
         result = context.window_manager.invoke_props_dialog(self, width=400)
@@ -346,110 +640,278 @@ class T1NKER_OT_MeshNameSynchronizer(Operator):
 
     # Perform the operation -------------------------------------------------------------------------------------------------------
     def execute(self, context):              
-        # sourcery skip: extract-method, hoist-similar-statement-from-if, merge-else-if-into-elif, remove-redundant-fstring, swap-nested-ifs
         """
-        Execute the operation
+        Execute the operation with a snapshot of the scene's settings. When run from the UI with progress shown, the run is 
+        performed in slices between UI updates, see `modal()`, otherwise at once via `syncApi.synchronize()`.
 
         Args:
             context (bpy.types.Context): A context object passed on by Blender for the current context.
 
         Returns:
-            {'FINISHED'} or {'ERROR'}, indicating success or failure of the operation.
+            {'FINISHED'}, {'CANCELLED'} or {'RUNNING_MODAL'}, see `syncRun.SyncRun.status`.
         """
         
-        # Call the update checker to check for updates time to time, as specified in 
-        # `updateInfo.T1nkerMeshNameSynchronizerUpdateInfo.checkFrequencyDays`
-        try:
-            bpy.ops.t1nker.meshnamesynchronizerupdatechecker(forceUpdateCheck = True)            
-        except:
-            # Don't mess up anything if update checking doesn't work, just ignore the error
-            pass
+        # Note that update checking is intentionally not performed here, see `invoke()`
+        
+        self.settings = context.scene.T1nkerMeshNameSynchronizerSettings
         
-        operationStarted = f"{datetime.strftime(datetime.now(), '%Y-%m-%d %H:%M:%S')}"
+        settings = syncApi.SyncSettings.fromSettings(self.settings, showLog=True)
+        objects = objectScope.iterObjects(context, settings.scope, settings.objectTypes)
         
-        status = {}
-        meshesRenamed = 0
-        numberOfObjects = 0
+        if not self.settings.showProgress or context.window is None or bpy.app.background:
+            result = syncApi.synchronize(objects, settings, context, report=self.report, updateCheckSeconds=self.updateCheckSeconds)
+            self.stats = result.stats
+            
+            if result.needsUndoStep:
+                bpy.ops.ed.undo_push(message=self.bl_label)
+            
+            return result.status
         
-        self.settings = context.scene.T1nkerMeshNameSynchronizerSettings
+        self._run = syncRun.SyncRun(context, settings, objects, report=self.report, updateCheckSeconds=self.updateCheckSeconds)
+        self.stats = self._run.stats
         
-        print("")
-        print("")
-        print(f"=" * 80)
-        print(f"T1nk-R Mesh Name Synchronizer started ({operationStarted})")
-        print(f"-" * 80)        
-        print("")
+        windowManager = context.window_manager
         
-        if self.settings.isTestOnly:
-            print(f"Operating in test mode, nothing will actually be changed")
+        self._timer = windowManager.event_timer_add(self.timerStepSeconds, window=context.window)
+        windowManager.modal_handler_add(self)
+        windowManager.progress_begin(0, 100)
+        context.workspace.status_text_set("Synchronizing data names, press ESC to cancel")
+        
+        return {'RUNNING_MODAL'}
+
+
+    # Perform the operation in slices ---------------------------------------------------------------------------------------------
+    def modal(self, context, event):
+        """
+        Perform a slice of the run on each timer event, and cancel it on ESC.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+            event: The event to handle, as passed on by Blender.
+
+        Returns:
+            {'RUNNING_MODAL'} until the run is complete, then {'FINISHED'} or {'CANCELLED'}, see `syncRun.SyncRun.status`.
+        """
+        
+        if event.type == 'ESC':
+            self._run.cancel()
+        elif event.type != 'TIMER' or event.timer != self._timer:
+            # Block other events, the scene must not change under the run
+            return {'RUNNING_MODAL'}
+        
+        isComplete = self._run.step(self.timeSliceSeconds)
+        context.window_manager.progress_update(int(self._run.progress * 100))
+        
+        if not isComplete:
+            return {'RUNNING_MODAL'}
+        
+        context.window_manager.event_timer_remove(self._timer)
+        context.window_manager.progress_end()
+        context.workspace.status_text_set(None)
+        
+        if self._run.needsUndoStep:
+            bpy.ops.ed.undo_push(message=self.bl_label)
+        
+        return self._run.status
+
+
+# Operator reverting the last run #################################################################################################
+class T1NKER_OT_MeshNameSynchronizerRevert(Operator):    
+    """
+    Revert the renames of the last run made with the rename journal, see `renameJournal.RenameJournal`
+    """
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.meshnamesynchronizerrevert"
+    bl_label = "Revert Last Mesh Name Sync (T1nk-R Utils)"
+    bl_description = "Revert the renames of the last run of the synchronizer made without undo, via the rename journal"
+    bl_options = {'REGISTER'}    
+    bl_category = "T1nk-R Utils"
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run, that is, if there's anything to revert.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            True if the operator can run.
+        """
+        
+        return renameJournal.RenameJournal.hasEntries()
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context):
+        """
+        Revert the renames of the last journaled run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            {'FINISHED'}, or {'CANCELLED'} if nothing has been reverted.
+        """
+        
+        reverted, failed = renameJournal.RenameJournal.revertLast(bpy.data)
+        
+        # Names reverted are no longer what a cached plan expects
+        planCache.PlanCache.clear()
+        
+        if failed > 0:
+            self.report({'WARNING'}, f"Reverted {reverted} rename(s), {failed} could not be reverted as names have changed since")
         else:
-            print(f"Operating in production mode, requested changes will apply")        
+            self.report({'INFO'}, f"Reverted {reverted} rename(s)")
+        
+        return {'FINISHED'} if reverted > 0 else {'CANCELLED'}
+
+
+# Operator replaying a rename manifest ############################################################################################
+class T1NKER_OT_MeshNameSynchronizerReplayManifest(Operator):    
+    """
+    Rename datablocks as recorded in a rename manifest, see `renameManifest.replay()`
+    """
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.meshnamesynchronizerreplaymanifest"
+    bl_label = "Replay Rename Manifest (T1nk-R Utils)"
+    bl_description = "Rename data blocks of this file as recorded in a rename manifest written by the synchronizer"
+    bl_options = {'REGISTER'}    
+    bl_category = "T1nk-R Utils"
+    
+    # Other properties ------------------------------------------------------------------------------------------------------------
+    filepath: StringProperty(subtype='FILE_PATH', default="") # type: ignore
+    """Path of the manifest"""
+    
+    filter_glob: StringProperty(default="*.jsonl;*.json", options={'HIDDEN'}) # type: ignore
+    """Files to show in the file browser"""
+    
+    # Public functions ============================================================================================================
+    
+    # Choose the file -------------------------------------------------------------------------------------------------------------
+    def invoke(self, context, event):
+        """
+        Show the file browser to choose the manifest.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+            event: The event triggering the operation, as passed on by Blender.
+
+        Returns:
+            {'RUNNING_MODAL'}.
+        """
         
-        if self.settings.isVerbose:
-            if self.settings.meshesOnly:
-                print(f"\t- Processing only mesh objects")
-            else:
-                print(f"\t- Processing all kinds of objects")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context):
+        """
+        Replay the manifest.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            {'FINISHED'}, or {'CANCELLED'} if nothing has been renamed.
+        """
         
-        print("")
+        return _replayManifest(self, self.filepath, inverse=False)
 
-        try:
-            # Grab selected objects            
-            objects = [i for i in bpy.context.selected_ids if isinstance(i, bpy.types.Object)]
-            
-            # Narrow down to mesh objects if requested so
-            if self.settings.meshesOnly:
-                objects = [o for o in objects if o.type == "MESH"]
-                
-            numberOfObjects = len(objects)
 
-            # Iterate selected objects
-            for obj in objects:            
-                
-                # Only process objects with data blocks (meshes), and ignore linked items
-                if obj.data:
-                    # Construct mesh name
-                    meshName = self.settings.prefix + obj.name + self.settings.suffix
-                    
-                    if obj.data.name == meshName:
-                        if self.settings.isVerbose or self.settings.isTestOnly:
-                            print(f"- NEEDS NO CHANGE...: Mesh of '{obj.name}': '{obj.data.name}'")
-                    else:
-                        if self.settings.isTestOnly:
-                            print(f"+ WOULD RENAME......: Mesh of '{obj.name}': '{obj.data.name}' --> '{meshName}'")
-                        else:
-                            obj.data.name = meshName                            
-                            if self.settings.isVerbose:
-                                print(f"+ RENAMED...........: Mesh of '{obj.name}': '{obj.data.name}' --> '{meshName}'")
-                else:
-                    if self.settings.isVerbose or self.settings.isTestOnly:
-                        print(f"- IGNORED...........: '{obj.name}' is ignored for having no mesh")
-
-            status = {'FINISHED'}
-        
-        except Exception as ex:            
-            print(f"{ex}")
-            self.report({'ERROR'}, f"{ex}")
-            status = {'CANCELLED'}
-        
-        finally: # Print some summary
-            # Leave here instead of moving toward the end of the try block as some things might have been changed
-            # even if an error occurred afterwards
-            summary = \
-                f"No mesh has been renamed for a total of {numberOfObjects} object(s)" \
-                if meshesRenamed == 0 else \
-                f"Renamed {meshesRenamed} meshes(s) for a total of {numberOfObjects} object(s)" \
-            
-            self.report({'INFO'}, summary)
-            
-            print("")
-            print(f"-" * 80)        
-            print(summary)
-            print(f"-" * 80)
-            print(f"T1nk-R Mesh Name Synchronizer finished")                                            
-            print(f"=" * 80)
-            print("")
+# Operator reverting a rename manifest ############################################################################################
+class T1NKER_OT_MeshNameSynchronizerRevertManifest(Operator):    
+    """
+    Revert the renames recorded in a rename manifest, see `renameManifest.replay()`
+    """
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.meshnamesynchronizerrevertmanifest"
+    bl_label = "Revert Rename Manifest (T1nk-R Utils)"
+    bl_description = "Revert the renames recorded in a rename manifest written by the synchronizer, in reverse order"
+    bl_options = {'REGISTER'}    
+    bl_category = "T1nk-R Utils"
+    
+    # Other properties ------------------------------------------------------------------------------------------------------------
+    filepath: StringProperty(subtype='FILE_PATH', default="") # type: ignore
+    """Path of the manifest"""
+    
+    filter_glob: StringProperty(default="*.jsonl;*.json", options={'HIDDEN'}) # type: ignore
+    """Files to show in the file browser"""
+    
+    # Public functions ============================================================================================================
+    
+    # Choose the file -------------------------------------------------------------------------------------------------------------
+    def invoke(self, context, event):
+        """
+        Show the file browser to choose the manifest.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+            event: The event triggering the operation, as passed on by Blender.
+
+        Returns:
+            {'RUNNING_MODAL'}.
+        """
         
-        return status
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
     
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context):
+        """
+        Revert the manifest.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
 
+        Returns:
+            {'FINISHED'}, or {'CANCELLED'} if nothing has been renamed.
+        """
+        
+        return _replayManifest(self, self.filepath, inverse=True)
+
+
+# Private functions ===============================================================================================================
+
+# Replay or revert a manifest -----------------------------------------------------------------------------------------------------
+def _replayManifest(operator: Operator, path: str, inverse: bool) -> set:
+    """
+    Replay or revert a manifest for an operator, and report the outcome.
+
+    Args:
+        operator (bpy.types.Operator): The operator to report with.
+        path (str): Path of the manifest, may be relative to the .blend file.
+        inverse (bool): Revert the manifest instead of replaying it.
+
+    Returns:
+        set: {'FINISHED'}, or {'CANCELLED'} if nothing has been renamed.
+    """
+    
+    action = "Reverted" if inverse else "Replayed"
+    
+    try:
+        performed, skipped = renameManifest.replay(bpy.data, bpy.path.abspath(path), inverse=inverse)
+    except (OSError, ValueError) as ex:
+        operator.report({'ERROR'}, f"{ex}")
+        return {'CANCELLED'}
+    
+    # Names changed are no longer what a cached plan expects
+    planCache.PlanCache.clear()
+    
+    if skipped > 0:
+        operator.report({'WARNING'}, f"{action} {performed} rename(s), skipped {skipped} as names differ from the manifest")
+    else:
+        operator.report({'INFO'}, f"{action} {performed} rename(s)")
+    
+    return {'FINISHED'} if performed > 0 else {'CANCELLED'}
@@ -0,0 +1,254 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for remembering objects in sync to skip them in later runs until they change.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+
+from __future__ import annotations
+import dataclasses
+import json
+import zlib
+from typing import Iterable
+from . import renamePlanner
+
+
+# Constants =======================================================================================================================
+
+propertyName = "T1nkerMeshNameSynchronizerIndex"
+"""Name of the custom property of the scene storing the index"""
+
+formatVersion = 1
+"""Version of the format of the index, included in the checksum so that indexes of other versions are not used"""
+
+
+# Public functions ================================================================================================================
+
+# Compute checksum of settings ----------------------------------------------------------------------------------------------------
+def settingsChecksum(rule, kinds: Iterable, collisionPolicy: str, sharedDataPolicy: str) -> str:
+    """
+    Compute a checksum of the settings determining names, which is the same in each session (unlike `hash()`).
+
+    Args:
+        rule (namingTemplate.NamingRule): The naming rule.
+        kinds (Iterable[str]): Kinds of datablocks to rename, see `renamePlanner.datablockKinds`.
+        collisionPolicy (str): The collision policy.
+        sharedDataPolicy (str): The shared data policy.
+
+    Returns:
+        str: The checksum.
+    """
+    
+    text = json.dumps([formatVersion, dataclasses.astuple(rule), sorted(kinds), collisionPolicy, sharedDataPolicy])
+    return f"{zlib.crc32(text.encode('utf-8')):08x}"
+
+
+# Index of objects in sync ########################################################################################################
+class NameIndex:
+    """
+    Remembers the names of objects whose datablocks have been found or made in sync, with the names of those datablocks, and
+    stores them in a custom property of the scene as a compact JSON string. In later runs with the same settings, objects whose
+    own name and datablock names are still the same are skipped without computing names and planning. Objects added, renamed 
+    or linked to other data since don't match and are processed.
+    
+    Only datablocks used by a single object are remembered, so that all objects sharing a datablock are always processed
+    together (and a new object linked to a datablock makes its other users processed too, as the number of users changes).
+    The index is only valid for naming rules depending on object names only, see `namingTemplate.dependsOnNamesOnly()`.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, checksum: str, kinds: Iterable, entries: dict = None):
+        """
+        Make an index.
+
+        Args:
+            checksum (str): Checksum of the settings, see `settingsChecksum()`.
+            kinds (Iterable[str]): Kinds of datablocks to rename, see `renamePlanner.datablockKinds`.
+            entries (dict, optional): Entries loaded. Defaults to none.
+        """
+        
+        self.checksum = checksum
+        """Checksum of the settings the index is valid for"""
+        
+        self.entries = entries if entries is not None else {}
+        """Names of datablocks (or `None` if having none) of each kind, in the order of `kinds`, by object name"""
+        
+        self.skipped = 0
+        """Number of objects skipped by `changedObjects()` so far"""
+        
+        self._getters = renamePlanner.datablockGettersFor(kinds)
+        """Kinds and functions getting the datablocks of the kind"""
+    
+    # Load the index of a scene ---------------------------------------------------------------------------------------------------
+    @staticmethod
+    def load(scene, checksum: str, kinds: Iterable) -> NameIndex:
+        """
+        Load the index stored in a scene. If there's none, or it has been made with other settings, an empty index is returned.
+
+        Args:
+            scene (bpy.types.Scene): The scene.
+            checksum (str): Checksum of the current settings, see `settingsChecksum()`.
+            kinds (Iterable[str]): Kinds of datablocks to rename, see `renamePlanner.datablockKinds`.
+
+        Returns:
+            NameIndex: The index.
+        """
+        
+        blob = scene.get(propertyName)
+        entries = None
+        
+        if isinstance(blob, str):
+            try:
+                content = json.loads(blob)
+            except ValueError:
+                content = None
+            
+            if isinstance(content, dict) and content.get("checksum") == checksum and isinstance(content.get("entries"), dict):
+                entries = content["entries"]
+        
+        return NameIndex(checksum, kinds, entries)
+    
+    # Public functions ============================================================================================================
+    
+    # Filter objects --------------------------------------------------------------------------------------------------------------
+    def changedObjects(self, objects: Iterable):
+        """
+        Skip objects unchanged since they have been found or made in sync. The number of objects skipped is counted in
+        `skipped`.
+
+        Args:
+            objects (Iterable[bpy.types.Object]): The objects.
+
+        Yields:
+            bpy.types.Object: Objects to process.
+        """
+        
+        entries = self.entries
+        getters = self._getters
+        
+        for obj in objects:
+            entry = entries.get(obj.name)
+            
+            if entry is not None and len(entry) == len(getters) and self._isUnchanged(obj, entry):
+                self.skipped += 1
+                continue
+            
+            yield obj
+    
+    # Update the index ------------------------------------------------------------------------------------------------------------
+    def update(self, candidates: list, ignored: list, plan: renamePlanner.RenamePlan):
+        """
+        Remember objects in sync after a plan has been applied, and forget those not in sync.
+
+        Args:
+            candidates (list[renamePlanner.RenameCandidate]): Candidates of the run, as returned by `renamePlanner.snapshot()`.
+            ignored (list[str]): Names of objects having no datablock of the kinds, as returned by `renamePlanner.snapshot()`.
+            plan (renamePlanner.RenamePlan): The plan applied.
+        """
+        
+        finalNames = {candidate.key: candidate.finalName for candidate in plan.renames}
+        namesByObject = {}
+        
+        for candidate in candidates:
+            inSync = candidate.currentName == candidate.targetName or finalNames.get(candidate.key) == candidate.targetName
+            
+            # A datablock shared by several objects may be named after another object if processed alone
+            names = namesByObject.setdefault(candidate.ownerName, {})
+            names[candidate.kind] = candidate.targetName if inSync and candidate.datablock.users == 1 else False
+        
+        for objName, names in namesByObject.items():
+            if False in names.values():
+                self.entries.pop(objName, None)
+            else:
+                self.entries[objName] = [names.get(kind) for kind, _ in self._getters]
+        
+        for objName in ignored:
+            self.entries[objName] = [None] * len(self._getters)
+    
+    # Forget objects no longer existing -------------------------------------------------------------------------------------------
+    def prune(self, objectNames: Iterable):
+        """
+        Forget objects no longer existing.
+
+        Args:
+            objectNames (Iterable[str]): Names of existing objects.
+        """
+        
+        existing = set(objectNames)
+        self.entries = {objName: entry for objName, entry in self.entries.items() if objName in existing}
+    
+    # Store the index -------------------------------------------------------------------------------------------------------------
+    def save(self, scene):
+        """
+        Store the index in a custom property of a scene.
+
+        Args:
+            scene (bpy.types.Scene): The scene.
+        """
+        
+        scene[propertyName] = json.dumps({"checksum": self.checksum, "entries": self.entries}, separators=(",", ":"))
+    
+    # Private functions ===========================================================================================================
+    
+    # Tell if an object is unchanged ----------------------------------------------------------------------------------------------
+    def _isUnchanged(self, obj, entry: list) -> bool:
+        """
+        Tell if the datablocks of an object still have the names remembered, and are still used by the object only.
+        """
+        
+        for (_, getDatablock), name in zip(self._getters, entry):
+            datablock = getDatablock(obj)
+            
+            if datablock is None:
+                if name is not None:
+                    return False
+            elif datablock.name != name or datablock.users != 1:
+                return False
+        
+        return True
@@ -0,0 +1,488 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for compiling naming templates to functions computing the names data shall get.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+
+from __future__ import annotations
+import functools
+import itertools
+import re
+import string
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+
+# Constants =======================================================================================================================
+
+defaultTemplate = "{prefix}{object}{suffix}"
+"""The template giving data the name of their object, with the prefix and suffix"""
+
+fields = {
+    "prefix": "The prefix specified",
+    "suffix": "The suffix specified",
+    "object": "Name of the object, after replacing the regular expression if specified",
+    "collection": "Name of the first collection the object is in",
+    "type": "Type of the object, such as MESH",
+    "index": "Number of the object in the run, starting from 1, such as {index:03d} for 001",
+    "parent": "Name of the parent of the object, empty if it has none",
+    "root": "Name of the topmost ancestor of the object, or of the object itself if it has no parent",
+    "depth": "Number of ancestors of the object, 0 if it has no parent",
+    "sibling_index": "Number of the object among the children of its parent (or among objects without a parent in its " \
+        "collection) in the order of names, starting from 1, such as {sibling_index:02d} for 01"
+}
+"""Fields available in templates, with their descriptions"""
+
+_nameOnlyFields = {"prefix", "suffix", "object", "type"}
+"""Fields whose value doesn't change as long as the name of the object doesn't (as the type of an object is fixed)"""
+
+_objectFieldGetters = {
+    "collection": lambda obj: obj.users_collection[0].name if len(obj.users_collection) > 0 else "",
+    "type": lambda obj: obj.type
+}
+"""Functions getting the value of fields depending only on the object. `object` and `index` are handled separately."""
+
+_hierarchyFields = {"parent", "root", "depth", "sibling_index"}
+"""Fields depending on the hierarchy of objects, computed via `_Hierarchy`"""
+
+
+# Naming rule #####################################################################################################################
+@dataclass(frozen=True)
+class NamingRule:
+    """
+    Snapshot of the settings determining names, as plain values, so that they are not read from Blender properties for each 
+    object. Compile with `compileRule()`.
+    """
+    
+    template: str = defaultTemplate
+    """The template, with fields listed in `fields` in the syntax of `str.format()`"""
+    
+    prefix: str = ""
+    """Value of the `prefix` field"""
+    
+    suffix: str = ""
+    """Value of the `suffix` field"""
+    
+    pattern: str = ""
+    """Regular expression to replace in object names for the `object` field, empty to use names as they are"""
+    
+    replacement: str = ""
+    """Replacement of matches of `pattern`, as in `re.sub()`"""
+
+
+# Public functions ================================================================================================================
+
+# Compile a naming rule -----------------------------------------------------------------------------------------------------------
+def compileRule(rule: NamingRule, objects: Iterable = None) -> Callable:
+    """
+    Compile a naming rule to a function computing the name an object's data shall get. The template is parsed and the regular
+    expression is compiled only once (and cached for later runs), fields not depending on the object (such as the prefix) are
+    formatted in advance, and only fields used are computed for each object.
+    
+    Each function has its own counter for the `index` field, and its own memo of the hierarchy for hierarchy fields (see 
+    `_Hierarchy`), so compile the rule once per run.
+
+    Args:
+        rule (NamingRule): The rule.
+        objects (Iterable[bpy.types.Object], optional): All objects of the file, to find siblings in a single pass over them
+            for the `sibling_index` field. Defaults to none, meaning to look up the children of each parent instead, which is
+            better if only a few objects are named.
+
+    Raises:
+        ValueError: If the template or the regular expression is invalid.
+
+    Returns:
+        Callable[[bpy.types.Object], str]: The function.
+    """
+    
+    pieces = _parse(rule.template)
+    
+    objectName = _objectNameGetter(rule.pattern, rule.replacement)
+    constants = {"prefix": rule.prefix, "suffix": rule.suffix}
+    counter = itertools.count(1)
+    hierarchy = _Hierarchy(objects)
+    
+    # Form a format string with positional fields for values depending on the object, and with everything else substituted
+    formatString = ""
+    getters = []
+    samples = []
+    
+    for literal, fieldName, spec, conversion in pieces:
+        formatString += _escape(literal)
+        
+        if fieldName is None:
+            continue
+        
+        if fieldName in constants:
+            formatString += _escape(format(_convert(constants[fieldName], conversion), spec))
+            continue
+        
+        if fieldName == "object":
+            getter = objectName
+        elif fieldName == "index":
+            getter = lambda obj: next(counter)
+        elif fieldName in _hierarchyFields:
+            getter = getattr(hierarchy, _hierarchyGetterNames[fieldName])
+        else:
+            getter = _objectFieldGetters[fieldName]
+        
+        formatString += f"{{{len(getters)}{'!' + conversion if conversion else ''}{':' + spec if spec else ''}}}"
+        getters.append(getter)
+        samples.append(1 if fieldName in ("index", "depth", "sibling_index") else "sample")
+    
+    # Fail now instead of for the first object if format specifications don't match values, such as `{object:03d}`
+    try:
+        formatString.format(*samples)
+    except (ValueError, TypeError) as ex:
+        raise ValueError(f"Invalid naming template '{rule.template}': {ex}") from ex
+    
+    # The most common cases, such as the default template, need no formatting
+    if not getters:
+        name = formatString.format()
+        return lambda obj: name
+    
+    if len(getters) == 1 and getters[0] is objectName and formatString.count("{0}") == 1:
+        head, tail = (part.format() for part in formatString.split("{0}"))
+        return lambda obj: head + objectName(obj) + tail
+    
+    formatName = formatString.format
+    return lambda obj: formatName(*[getter(obj) for getter in getters])
+
+# Validate a naming rule ----------------------------------------------------------------------------------------------------------
+def validationError(rule: NamingRule) -> str:
+    """
+    Tell what is wrong with a naming rule, if anything.
+
+    Args:
+        rule (NamingRule): The rule.
+
+    Returns:
+        str: The error message, or an empty string if the rule is valid.
+    """
+    
+    try:
+        compileRule(rule)
+    except ValueError as ex:
+        return str(ex)
+    
+    return ""
+
+
+# Tell if names depend on object names only ---------------------------------------------------------------------------------------
+def dependsOnNamesOnly(rule: NamingRule) -> bool:
+    """
+    Tell if the names a rule forms only change if object names change, and not, for example, if objects are moved to another
+    collection or processed in another order.
+
+    Args:
+        rule (NamingRule): The rule.
+
+    Returns:
+        bool: `True` if names depend on object names only, `False` otherwise or if the template is invalid.
+    """
+    
+    try:
+        return usedFields(rule) <= _nameOnlyFields
+    except ValueError:
+        return False
+
+# Get fields used -----------------------------------------------------------------------------------------------------------------
+def usedFields(rule: NamingRule) -> frozenset:
+    """
+    Get the fields a rule's template uses.
+
+    Args:
+        rule (NamingRule): The rule.
+
+    Raises:
+        ValueError: If the template is invalid.
+
+    Returns:
+        frozenset[str]: Names of the fields used, see `fields`.
+    """
+    
+    return frozenset(fieldName for _, fieldName, _, _ in _parse(rule.template) if fieldName is not None)
+
+
+# Hierarchy of objects ############################################################################################################
+class _Hierarchy:
+    """
+    Memo of the hierarchy of objects for a run, so that hierarchy fields are computed in linear time even for deeply nested 
+    objects. The root and depth of each object is derived from those of its parent and remembered, so each parent chain is 
+    walked only once. Siblings are found and sorted once per parent, or all at once in a single pass over all objects, if
+    specified.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, objects: Iterable = None):
+        """
+        Make an empty memo.
+
+        Args:
+            objects (Iterable[bpy.types.Object], optional): All objects of the file to find siblings among. Defaults to none.
+        """
+        
+        self._objects = objects
+        self._ancestry = {}
+        self._siblingIndexes = {}
+    
+    # Public functions ============================================================================================================
+    
+    # Get the name of the parent --------------------------------------------------------------------------------------------------
+    def parent(self, obj) -> str:
+        """Value of the `parent` field"""
+        return obj.parent.name if obj.parent is not None else ""
+    
+    # Get the name of the root ----------------------------------------------------------------------------------------------------
+    def root(self, obj) -> str:
+        """Value of the `root` field"""
+        return self._rootAndDepth(obj)[0]
+    
+    # Get the depth ---------------------------------------------------------------------------------------------------------------
+    def depth(self, obj) -> int:
+        """Value of the `depth` field"""
+        return self._rootAndDepth(obj)[1]
+    
+    # Get the number among siblings -----------------------------------------------------------------------------------------------
+    def siblingIndex(self, obj) -> int:
+        """Value of the `sibling_index` field"""
+        
+        groupKey = _siblingGroupKey(obj)
+        indexes = self._siblingIndexes.get(groupKey)
+        
+        if indexes is None:
+            if self._objects is not None:
+                self._indexAllSiblings()
+            else:
+                self._siblingIndexes[groupKey] = _numberByName(_siblingsOf(obj))
+            
+            indexes = self._siblingIndexes.get(groupKey, {})
+        
+        return indexes.get(obj.as_pointer(), 1)
+    
+    # Private functions ===========================================================================================================
+    
+    # Get root and depth ----------------------------------------------------------------------------------------------------------
+    def _rootAndDepth(self, obj) -> tuple:
+        """Get the name of the root and the depth of an object, walking up only until an ancestor already known"""
+        
+        ancestry = self._ancestry
+        
+        known = ancestry.get(obj.as_pointer())
+        if known is not None:
+            return known
+        
+        # Collect ancestors not known yet, iteratively to support any depth
+        chain = []
+        node = obj
+        known = None
+        while node is not None:
+            known = ancestry.get(node.as_pointer())
+            if known is not None:
+                break
+            chain.append(node)
+            node = node.parent
+        
+        # Derive each from its parent, from the top down
+        for node in reversed(chain):
+            known = (known[0], known[1] + 1) if known is not None else (node.name, 0)
+            ancestry[node.as_pointer()] = known
+        
+        return known
+    
+    # Index all siblings ----------------------------------------------------------------------------------------------------------
+    def _indexAllSiblings(self):
+        """Group all objects by parent (or collection) in a single pass, and number each group by name"""
+        
+        groups = {}
+        for obj in self._objects:
+            groups.setdefault(_siblingGroupKey(obj), []).append(obj)
+        
+        for groupKey, siblings in groups.items():
+            self._siblingIndexes[groupKey] = _numberByName(siblings)
+        
+        # Don't index again, even if asked for an object not among all objects
+        self._objects = None
+
+
+_hierarchyGetterNames = {"parent": "parent", "root": "root", "depth": "depth", "sibling_index": "siblingIndex"}
+"""Functions of `_Hierarchy` computing each hierarchy field"""
+
+
+# Private functions ===============================================================================================================
+
+# Parse a template ----------------------------------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=32)
+def _parse(template: str) -> tuple:
+    """
+    Parse a template and check its fields.
+
+    Args:
+        template (str): The template.
+
+    Raises:
+        ValueError: If the template is invalid or contains an unknown field.
+
+    Returns:
+        tuple: Tuples of literal text, field name, format specification and conversion, as by `string.Formatter.parse()`.
+    """
+    
+    try:
+        pieces = tuple(string.Formatter().parse(template))
+    except ValueError as ex:
+        raise ValueError(f"Invalid naming template '{template}': {ex}") from ex
+    
+    for _, fieldName, spec, conversion in pieces:
+        if fieldName is None:
+            continue
+        
+        if fieldName not in fields:
+            raise ValueError(
+                f"Unknown field '{{{fieldName}}}' in naming template '{template}', use any of " + 
+                ", ".join(f"{{{name}}}" for name in fields)
+            )
+        
+        if "{" in spec:
+            raise ValueError(f"Nested fields are not supported in naming template '{template}'")
+        
+        if conversion not in (None, "s", "r", "a"):
+            raise ValueError(f"Invalid conversion '!{conversion}' in naming template '{template}'")
+    
+    return pieces
+
+# Compile a regular expression ----------------------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=32)
+def _compileRegex(pattern: str) -> re.Pattern:
+    """
+    Compile a regular expression.
+
+    Args:
+        pattern (str): The regular expression.
+
+    Raises:
+        ValueError: If the regular expression is invalid.
+
+    Returns:
+        re.Pattern: The compiled regular expression.
+    """
+    
+    try:
+        return re.compile(pattern)
+    except re.error as ex:
+        raise ValueError(f"Invalid regular expression '{pattern}': {ex}") from ex
+
+# Get the object name getter ------------------------------------------------------------------------------------------------------
+def _objectNameGetter(pattern: str, replacement: str) -> Callable:
+    """
+    Get a function computing the value of the `object` field.
+
+    Args:
+        pattern (str): Regular expression to replace in object names, empty to use names as they are.
+        replacement (str): Replacement of matches of `pattern`.
+
+    Returns:
+        Callable[[bpy.types.Object], str]: The function.
+    """
+    
+    if not pattern:
+        return lambda obj: obj.name
+    
+    substitute = _compileRegex(pattern).sub
+    
+    # Fail now if the replacement refers to groups not in the pattern, by substituting an empty match of the same groups
+    try:
+        emptyMatch = re.compile(f"(?:{pattern})?")
+    except re.error:
+        # Such as if the pattern starts with global flags, the replacement is checked when first used
+        emptyMatch = None
+    
+    if emptyMatch is not None:
+        try:
+            emptyMatch.sub(replacement, "", count=1)
+        except (re.error, IndexError) as ex:
+            raise ValueError(f"Invalid replacement '{replacement}': {ex}") from ex
+    
+    return lambda obj: substitute(replacement, obj.name)
+
+# Identify siblings ---------------------------------------------------------------------------------------------------------------
+def _siblingGroupKey(obj) -> tuple:
+    """Key of the siblings of an object: its parent, or its first collection if it has no parent"""
+    
+    if obj.parent is not None:
+        return ("PARENT", obj.parent.as_pointer())
+    
+    return ("COLLECTION", obj.users_collection[0].as_pointer() if len(obj.users_collection) > 0 else 0)
+
+# Get siblings --------------------------------------------------------------------------------------------------------------------
+def _siblingsOf(obj) -> list:
+    """Get the siblings of an object, including itself"""
+    
+    if obj.parent is not None:
+        return list(obj.parent.children)
+    
+    if len(obj.users_collection) == 0:
+        return [obj]
+    
+    return [sibling for sibling in obj.users_collection[0].objects if sibling.parent is None]
+
+# Number objects by name ----------------------------------------------------------------------------------------------------------
+def _numberByName(objects: list) -> dict:
+    """Number objects in the order of their names starting from 1, by pointer"""
+    return {obj.as_pointer(): number for number, obj in enumerate(sorted(objects, key=lambda obj: obj.name), 1)}
+
+# Convert a value -----------------------------------------------------------------------------------------------------------------
+def _convert(value, conversion: str):
+    """Apply a conversion such as `!r` of a format field"""
+    return value if not conversion else {"s": str, "r": repr, "a": ascii}[conversion](value)
+
+# Escape braces -------------------------------------------------------------------------------------------------------------------
+def _escape(text: str) -> str:
+    """Escape braces of text to include in a format string literally"""
+    return text.replace("{", "{{").replace("}", "}}")
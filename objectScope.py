@@ -0,0 +1,229 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for finding the objects to process.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+from __future__ import annotations
+from typing import Iterable, Iterator
+
+
+# Constants =======================================================================================================================
+
+scopeModes = [
+    ('SELECTION', "Selected in Outliner", "Process objects selected in the Outliner"),
+    ('COLLECTION', "Active collection", "Process objects of the active collection and all its child collections"),
+    ('VIEW_LAYER', "View layer", "Process objects of the active view layer"),
+    ('SCENE', "Scene", "Process objects of the active scene, including those excluded from the view layer"),
+    ('FILE', "Whole file", "Process all objects of the Blender file, even those not linked to any scene")
+]
+"""
+Where to look for objects to process. Items are in the format expected by `bpy.props.EnumProperty`.
+"""
+
+objectTypes = [
+    ('MESH', "Mesh", "Mesh objects"),
+    ('CURVE', "Curve", "Curve objects"),
+    ('SURFACE', "Surface", "Surface objects"),
+    ('META', "Metaball", "Metaball objects"),
+    ('FONT', "Text", "Text objects"),
+    ('CURVES', "Hair curves", "Hair curves objects"),
+    ('POINTCLOUD', "Point cloud", "Point cloud objects"),
+    ('VOLUME', "Volume", "Volume objects"),
+    ('GPENCIL', "Grease Pencil", "Grease Pencil objects"),
+    ('GREASEPENCIL', "Grease Pencil v3", "Grease Pencil v3 objects"),
+    ('ARMATURE', "Armature", "Armature objects"),
+    ('LATTICE', "Lattice", "Lattice objects"),
+    ('LIGHT', "Light", "Light objects"),
+    ('LIGHT_PROBE', "Light probe", "Light probe objects"),
+    ('CAMERA', "Camera", "Camera objects"),
+    ('SPEAKER', "Speaker", "Speaker objects"),
+    ('EMPTY', "Empty", "Empty objects (they have no data, so they are always ignored)")
+]
+"""
+Object types that can be selected for processing. Items are in the format expected by `bpy.props.EnumProperty` with the 
+`ENUM_FLAG` option.
+"""
+
+allObjectTypes = frozenset(item[0] for item in objectTypes)
+"""
+All object types, meaning no filtering by type.
+"""
+
+
+# Public functions ================================================================================================================
+
+# Get objects in scope ------------------------------------------------------------------------------------------------------------
+def iterObjects(context, scope: str = 'SELECTION', allowedTypes: Iterable = allObjectTypes) -> Iterator:
+    """
+    Lazily enumerate the objects in scope, each one only once, even if it's reached via several collections or collection 
+    instances. Nothing is collected into lists, so that processing can start with the first object even in huge files.
+
+    Args:
+        context (bpy.types.Context): A context object passed on by Blender for the current context.
+        scope (str, optional): One of the keys in `scopeModes`. Defaults to `'SELECTION'`.
+        allowedTypes (Iterable[str], optional): Object types to include, see `objectTypes`. Defaults to all types.
+
+    Returns:
+        Iterator[bpy.types.Object]: The objects in scope.
+    """
+    
+    if scope == 'FILE':
+        # Objects are unique in the file, no need to track visited ones
+        objects = context.blend_data.objects
+    elif scope == 'SCENE':
+        objects = _walkCollections([context.scene.collection])
+    elif scope == 'VIEW_LAYER':
+        objects = _unique(_withInstances(context.view_layer.objects))
+    elif scope == 'COLLECTION':
+        objects = _walkCollections([context.collection or context.scene.collection])
+    else:
+        objects = _unique(_selectedObjects(context))
+    
+    return filterTypes(objects, allowedTypes)
+
+# Filter objects by type ----------------------------------------------------------------------------------------------------------
+def filterTypes(objects: Iterable, allowedTypes: Iterable = allObjectTypes) -> Iterator:
+    """
+    Lazily enumerate the objects of the allowed types.
+
+    Args:
+        objects (Iterable[bpy.types.Object]): The objects.
+        allowedTypes (Iterable[str], optional): Object types to include, see `objectTypes`. Defaults to all types.
+
+    Returns:
+        Iterator[bpy.types.Object]: The objects of the allowed types.
+    """
+    
+    allowedTypes = frozenset(allowedTypes)
+    if allowedTypes >= allObjectTypes:
+        return iter(objects)
+    
+    return (obj for obj in objects if obj.type in allowedTypes)
+
+
+# Private functions ===============================================================================================================
+
+# Get selected objects ------------------------------------------------------------------------------------------------------------
+def _selectedObjects(context) -> Iterator:
+    """
+    Enumerate objects selected in the Outliner. Outside the Outliner, objects selected in the viewport are used.
+    """
+    
+    selectedIds = getattr(context, "selected_ids", None)
+    if selectedIds is None:
+        yield from context.selected_objects
+        return
+    
+    for selectedId in selectedIds:
+        if getattr(selectedId, "id_type", None) == 'OBJECT':
+            yield selectedId
+
+# Include objects of instanced collections ----------------------------------------------------------------------------------------
+def _withInstances(objects: Iterable) -> Iterator:
+    """
+    Enumerate the objects, and the objects of collections instanced by them, recursively.
+    """
+    
+    instanced = []
+    
+    for obj in objects:
+        yield obj
+        
+        if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None:
+            instanced.append(obj.instance_collection)
+    
+    if instanced:
+        yield from _walkCollections(instanced)
+
+# Walk collection trees -----------------------------------------------------------------------------------------------------------
+def _walkCollections(roots: list) -> Iterator:
+    """
+    Enumerate objects of the collections, their child collections and the collections instanced by their objects, each 
+    object and collection only once. Uses an explicit stack to cope with deep hierarchies.
+    """
+    
+    visitedCollections = set()
+    visitedObjects = set()
+    stack = list(roots)
+    
+    while stack:
+        collection = stack.pop()
+        
+        key = collection.as_pointer()
+        if key in visitedCollections:
+            continue
+        visitedCollections.add(key)
+        
+        for obj in collection.objects:
+            key = obj.as_pointer()
+            if key in visitedObjects:
+                continue
+            visitedObjects.add(key)
+            
+            yield obj
+            
+            if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None:
+                stack.append(obj.instance_collection)
+        
+        stack.extend(collection.children)
+
+# Drop duplicates -----------------------------------------------------------------------------------------------------------------
+def _unique(objects: Iterable) -> Iterator:
+    """
+    Enumerate the objects, skipping those already enumerated.
+    """
+    
+    visited = set()
+    
+    for obj in objects:
+        key = obj.as_pointer()
+        if key in visited:
+            continue
+        visited.add(key)
+        
+        yield obj
@@ -0,0 +1,206 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for reusing the rename plan of a previous run if nothing relevant has changed since.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+
+from __future__ import annotations
+from . import renamePlanner
+
+
+# Public functions ================================================================================================================
+
+# Compute fingerprint of planning inputs ------------------------------------------------------------------------------------------
+def fingerprint(candidates: list, blendData, collisionPolicy: str, sharedDataPolicy: str) -> int:
+    """
+    Compute a cheap fingerprint of everything a plan depends on: the identity, kind, current and target name of each 
+    datablock to process, the name and identity of the object it belongs to (which decides who names a shared datablock, see
+    `renamePlanner.mergeSharedDatablocks()`), the policies, and the number of existing datablocks of the types involved. Names of datablocks 
+    not processed are not included, those are checked by `isApplicable()` before a plan is reused.
+
+    Args:
+        candidates (list[renamePlanner.RenameCandidate]): Candidates as returned by `renamePlanner.snapshot()`.
+        blendData (bpy.types.BlendData): The Blender file's data, typically `bpy.data`.
+        collisionPolicy (str): The collision policy to plan with.
+        sharedDataPolicy (str): The shared data policy to plan with.
+
+    Returns:
+        int: The fingerprint.
+    """
+    
+    idTypes = sorted({candidate.idType for candidate in candidates})
+    counts = tuple(
+        len(getattr(blendData, renamePlanner.datablockCollections.get(idType, ""), None) or ()) for idType in idTypes
+    )
+    
+    return hash((
+        collisionPolicy,
+        sharedDataPolicy,
+        tuple(idTypes),
+        counts,
+        tuple(
+            (candidate.key, candidate.kind, candidate.currentName, candidate.targetName, candidate.ownerName, candidate.ownerKey) 
+            for candidate in candidates
+        )
+    ))
+
+# Tell if a plan can still be applied ---------------------------------------------------------------------------------------------
+def isApplicable(plan: renamePlanner.RenamePlan, blendData) -> bool:
+    """
+    Tell if all names a plan writes are either free or held by datablocks the plan renames (and thus vacates) itself, and if
+    all collisions of the plan still exist, that is, each target name found taken (and numbered or skipped because of that) 
+    is still taken by a datablock or claimed by another candidate of the plan. A datablock not processed may have been renamed
+    or removed since planning without changing the fingerprint, freeing a name the plan avoids. Only the names written and 
+    collided with are looked up, which is much cheaper than indexing all existing names for planning.
+
+    Args:
+        plan (renamePlanner.RenamePlan): The plan.
+        blendData (bpy.types.BlendData): The Blender file's data, typically `bpy.data`.
+
+    Returns:
+        bool: `True` if the plan can be applied as is.
+    """
+    
+    plannedKeys = {candidate.key for candidate, _ in plan.steps}
+    
+    for candidate, name in plan.steps:
+        collection = getattr(blendData, renamePlanner.datablockCollections.get(candidate.idType, ""), None)
+        if collection is None:
+            continue
+        
+        holder = collection.get(name)
+        if holder is not None and renamePlanner.datablockKey(holder) not in plannedKeys:
+            return False
+    
+    if not plan.collisions:
+        return True
+    
+    claimed = {(candidate.idType, candidate.finalName) for candidate in plan.renames + plan.collisions if candidate.finalName}
+    
+    for candidate in plan.collisions:
+        collection = getattr(blendData, renamePlanner.datablockCollections.get(candidate.idType, ""), None)
+        if collection is None:
+            continue
+        
+        if collection.get(candidate.collidesWith) is None and (candidate.idType, candidate.collidesWith) not in claimed:
+            return False
+    
+    return True
+
+
+# Cache of the last plan ##########################################################################################################
+class PlanCache:
+    """
+    Keeps the plan of the last run with the fingerprint of its inputs, so that a run following a test run with the same 
+    settings (or running again after undoing the last run) does not plan again. Only one plan is kept, as runs rarely 
+    alternate between scopes.
+    
+    This is a static class, there's no need to make instances.
+    """
+    
+    # Properties ==================================================================================================================
+    
+    _fingerprint = None
+    """Fingerprint of the inputs of the cached plan"""
+    
+    _plan = None
+    """The cached plan"""
+    
+    # Public functions ============================================================================================================
+    
+    # Get a cached plan -----------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def get(fingerprint: int, candidates: list) -> renamePlanner.RenamePlan:
+        """
+        Get the cached plan if it was made for the same inputs. Datablock references of the plan are replaced by those of
+        `candidates`, as references kept from an earlier run may have been invalidated by Blender, such as by undo.
+
+        Args:
+            fingerprint (int): Fingerprint of the current inputs, see `fingerprint()`.
+            candidates (list[renamePlanner.RenameCandidate]): Candidates of the current run.
+
+        Returns:
+            renamePlanner.RenamePlan: The plan, or `None` if there is no plan for the inputs.
+        """
+        
+        if PlanCache._plan is None or fingerprint != PlanCache._fingerprint:
+            return None
+        
+        plan = PlanCache._plan
+        datablocks = {candidate.key: candidate.datablock for candidate in candidates}
+        
+        for candidate in plan.renames + plan.inSync + plan.collisions:
+            datablock = datablocks.get(candidate.key)
+            if datablock is None:
+                PlanCache.clear()
+                return None
+            candidate.datablock = datablock
+        
+        return plan
+    
+    # Cache a plan ----------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def store(fingerprint: int, plan: renamePlanner.RenamePlan):
+        """
+        Cache a plan, replacing the one cached earlier.
+
+        Args:
+            fingerprint (int): Fingerprint of the inputs of the plan, see `fingerprint()`.
+            plan (renamePlanner.RenamePlan): The plan.
+        """
+        
+        PlanCache._fingerprint = fingerprint
+        PlanCache._plan = plan
+    
+    # Forget the cached plan ------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def clear():
+        """Forget the cached plan, such as when a file is loaded"""
+        
+        PlanCache._fingerprint = None
+        PlanCache._plan = None
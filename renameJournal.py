@@ -0,0 +1,189 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for journaling renames to be able to revert them without Blender's undo.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+
+from __future__ import annotations
+from typing import Iterator
+from . import renamePlanner
+
+
+# Journal of renames ##############################################################################################################
+class RenameJournal:
+    """
+    Keeps the renames of the last few runs in memory, as ID type, name before and name after for each write, so that a run
+    can be reverted without Blender's undo, which stores a snapshot of the whole file. Renames are reverted in reverse order,
+    so that names vacated by later writes are available again, which makes reverting swaps work too.
+    
+    This is a static class, there's no need to make instances.
+    """
+    
+    # Properties ==================================================================================================================
+    
+    maxRuns = 10
+    """Number of runs to keep"""
+    
+    _runs = []
+    """Runs, oldest first, each being a list of `(idType, nameBefore, nameAfter)` tuples in the order of writing"""
+    
+    # Public functions ============================================================================================================
+    
+    # Apply a plan and journal its writes -----------------------------------------------------------------------------------------
+    @staticmethod
+    def applyPlan(plan: renamePlanner.RenamePlan) -> int:
+        """
+        Apply a plan like `renamePlanner.applyPlan()` does, and journal its writes as a new run. Writes performed before an 
+        error are journaled too.
+
+        Args:
+            plan (renamePlanner.RenamePlan): The plan.
+
+        Returns:
+            int: Number of datablocks renamed.
+        """
+        
+        RenameJournal.applySteps(plan)
+        return len(plan.renames)
+    
+    # Apply part of a plan and journal its writes ---------------------------------------------------------------------------------
+    @staticmethod
+    def applySteps(plan: renamePlanner.RenamePlan, start: int = 0, stop: int = None) -> int:
+        """
+        Perform some of the writes of a plan like `renamePlanner.applySteps()` does, and journal them. Writes starting at
+        the beginning of the plan make a new run, others are added to the last run. Writes performed before an error are 
+        journaled too.
+
+        Args:
+            plan (renamePlanner.RenamePlan): The plan.
+            start (int, optional): Index of the first step to perform. Defaults to 0.
+            stop (int, optional): Index of the step to stop before. Defaults to the end of the plan.
+
+        Returns:
+            int: Index of the next step to perform.
+        """
+        
+        stop = len(plan.steps) if stop is None else min(stop, len(plan.steps))
+        if start >= stop:
+            return stop
+        
+        for _ in RenameJournal.journaled(renamePlanner.iterWrites(plan, start, stop), newRun=start == 0):
+            pass
+        
+        return stop
+    
+    # Journal writes as they are performed ----------------------------------------------------------------------------------------
+    @staticmethod
+    def journaled(writes: Iterator[tuple], newRun: bool = True) -> Iterator[tuple]:
+        """
+        Journal writes as they are performed, passing them on, so that they can be recorded elsewhere too.
+
+        Args:
+            writes (Iterator[tuple]): Writes, as by `renamePlanner.iterWrites()`.
+            newRun (bool, optional): Make a new run of the writes, otherwise add them to the last run. Defaults to `True`.
+
+        Yields:
+            tuple: The writes taken.
+        """
+        
+        if newRun or not RenameJournal._runs:
+            RenameJournal._runs.append([])
+            del RenameJournal._runs[:-RenameJournal.maxRuns]
+        
+        entries = RenameJournal._runs[-1]
+        
+        for write in writes:
+            candidate, nameBefore, nameAfter = write
+            entries.append((candidate.idType, nameBefore, nameAfter))
+            yield write
+    
+    # Revert the last run ---------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def revertLast(blendData) -> tuple:
+        """
+        Revert the renames of the last run journaled, and forget the run.
+
+        Args:
+            blendData (bpy.types.BlendData): The Blender file's data, typically `bpy.data`.
+
+        Returns:
+            tuple: Number of writes reverted, and number of writes which could not be reverted, because the datablock
+            is no longer found by the name it was given, or its former name has been taken since.
+        """
+        
+        if not RenameJournal._runs:
+            return 0, 0
+        
+        entries = RenameJournal._runs.pop()
+        reverted = 0
+        failed = 0
+        
+        for idType, nameBefore, nameAfter in reversed(entries):
+            collection = getattr(blendData, renamePlanner.datablockCollections.get(idType, ""), None)
+            datablock = collection.get(nameAfter) if collection is not None else None
+            
+            if datablock is None or collection.get(nameBefore) is not None:
+                failed += 1
+                continue
+            
+            datablock.name = nameBefore
+            reverted += 1
+        
+        return reverted, failed
+    
+    # Tell if there's anything to revert ------------------------------------------------------------------------------------------
+    @staticmethod
+    def hasEntries() -> bool:
+        """Tell if there is a run to revert"""
+        return len(RenameJournal._runs) > 0
+    
+    # Forget everything -----------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def clear():
+        """Forget all runs, such as when a file is loaded"""
+        RenameJournal._runs.clear()
@@ -0,0 +1,289 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for streaming renames to a manifest file, and for replaying or reverting a manifest.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+
+from __future__ import annotations
+import json
+import os
+from datetime import datetime
+from typing import Iterator
+from . import renamePlanner
+
+
+# Constants =======================================================================================================================
+
+formatName = "t1nkr-rename-manifest"
+"""Identifies manifest files in their header"""
+
+formatVersion = 1
+"""Version of the format of manifest files, increased on incompatible changes"""
+
+_blockSize = 1 << 16
+"""Size of blocks to read when reading a manifest backwards (bytes)"""
+
+
+# Writing manifests ###############################################################################################################
+class ManifestWriter:
+    """
+    Streams writes to a manifest file as they are performed, so that no record of a run is kept in memory, however many
+    datablocks are renamed. A manifest is a JSON Lines file starting with a header object, followed by one compact array for
+    each write in the order of writing: the ID type, the session UID (or the pointer) of the datablock, the name before and the 
+    name after the write. Writes of temporary names of swaps are included, so that a manifest can be replayed and reverted 
+    in the same way as the run was performed. See `replay()`.
+    
+    Use as a context manager, or call `close()` when done.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, path: str, sourceFile: str = ""):
+        """
+        Create the manifest file, replacing any existing file, and write its header.
+
+        Args:
+            path (str): Path of the file.
+            sourceFile (str, optional): Path of the .blend file renamed, for information. Defaults to none.
+
+        Raises:
+            OSError: If the file cannot be created.
+        """
+        
+        self.path = path
+        """Path of the file"""
+        
+        self.count = 0
+        """Number of writes recorded"""
+        
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8", newline="\n")
+        
+        header = {
+            "format": formatName, 
+            "version": formatVersion, 
+            "created": datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 
+            "sourceFile": sourceFile
+        }
+        self._file.write(json.dumps(header) + "\n")
+    
+    # Support with statements -----------------------------------------------------------------------------------------------------
+    def __enter__(self) -> ManifestWriter:
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+    
+    # Public functions ============================================================================================================
+    
+    # Record writes as they are performed -----------------------------------------------------------------------------------------
+    def recorded(self, writes: Iterator[tuple]) -> Iterator[tuple]:
+        """
+        Record writes as they are performed, passing them on, so that they can be recorded elsewhere too.
+
+        Args:
+            writes (Iterator[tuple]): Writes, as by `renamePlanner.iterWrites()`.
+
+        Yields:
+            tuple: The writes taken.
+        """
+        
+        dumps = json.dumps
+        write = self._file.write
+        
+        for record in writes:
+            candidate, nameBefore, nameAfter = record
+            write(dumps([candidate.idType, _sessionId(candidate.datablock), nameBefore, nameAfter], ensure_ascii=False) + "\n")
+            self.count += 1
+            yield record
+    
+    # Close the file --------------------------------------------------------------------------------------------------------------
+    def close(self):
+        """Close the file, writing everything recorded. Can be called more than once."""
+        
+        if not self._file.closed:
+            self._file.close()
+
+
+# Public functions ================================================================================================================
+
+# Read a manifest -----------------------------------------------------------------------------------------------------------------
+def readRecords(path: str, reverse: bool = False) -> Iterator[tuple]:
+    """
+    Read the records of a manifest one by one, without loading the file in memory.
+
+    Args:
+        path (str): Path of the manifest.
+        reverse (bool, optional): Read records from the last one backwards. Defaults to `False`.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a manifest, or of an unsupported version.
+
+    Yields:
+        tuple: ID type, session UID, name before and name after of each write.
+    """
+    
+    with open(path, encoding="utf-8") as manifestFile:
+        _checkHeader(manifestFile.readline(), path)
+        
+        if not reverse:
+            for line in manifestFile:
+                if line.strip():
+                    yield _parseRecord(line, path)
+            return
+    
+    for line in _linesBackwards(path):
+        # Stop at the header
+        if line.startswith("{"):
+            return
+        yield _parseRecord(line, path)
+
+# Replay or revert a manifest -----------------------------------------------------------------------------------------------------
+def replay(blendData, path: str, inverse: bool = False) -> tuple:
+    """
+    Rename datablocks as recorded in a manifest, such as to apply the decisions of a run to another file with the same names,
+    or revert them by applying the inverse of each write in reverse order, without Blender's undo. Datablocks are found by 
+    name, as session UIDs are only valid within the Blender session making the manifest. 
+
+    Args:
+        blendData (bpy.types.BlendData): The Blender file's data, typically `bpy.data`.
+        path (str): Path of the manifest.
+        inverse (bool, optional): Revert the writes instead of replaying them. Defaults to `False`.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a manifest, or of an unsupported version.
+
+    Returns:
+        tuple: Number of writes performed, and number of writes skipped, because no datablock has the name to change, or the 
+        name to give is taken.
+    """
+    
+    performed = 0
+    skipped = 0
+    collections = {}
+    
+    for idType, _, nameBefore, nameAfter in readRecords(path, reverse=inverse):
+        nameFrom, nameTo = (nameAfter, nameBefore) if inverse else (nameBefore, nameAfter)
+        
+        collection = collections.get(idType)
+        if collection is None:
+            collection = collections[idType] = getattr(blendData, renamePlanner.datablockCollections.get(idType, ""), None)
+        
+        datablock = collection.get(nameFrom) if collection is not None else None
+        
+        if datablock is None or collection.get(nameTo) is not None:
+            skipped += 1
+            continue
+        
+        datablock.name = nameTo
+        performed += 1
+    
+    return performed, skipped
+
+
+# Private functions ===============================================================================================================
+
+# Identify a datablock in the session ---------------------------------------------------------------------------------------------
+def _sessionId(datablock) -> int:
+    """Session UID of a datablock (Blender 4.1 and later), or its pointer"""
+    
+    sessionUid = getattr(datablock, "session_uid", None)
+    return sessionUid if sessionUid is not None else datablock.as_pointer()
+
+# Check the header ----------------------------------------------------------------------------------------------------------------
+def _checkHeader(line: str, path: str):
+    """Raise `ValueError` if the first line of a file is not the header of a supported manifest"""
+    
+    try:
+        header = json.loads(line)
+    except ValueError:
+        header = None
+    
+    if not isinstance(header, dict) or header.get("format") != formatName:
+        raise ValueError(f"'{path}' is not a rename manifest")
+    
+    if header.get("version") != formatVersion:
+        raise ValueError(f"Rename manifest '{path}' is of version {header.get('version')}, only {formatVersion} is supported")
+
+# Parse a record ------------------------------------------------------------------------------------------------------------------
+def _parseRecord(line: str, path: str) -> tuple:
+    """Parse a line of a manifest to a record, raising `ValueError` if it's not a record"""
+    
+    try:
+        idType, sessionId, nameBefore, nameAfter = json.loads(line)
+    except (ValueError, TypeError) as ex:
+        raise ValueError(f"Invalid record in rename manifest '{path}': {line.strip()[:80]}") from ex
+    
+    return idType, sessionId, nameBefore, nameAfter
+
+# Read lines backwards ------------------------------------------------------------------------------------------------------------
+def _linesBackwards(path: str) -> Iterator[str]:
+    """Read the non-empty lines of a text file from the last one backwards, block by block"""
+    
+    with open(path, "rb") as textFile:
+        position = textFile.seek(0, os.SEEK_END)
+        remainder = b""
+        
+        while position > 0:
+            size = min(_blockSize, position)
+            position -= size
+            textFile.seek(position)
+            
+            # The first line of the block may be incomplete, keep it for the next block
+            lines = (textFile.read(size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            
+            for line in reversed(lines):
+                if line.strip():
+                    yield line.decode("utf-8")
+        
+        if remainder.strip():
+            yield remainder.decode("utf-8")
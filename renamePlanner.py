@@ -0,0 +1,1029 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for planning renames and applying the plan. It does not depend on bpy so that it can be used and measured outside Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+from __future__ import annotations
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+
+# Constants =======================================================================================================================
+
+maxNameLength = 63
+"""
+Maximum length of datablock names in bytes (UTF-8), as imposed by Blender. Longer names are truncated by Blender, so
+targets are clamped in advance to be able to tell when a datablock is already in sync.
+"""
+
+datablockCollections = {
+    'MESH': "meshes",
+    'CURVE': "curves",
+    'CURVES': "hair_curves",
+    'META': "metaballs",
+    'LATTICE': "lattices",
+    'ARMATURE': "armatures",
+    'CAMERA': "cameras",
+    'LIGHT': "lights",
+    'LIGHT_PROBE': "lightprobes",
+    'SPEAKER': "speakers",
+    'VOLUME': "volumes",
+    'POINTCLOUD': "pointclouds",
+    'GREASEPENCIL': "grease_pencils",
+    'GREASEPENCIL_V3': "grease_pencils_v3",
+    'MATERIAL': "materials",
+    'ACTION': "actions"
+}
+"""
+Maps ID types (`bpy.types.ID.id_type`) to the name of the corresponding collection in `bpy.data`. Names are unique within
+each of these collections, so collisions are checked per ID type.
+"""
+
+datablockKinds = [
+    ('DATA', "Object data", "The data of the object, such as its mesh, curve, camera or light"),
+    ('MATERIAL', "First material", "The material in the first material slot of the object"),
+    ('ARMATURE', "Armature", "The armature data of the armature deforming the object"),
+    ('ACTION', "Action", "The action animating the object")
+]
+"""
+Kinds of datablocks belonging to an object that can be renamed after the object. Items are in the format expected by 
+`bpy.props.EnumProperty`.
+"""
+
+_numberedName = re.compile(r"^(.*)(\.\d{3,})$", re.DOTALL)
+"""Splits names like `Foo.001` to the name and the number suffix"""
+
+collisionPolicies = [
+    ('NUMBER', "Number", "Use the first free numbered variant of the name, such as 'Foo.001'"),
+    ('SKIP', "Skip", "Leave the datablock as is and report the collision")
+]
+"""
+Ways to resolve a collision, that is, when the target name is already taken by another datablock. Items are in the format
+expected by `bpy.props.EnumProperty`.
+"""
+
+writeProtections = {
+    'LINKED': "linked from a library",
+    'OVERRIDE': "a library override",
+    'NOT_EDITABLE': "not editable"
+}
+"""
+Reasons why a datablock cannot be renamed, with descriptions. See `writeProtectionOf()`.
+"""
+
+sharedDataPolicies = [
+    ('KEEP_MATCHING', "Keep if matching", 
+        "Leave the datablock as is if it's already named after one of its objects, otherwise use the alphabetically first object"),
+    ('FIRST_NAME', "Alphabetically first", "Name the datablock after the object whose name comes first alphabetically"),
+    ('LAST_NAME', "Alphabetically last", "Name the datablock after the object whose name comes last alphabetically")
+]
+"""
+Ways to choose the object after which a datablock shared by several objects (linked duplicates) is named. Items are in the 
+format expected by `bpy.props.EnumProperty`. All policies are independent of selection order.
+"""
+
+
+# A datablock to rename ###########################################################################################################
+@dataclass
+class RenameCandidate:
+    """
+    Snapshot of a datablock and the name it shall get, taken before anything is changed.
+    """
+    
+    ownerName: str
+    """Name of the object the datablock belongs to"""
+    
+    idType: str
+    """ID type of the datablock, such as `MESH` (see `bpy.types.ID.id_type`)"""
+    
+    datablock: object
+    """The datablock itself, only used when applying the plan"""
+    
+    currentName: str
+    """Name of the datablock when the snapshot was taken"""
+    
+    targetName: str
+    """The name the datablock shall get"""
+    
+    finalName: str = ""
+    """The name the datablock will actually get after resolving collisions. Empty if it won't be renamed."""
+    
+    collidesWith: str = ""
+    """The name of the existing datablock the target name collides with, if any"""
+    
+    key: int = 0
+    """Identity of the datablock, see `datablockKey()`"""
+    
+    otherOwners: list = field(default_factory=list)
+    """Names of other objects in scope sharing the datablock, which the datablock is not named after"""
+    
+    kind: str = 'DATA'
+    """How the datablock belongs to the object, see `datablockKinds`"""
+    
+    ownerKey: int = 0
+    """Identity of the object the datablock belongs to, see `datablockKey()`"""
+
+
+# Writes failed ###################################################################################################################
+class FailedWrites:
+    """
+    Candidates whose writes have failed while applying a plan, and those left as is because they depend on them, collected
+    by `iterWrites()` so that a failure does not stop the others. Pass the same instance for all parts of a plan.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self):
+        
+        self.errors = {}
+        """Candidates not renamed (as tuples of the candidate and the error message), by `id()` of the candidate"""
+        
+        self.stepsSkipped = 0
+        """Number of steps of the plan not performed, including failed writes"""
+        
+        self.nextStep = 0
+        """Index of the step following the last one performed or skipped"""
+        
+        self._heldNames = set()
+        """Names (as tuples of the ID type and the name) still held by candidates not renamed"""
+        
+        self._writers = None
+        """Index of the step writing each name of the plan and its candidate, by the ID type and the name, made when needed"""
+    
+    # Support len() ---------------------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.errors)
+    
+    # Public functions ============================================================================================================
+    
+    # Record a failure ------------------------------------------------------------------------------------------------------------
+    def record(self, candidate: RenameCandidate, error: str):
+        """
+        Record that a candidate is not renamed, and keeps holding its name.
+
+        Args:
+            candidate (RenameCandidate): The candidate.
+            error (str): Why it's not renamed.
+        """
+        
+        if id(candidate) not in self.errors:
+            self.errors[id(candidate)] = (candidate, error)
+        
+        try:
+            self._heldNames.add((candidate.idType, candidate.datablock.name))
+        except Exception:
+            self._heldNames.add((candidate.idType, candidate.currentName))
+    
+    # Tell the reason of a write to be skipped ------------------------------------------------------------------------------------
+    def blockerOf(self, candidate: RenameCandidate, name: str) -> str:
+        """
+        Tell why a write shall not be performed because of an earlier failure.
+
+        Args:
+            candidate (RenameCandidate): The candidate to write.
+            name (str): The name to write.
+
+        Returns:
+            str: The reason, or an empty string if the write can be performed.
+        """
+        
+        if id(candidate) in self.errors:
+            return self.errors[id(candidate)][1]
+        
+        if (candidate.idType, name) in self._heldNames:
+            return f"'{name}' is still taken by a data block which could not be renamed"
+        
+        return ""
+    
+    # Find the write of a name ----------------------------------------------------------------------------------------------------
+    def writerOf(self, plan: RenamePlan, idType: str, name: str) -> tuple:
+        """
+        Find the step of a plan writing a name. Steps are indexed on the first call, so pass the same plan on each call.
+
+        Args:
+            plan (RenamePlan): The plan being applied.
+            idType (str): The ID type of the datablock.
+            name (str): The name.
+
+        Returns:
+            tuple: The index of the step and the candidate written, or `None` if no step writes the name.
+        """
+        
+        if self._writers is None:
+            # Each name is written once by a plan, as final names are unique and temporary names are made free
+            self._writers = {(candidate.idType, stepName): (index, candidate) 
+                             for index, (candidate, stepName) in enumerate(plan.steps)}
+        
+        return self._writers.get((idType, name))
+
+
+# The plan ########################################################################################################################
+@dataclass
+class RenamePlan:
+    """
+    The outcome of planning: what to rename, what to leave and why.
+    """
+    
+    renames: list = field(default_factory=list)
+    """Candidates to rename. See `RenameCandidate.finalName` for the name to set."""
+    
+    steps: list = field(default_factory=list)
+    """Writes to perform in order, as tuples of a `RenameCandidate` and the name to set, including temporary names"""
+    
+    inSync: list = field(default_factory=list)
+    """Candidates already having their target name"""
+    
+    collisions: list = field(default_factory=list)
+    """Candidates whose target name is taken. Also listed in `renames` if resolved by numbering."""
+    
+    ignored: list = field(default_factory=list)
+    """Names of objects having no datablock to rename"""
+    
+    numberOfObjects: int = 0
+    """Number of objects considered"""
+    
+    redundantWritesAvoided: int = 0
+    """Number of writes saved by renaming datablocks shared by several objects only once"""
+
+
+# Public functions ================================================================================================================
+
+# Fit a name into Blender's limits ------------------------------------------------------------------------------------------------
+def clampName(name: str, limit: int = maxNameLength) -> str:
+    """
+    Truncate a name the way Blender does, that is, to `maxNameLength` bytes without splitting multi-byte characters.
+
+    Args:
+        name (str): The name.
+        limit (int, optional): Maximum length in bytes. Defaults to `maxNameLength`.
+
+    Returns:
+        str: The name as Blender would store it.
+    """
+    
+    encoded = name.encode("utf-8")
+    if len(encoded) <= limit:
+        return name
+    
+    return encoded[:limit].decode("utf-8", errors="ignore")
+
+# Get ID type of a datablock ------------------------------------------------------------------------------------------------------
+def idTypeOf(datablock) -> str:
+    """
+    Get the ID type of a datablock.
+
+    Args:
+        datablock (bpy.types.ID): The datablock.
+
+    Returns:
+        str: The ID type, such as `MESH`.
+    """
+    
+    return getattr(datablock, "id_type", None) or type(datablock).__name__.upper()
+
+# Get identity of a datablock -----------------------------------------------------------------------------------------------------
+def datablockKey(datablock) -> int:
+    """
+    Get a key identifying a datablock, the same for all objects sharing it. Also used for objects.
+
+    Args:
+        datablock (bpy.types.ID): The datablock.
+
+    Returns:
+        int: The address of the datablock in Blender's memory, or the identity of the Python object outside Blender.
+    """
+    
+    asPointer = getattr(datablock, "as_pointer", None)
+    return asPointer() if asPointer is not None else id(datablock)
+
+# Get datablock getters -----------------------------------------------------------------------------------------------------------
+def datablockGettersFor(kinds: Iterable) -> list:
+    """
+    Get functions getting the datablocks of the specified kinds from an object.
+
+    Args:
+        kinds (Iterable[str]): Kinds of datablocks, see `datablockKinds`.
+
+    Returns:
+        list[tuple[str, Callable]]: Kinds and functions getting the datablock of the kind from an object, or `None` if it
+        has none, in the order of `datablockKinds` regardless of the order kinds are specified in.
+    """
+    
+    kinds = set(kinds)
+    return [(kind, _datablockGetters[kind]) for kind, _, _ in datablockKinds if kind in kinds]
+
+# Tell why a datablock cannot be renamed ------------------------------------------------------------------------------------------
+def writeProtectionOf(datablock) -> str:
+    """
+    Tell if a datablock cannot be renamed, without trying to.
+
+    Args:
+        datablock (bpy.types.ID): The datablock.
+
+    Returns:
+        str: One of the keys of `writeProtections`, or an empty string if the datablock can be renamed.
+    """
+    
+    if datablock.library is not None:
+        return 'LINKED'
+    
+    if datablock.override_library is not None:
+        return 'OVERRIDE'
+    
+    if not getattr(datablock, "is_editable", True):
+        return 'NOT_EDITABLE'
+    
+    return ""
+
+# Exclude datablocks which cannot be renamed --------------------------------------------------------------------------------------
+def excludeProtected(candidates: list) -> tuple:
+    """
+    Sort out candidates whose datablock cannot be renamed, such as linked ones, in a single pass before planning, so that
+    nothing is planned for them, while their names are still considered taken. See `writeProtectionOf()`.
+
+    Args:
+        candidates (list[RenameCandidate]): Candidates as returned by `snapshot()`.
+
+    Returns:
+        tuple: A list of candidates which can be renamed, and a list of tuples of the other candidates and the reason, see 
+        `writeProtections`.
+    """
+    
+    writable = []
+    protected = []
+    
+    for candidate in candidates:
+        protection = writeProtectionOf(candidate.datablock)
+        
+        if protection:
+            protected.append((candidate, protection))
+        else:
+            writable.append(candidate)
+    
+    return writable, protected
+
+# Take a snapshot of the objects --------------------------------------------------------------------------------------------------
+def snapshot(objects: Iterable, targetNameFor: Callable, kinds: Iterable = ('DATA',)) -> tuple:
+    """
+    Read the names of the objects and their datablocks once, and compute the target name of each datablock. Each object is
+    visited once for all kinds of datablocks, and its target name is computed once and shared by its datablocks. Nothing is
+    changed.
+
+    Args:
+        objects (Iterable[bpy.types.Object]): The objects to process.
+        targetNameFor (Callable[[bpy.types.Object], str]): Computes the target name of an object's datablocks.
+        kinds (Iterable[str], optional): Kinds of datablocks to rename, see `datablockKinds`. Defaults to the object data only.
+
+    Returns:
+        tuple: A list of `RenameCandidate` objects, and a list of names of objects having no datablock of the kinds.
+    """
+    
+    candidates = []
+    ignored = []
+    
+    getters = datablockGettersFor(kinds)
+    
+    for obj in objects:
+        targetName = None
+        ownerKey = None
+        
+        for kind, getDatablock in getters:
+            datablock = getDatablock(obj)
+            
+            if datablock is None:
+                continue
+            
+            if targetName is None:
+                targetName = clampName(targetNameFor(obj))
+                ownerKey = datablockKey(obj)
+            
+            candidates.append(RenameCandidate(
+                ownerName=obj.name, 
+                idType=idTypeOf(datablock), 
+                datablock=datablock, 
+                currentName=datablock.name, 
+                targetName=targetName,
+                key=datablockKey(datablock),
+                kind=kind,
+                ownerKey=ownerKey
+            ))
+        
+        if targetName is None:
+            ignored.append(obj.name)
+    
+    return candidates, ignored
+
+# Take a snapshot of writable datablocks ------------------------------------------------------------------------------------------
+def snapshotWritable(objects: Iterable, targetNameFor: Callable, kinds: Iterable = ('DATA',)) -> tuple:
+    """
+    Take a snapshot of the objects (see `snapshot()`), and sort out candidates whose datablocks cannot be renamed (see
+    `excludeProtected()`). This is the first step of planning for all ways of running the synchronizer. Can be called chunk by 
+    chunk.
+
+    Args:
+        objects (Iterable[bpy.types.Object]): The objects to process.
+        targetNameFor (Callable[[bpy.types.Object], str]): Computes the target name of an object's datablocks.
+        kinds (Iterable[str], optional): Kinds of datablocks to rename, see `datablockKinds`. Defaults to the object data only.
+
+    Returns:
+        tuple: A list of `RenameCandidate` objects which can be renamed, a list of tuples of the other candidates and the 
+        reason (see `writeProtections`), and a list of names of objects having no datablock of the kinds.
+    """
+    
+    candidates, ignored = snapshot(objects, targetNameFor, kinds)
+    writable, protected = excludeProtected(candidates)
+    
+    return writable, protected, ignored
+
+# Merge shared datablocks ---------------------------------------------------------------------------------------------------------
+def mergeSharedDatablocks(candidates: list, sharedDataPolicy: str = 'KEEP_MATCHING') -> tuple:
+    """
+    Group candidates by datablock identity so that each datablock is renamed exactly once, even if several objects in scope
+    share it. The object the datablock is named after is chosen as per `sharedDataPolicy`, independently of the order of the
+    candidates.
+
+    Args:
+        candidates (list[RenameCandidate]): Candidates as returned by `snapshot()`.
+        sharedDataPolicy (str, optional): One of the keys in `sharedDataPolicies`. Defaults to `'KEEP_MATCHING'`.
+
+    Returns:
+        tuple: A list of candidates with one item per datablock, in the order of first occurrence, and the number of 
+        candidates dropped.
+    """
+    
+    groups = {}
+    for candidate in candidates:
+        groups.setdefault(candidate.key, []).append(candidate)
+    
+    if len(groups) == len(candidates):
+        # Nothing is shared, which is the typical case
+        return candidates, 0
+    
+    merged = []
+    for group in groups.values():
+        if len(group) == 1:
+            merged.append(group[0])
+            continue
+        
+        chosen = None
+        if sharedDataPolicy == 'KEEP_MATCHING':
+            chosen = next((c for c in group if c.currentName == c.targetName), None)
+        
+        if chosen is None:
+            # Tie-break on name, and make the choice independent of the order the objects have been visited
+            chosen = (max if sharedDataPolicy == 'LAST_NAME' else min)(group, key=lambda c: c.ownerName)
+        
+        chosen.otherOwners = sorted(c.ownerName for c in group if c is not chosen)
+        merged.append(chosen)
+    
+    return merged, len(candidates) - len(merged)
+
+# Collect names taken -------------------------------------------------------------------------------------------------------------
+def existingNamesIn(blendData, idTypes: Iterable) -> dict:
+    """
+    Collect the names of all existing datablocks of the specified ID types, to detect collisions in one indexed pass.
+
+    Args:
+        blendData (bpy.types.BlendData): The Blender file's data, typically `bpy.data`.
+        idTypes (Iterable[str]): ID types, such as `MESH`.
+
+    Returns:
+        dict[str, set[str]]: Names of existing datablocks by ID type. Types without a known collection in `blendData`
+        are omitted.
+    """
+    
+    names = {}
+    
+    for idType in idTypes:
+        collection = getattr(blendData, datablockCollections.get(idType, ""), None)
+        if collection is not None:
+            names[idType] = set(collection.keys())
+    
+    return names
+
+# Plan renames --------------------------------------------------------------------------------------------------------------------
+def planRenames(candidates: list, existingNames: dict, collisionPolicy: str = 'NUMBER', 
+                sharedDataPolicy: str = 'KEEP_MATCHING') -> RenamePlan:
+    """
+    Compute what to rename and in which order, and detect all collisions against existing names. Nothing is changed. 
+    Datablocks shared by several candidates are renamed only once, see `mergeSharedDatablocks()`.
+    
+    A target name held by another datablock being renamed in the same plan is not a collision, but a dependency: that
+    datablock has to be renamed first. Dependencies form chains and cycles (such as when names have been swapped). Chains are
+    ordered so that each name is vacated before being taken, and each cycle is broken by moving one of its datablocks to a
+    temporary name first. This way a reshuffle of N datablocks forming k cycles takes N+k writes, and the result is stable
+    on the next run.
+    
+    A collision occurs when the target name of a candidate is taken by a datablock of the same ID type which is not
+    renamed away, or has already been claimed by an earlier candidate. Collisions are resolved deterministically as per 
+    `collisionPolicy`, in the order of the candidates.
+
+    Args:
+        candidates (list[RenameCandidate]): Candidates as returned by `snapshot()`.
+        existingNames (dict[str, set[str]]): Names of all existing datablocks by ID type. The sets are not modified.
+        collisionPolicy (str, optional): One of the keys in `collisionPolicies`. Defaults to `'NUMBER'`.
+        sharedDataPolicy (str, optional): One of the keys in `sharedDataPolicies`. Defaults to `'KEEP_MATCHING'`.
+
+    Returns:
+        RenamePlan: The plan.
+    """
+    
+    plan = RenamePlan()
+    
+    candidates, plan.redundantWritesAvoided = mergeSharedDatablocks(candidates, sharedDataPolicy)
+    
+    # Names taken by this plan, by ID type. Checked together with existing names so that existing sets need not be copied.
+    claimed = {}
+    
+    # Candidates to be renamed by their current name, by ID type, to find out who holds a target name
+    holders = {}
+    
+    # Candidates whose target name has already been claimed by an earlier candidate
+    claimBlocked = set()
+    
+    changing = []
+    for candidate in candidates:
+        if candidate.currentName == candidate.targetName:
+            plan.inSync.append(candidate)
+            continue
+        
+        changing.append(candidate)
+        holders.setdefault(candidate.idType, {})[candidate.currentName] = candidate
+        
+        claimedOfType = claimed.setdefault(candidate.idType, set())
+        if candidate.targetName in claimedOfType:
+            claimBlocked.add(id(candidate))
+        else:
+            claimedOfType.add(candidate.targetName)
+    
+    # Find out who can take their target name
+    if collisionPolicy == 'NUMBER':
+        # Everyone is renamed, either to the target name or a numbered variant, so all names held by candidates are vacated
+        def takesTarget(candidate: RenameCandidate) -> bool:
+            return id(candidate) not in claimBlocked and (
+                candidate.targetName not in existingNames.get(candidate.idType, ()) 
+                or candidate.targetName in holders[candidate.idType]
+            )
+        
+        canTake = {id(candidate) for candidate in changing if takesTarget(candidate)}
+    else:
+        canTake = _resolveChains(changing, existingNames, holders, claimBlocked)
+    
+    for candidate in changing:
+        if id(candidate) in canTake:
+            candidate.finalName = candidate.targetName
+            continue
+        
+        candidate.collidesWith = candidate.targetName
+        plan.collisions.append(candidate)
+        
+        if collisionPolicy != 'NUMBER':
+            continue
+        
+        claimedOfType = claimed[candidate.idType]
+        
+        # Numbered in an earlier run, and renumbering it would rename it again in each run
+        if _isNumberedVariant(candidate.currentName, candidate.targetName) and candidate.currentName not in claimedOfType:
+            candidate.finalName = candidate.currentName
+            claimedOfType.add(candidate.finalName)
+            continue
+        
+        candidate.finalName = _firstFreeName(candidate.targetName, existingNames.get(candidate.idType, ()), claimedOfType)
+        claimedOfType.add(candidate.finalName)
+    
+    plan.renames = [candidate for candidate in changing if candidate.finalName and candidate.finalName != candidate.currentName]
+    plan.steps = _orderSteps(plan.renames, holders, existingNames, claimed)
+    
+    return plan
+
+# Plan renames for objects --------------------------------------------------------------------------------------------------------
+def planObjects(objects: Iterable, targetNameFor: Callable, existingNamesFor: Callable, kinds: Iterable = ('DATA',), 
+                collisionPolicy: str = 'NUMBER', sharedDataPolicy: str = 'KEEP_MATCHING') -> tuple:
+    """
+    Plan renames for objects at once, the same way a run of the synchronizer does in steps: take a snapshot of the writable
+    datablocks (see `snapshotWritable()`), collect the names taken, and plan (see `planRenames()`). Nothing is changed.
+
+    Args:
+        objects (Iterable[bpy.types.Object]): The objects to process.
+        targetNameFor (Callable[[bpy.types.Object], str]): Computes the target name of an object's datablocks.
+        existingNamesFor (Callable[[set[str]], dict[str, set[str]]]): Collects the names of all existing datablocks of the 
+            ID types passed, by ID type, such as `existingNamesIn()` with `bpy.data`.
+        kinds (Iterable[str], optional): Kinds of datablocks to rename, see `datablockKinds`. Defaults to the object data only.
+        collisionPolicy (str, optional): One of the keys in `collisionPolicies`. Defaults to `'NUMBER'`.
+        sharedDataPolicy (str, optional): One of the keys in `sharedDataPolicies`. Defaults to `'KEEP_MATCHING'`.
+
+    Returns:
+        tuple: The `RenamePlan`, with `ignored` and `numberOfObjects` set, and a list of tuples of candidates which cannot be
+        renamed and the reason, see `writeProtections`.
+    """
+    
+    candidates, protected, ignored = snapshotWritable(objects, targetNameFor, kinds)
+    
+    existingNames = existingNamesFor({candidate.idType for candidate in candidates})
+    plan = planRenames(candidates, existingNames, collisionPolicy, sharedDataPolicy)
+    
+    plan.ignored = ignored
+    plan.numberOfObjects = len({candidate.ownerName for candidate in candidates} 
+                               | {candidate.ownerName for candidate, _ in protected}) + len(ignored)
+    
+    return plan, protected
+
+# Apply a plan --------------------------------------------------------------------------------------------------------------------
+def applyPlan(plan: RenamePlan, failures: FailedWrites = None) -> int:
+    """
+    Rename the datablocks as planned, in the order of `RenamePlan.steps`. Only datablocks needing a change are written.
+
+    Args:
+        plan (RenamePlan): The plan as returned by `planRenames()`.
+        failures (FailedWrites, optional): Collects failed writes instead of stopping at the first one, see `iterWrites()`.
+            Defaults to none.
+
+    Returns:
+        int: Number of datablocks renamed.
+    """
+    
+    applySteps(plan, failures=failures)
+    return len(plan.renames) - (len(failures) if failures is not None else 0)
+
+# Apply part of a plan ------------------------------------------------------------------------------------------------------------
+def applySteps(plan: RenamePlan, start: int = 0, stop: int = None, failures: FailedWrites = None) -> int:
+    """
+    Perform some of the writes of a plan, such as to apply a plan in several parts. Parts must be applied in order.
+
+    Args:
+        plan (RenamePlan): The plan as returned by `planRenames()`.
+        start (int, optional): Index of the first step to perform. Defaults to 0.
+        stop (int, optional): Index of the step to stop before. Defaults to the end of the plan.
+        failures (FailedWrites, optional): Collects failed writes instead of stopping at the first one, see `iterWrites()`.
+            Defaults to none.
+
+    Returns:
+        int: Index of the next step to perform.
+    """
+    
+    stop = len(plan.steps) if stop is None else min(stop, len(plan.steps))
+    
+    if failures is not None:
+        for _ in iterWrites(plan, start, stop, failures):
+            pass
+        return stop
+    
+    for candidate, name in plan.steps[start:stop]:
+        candidate.datablock.name = name
+    
+    return stop
+
+# Perform writes one by one -------------------------------------------------------------------------------------------------------
+def iterWrites(plan: RenamePlan, start: int = 0, stop: int = None, failures: FailedWrites = None) -> Iterator[tuple]:
+    """
+    Perform some of the writes of a plan like `applySteps()` does, lazily, one write for each item taken, so that writes can
+    be recorded as they are performed, such as by `renameJournal.RenameJournal` or `renameManifest.ManifestWriter`.
+    
+    If `failures` is specified, a write failing does not stop the others, but is recorded there, and only successful writes
+    are yielded. Writes of the same candidate, and writes of names the failed one keeps holding are skipped, and so are writes
+    depending on those, so no datablock gets a numbered variant of its name instead. A datablock left with a temporary name
+    this way (in a cycle of swapped names) gets its original name back if it's free.
+
+    Args:
+        plan (RenamePlan): The plan as returned by `planRenames()`.
+        start (int, optional): Index of the first step to perform. Defaults to 0.
+        stop (int, optional): Index of the step to stop before. Defaults to the end of the plan.
+        failures (FailedWrites, optional): Collects failed writes instead of stopping at the first one. Defaults to none.
+
+    Yields:
+        tuple: The candidate, the name of its datablock before and after the write.
+    """
+    
+    stop = len(plan.steps) if stop is None else min(stop, len(plan.steps))
+    
+    if failures is None:
+        for candidate, name in plan.steps[start:stop]:
+            datablock = candidate.datablock
+            nameBefore = datablock.name
+            datablock.name = name
+            yield candidate, nameBefore, name
+        return
+    
+    for index in range(start, stop):
+        candidate, name = plan.steps[index]
+        failures.nextStep = index + 1
+        
+        blocker = failures.blockerOf(candidate, name)
+        if blocker:
+            failures.stepsSkipped += 1
+            if id(candidate) in failures.errors:
+                continue
+            
+            # Don't leave a temporary name behind if the original one is still free
+            nameBefore = candidate.datablock.name
+            if nameBefore != candidate.currentName and not _isTakenBefore(plan, index, candidate, failures):
+                try:
+                    candidate.datablock.name = candidate.currentName
+                    yield candidate, nameBefore, candidate.currentName
+                except Exception:
+                    pass
+            
+            failures.record(candidate, blocker)
+            continue
+        
+        try:
+            datablock = candidate.datablock
+            nameBefore = datablock.name
+            datablock.name = name
+        except Exception as ex:
+            failures.stepsSkipped += 1
+            failures.record(candidate, str(ex) or type(ex).__name__)
+            continue
+        
+        yield candidate, nameBefore, name
+
+# Find where applying can stop ----------------------------------------------------------------------------------------------------
+def nextConsistentStop(plan: RenamePlan, index: int) -> int:
+    """
+    Find the first point at or after a step where applying the plan can stop without leaving any datablock with a temporary 
+    name, that is, in the middle of resolving a cycle of swapped names.
+
+    Args:
+        plan (RenamePlan): The plan as returned by `planRenames()`.
+        index (int): Index of the next step to perform.
+
+    Returns:
+        int: Index of the step to stop before.
+    """
+    
+    # Candidates having a temporary name after the steps performed so far
+    temporary = set()
+    
+    for stepIndex, (candidate, name) in enumerate(plan.steps):
+        if stepIndex >= index and not temporary:
+            return stepIndex
+        
+        if name != candidate.finalName:
+            temporary.add(id(candidate))
+        else:
+            temporary.discard(id(candidate))
+    
+    return len(plan.steps)
+
+
+# Private functions ===============================================================================================================
+
+# Tell if a name has been taken by a plan -----------------------------------------------------------------------------------------
+def _isTakenBefore(plan: RenamePlan, index: int, candidate: RenameCandidate, failures: FailedWrites) -> bool:
+    """
+    Tell if the original name of a candidate has been taken by a successful write of another candidate before a step.
+    """
+    
+    writer = failures.writerOf(plan, candidate.idType, candidate.currentName)
+    if writer is None:
+        return False
+    
+    writeIndex, other = writer
+    return writeIndex < index and other is not candidate and id(other) not in failures.errors
+
+# Get the first material of an object ---------------------------------------------------------------------------------------------
+def _firstMaterial(obj):
+    """The material in the first material slot of an object, if any"""
+    
+    slots = obj.material_slots
+    return slots[0].material if len(slots) > 0 else None
+
+# Get the armature data deforming an object ---------------------------------------------------------------------------------------
+def _armatureData(obj):
+    """The armature data of the armature object deforming an object, if any"""
+    
+    armature = obj.find_armature()
+    return armature.data if armature is not None else None
+
+# Get the action animating an object ----------------------------------------------------------------------------------------------
+def _action(obj):
+    """The action animating an object, if any"""
+    
+    animationData = obj.animation_data
+    return animationData.action if animationData is not None else None
+
+_datablockGetters = {
+    'DATA': lambda obj: obj.data,
+    'MATERIAL': _firstMaterial,
+    'ARMATURE': _armatureData,
+    'ACTION': _action
+}
+"""Functions getting the datablock of each kind in `datablockKinds` from an object, returning `None` if it has none"""
+
+
+# Find a free numbered name -------------------------------------------------------------------------------------------------------
+def _firstFreeName(name: str, existing: set, claimed: set) -> str:
+    """
+    Find the first numbered variant of a name, such as `Foo.001`, that is neither existing nor claimed.
+
+    Args:
+        name (str): The name taken.
+        existing (set[str]): Existing names.
+        claimed (set[str]): Names claimed by the plan.
+
+    Returns:
+        str: A free name.
+    """
+    
+    number = 1
+    while True:
+        suffix = f".{number:03d}"
+        
+        # Make room for the suffix if the name is too long
+        candidateName = clampName(name, maxNameLength - len(suffix)) + suffix
+        
+        if candidateName not in existing and candidateName not in claimed:
+            return candidateName
+        
+        number += 1
+
+# Tell if a name is a numbered variant of another ---------------------------------------------------------------------------------
+def _isNumberedVariant(name: str, target: str) -> bool:
+    """
+    Tell if a name is a numbered variant of a target name, as made by `_firstFreeName()`, such as `Foo.002` for `Foo`.
+    """
+    
+    match = _numberedName.match(name)
+    return match is not None and clampName(target, maxNameLength - len(match.group(2))) == match.group(1)
+
+# Tell who can take their target name ---------------------------------------------------------------------------------------------
+def _resolveChains(changing: list, existingNames: dict, holders: dict, claimBlocked: set) -> set:
+    """
+    Find out which candidates can take their target name if candidates that can't are left as they are. A candidate can take
+    its target name if the name is free, or is held by another candidate that can take its own target name, or if the
+    candidate is part of a cycle of candidates whose target names are held by one another.
+
+    Args:
+        changing (list[RenameCandidate]): Candidates not having their target name.
+        existingNames (dict[str, set[str]]): Names of all existing datablocks by ID type.
+        holders (dict[str, dict[str, RenameCandidate]]): Candidates by current name, by ID type.
+        claimBlocked (set[int]): `id()` of candidates whose target name has been claimed by an earlier candidate.
+
+    Returns:
+        set[int]: `id()` of candidates that can take their target name.
+    """
+    
+    outcome = {}
+    
+    for candidate in changing:
+        # Follow the chain of holders iteratively, as chains may be longer than the recursion limit
+        path = []
+        onPath = set()
+        node = candidate
+        
+        while True:
+            if id(node) in outcome:
+                result = outcome[id(node)]
+                break
+            
+            if id(node) in onPath:
+                # Back to a candidate of this chain, which is a cycle that can be broken by a temporary name
+                result = True
+                break
+            
+            path.append(node)
+            onPath.add(id(node))
+            
+            if id(node) in claimBlocked:
+                result = False
+                break
+            
+            holder = holders[node.idType].get(node.targetName)
+            if holder is None:
+                result = node.targetName not in existingNames.get(node.idType, ())
+                break
+            
+            node = holder
+        
+        for visited in path:
+            outcome[id(visited)] = result
+    
+    return {key for key, result in outcome.items() if result}
+
+# Order renames -------------------------------------------------------------------------------------------------------------------
+def _orderSteps(renames: list, holders: dict, existingNames: dict, claimed: dict) -> list:
+    """
+    Order renames so that each name is vacated before being taken, and break cycles by temporary names.
+
+    Args:
+        renames (list[RenameCandidate]): Candidates to rename, with `finalName` set.
+        holders (dict[str, dict[str, RenameCandidate]]): Candidates by current name, by ID type.
+        existingNames (dict[str, set[str]]): Names of all existing datablocks by ID type.
+        claimed (dict[str, set[str]]): Names claimed by the plan by ID type. Temporary names are added.
+
+    Returns:
+        list[tuple[RenameCandidate, str]]: The writes to perform in order.
+    """
+    
+    renaming = {id(candidate) for candidate in renames}
+    
+    # Each candidate waits for at most one other to vacate its final name, and each name is waited for by at most one 
+    # candidate, so the dependencies form disjoint chains and cycles
+    waitsFor = {}
+    waitedForBy = {}
+    for candidate in renames:
+        holder = holders[candidate.idType].get(candidate.finalName)
+        if holder is not None and holder is not candidate and id(holder) in renaming:
+            waitsFor[id(candidate)] = holder
+            waitedForBy[id(holder)] = candidate
+    
+    steps = []
+    done = set()
+    
+    def unwind(candidate: RenameCandidate):
+        # Rename the candidate, then the one waiting for its old name, and so on
+        while candidate is not None and id(candidate) not in done:
+            steps.append((candidate, candidate.finalName))
+            done.add(id(candidate))
+            candidate = waitedForBy.get(id(candidate))
+    
+    # Chains start with a candidate whose final name is free
+    for candidate in renames:
+        if id(candidate) not in waitsFor:
+            unwind(candidate)
+    
+    # The rest is cycles
+    for candidate in renames:
+        if id(candidate) in done:
+            continue
+        
+        claimedOfType = claimed.setdefault(candidate.idType, set())
+        temporaryName = _temporaryName(existingNames.get(candidate.idType, ()), claimedOfType)
+        claimedOfType.add(temporaryName)
+        
+        # Vacate the name of this candidate, let the others follow, then close the cycle
+        steps.append((candidate, temporaryName))
+        done.add(id(candidate))
+        unwind(waitedForBy.get(id(candidate)))
+        steps.append((candidate, candidate.finalName))
+    
+    return steps
+
+# Find a free temporary name ------------------------------------------------------------------------------------------------------
+def _temporaryName(existing: set, claimed: set) -> str:
+    """
+    Find a temporary name which is neither existing nor claimed, to break cycles.
+
+    Args:
+        existing (set[str]): Existing names.
+        claimed (set[str]): Names claimed by the plan.
+
+    Returns:
+        str: A free name.
+    """
+    
+    number = 0
+    while True:
+        candidateName = f"T1nkR-swap-{number}"
+        if candidateName not in existing and candidateName not in claimed:
+            return candidateName
+        
+        number += 1
+
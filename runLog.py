@@ -0,0 +1,244 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for logging what happens during a run, efficiently even for huge numbers of objects.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+from __future__ import annotations
+import json
+import sys
+from collections import Counter
+
+
+# Constants =======================================================================================================================
+
+DEBUG = 10
+"""Details, such as objects needing no change"""
+
+INFO = 20
+"""Changes made or proposed"""
+
+WARNING = 30
+"""Things that could not be done as requested, such as collisions"""
+
+ERROR = 40
+"""Failures"""
+
+levelNames = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+"""Names of levels, as written to the report file"""
+
+_levelMarkers = {DEBUG: "-", INFO: "+", WARNING: "!", ERROR: "!"}
+"""Characters starting console lines of each level"""
+
+
+# Buffered run log ################################################################################################################
+class RunLog:
+    """
+    Collects log records of a run in memory and writes them to the console at once when flushed, instead of writing each line
+    synchronously, which would cost more than the renaming itself for huge numbers of objects.
+    
+    Records below `level` are not shown. Of records shown, only the first `sampleSize` ones of each category are kept, and
+    the rest are just counted and summarized. Optionally, all records (regardless of `level` and sampling) are streamed to a 
+    JSON Lines report file with their details.
+    
+    To avoid formatting messages nobody will see, messages are formatted from templates only when shown, and callers can use
+    `wants()` to skip producing records altogether.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, level: int = INFO, sampleSize: int = 100, reportPath: str = "", stream = None, quiet: bool = False):
+        """
+        Make a log.
+
+        Args:
+            level (int, optional): Minimum level of records to show. Defaults to `INFO`.
+            sampleSize (int, optional): Maximum number of records to show per category, 0 for no limit. Defaults to 100.
+            reportPath (str, optional): Path of a JSON Lines file to write all records to. Defaults to none.
+            stream (optional): Where to write shown records to. Defaults to `sys.stdout`.
+            quiet (bool, optional): Don't show anything, only write the report file, if any. Defaults to `False`.
+        """
+        
+        self.level = level
+        """Minimum level of records to show"""
+        
+        self.sampleSize = sampleSize
+        """Maximum number of records to show per category, 0 for no limit"""
+        
+        self.stream = stream
+        """Where to write shown records to, `sys.stdout` if `None`"""
+        
+        self.quiet = quiet
+        """Tells if nothing is shown, not even lines, only the report file is written"""
+        
+        self.counts = Counter()
+        """Number of records by category, including those not shown"""
+        
+        self._shown = Counter()
+        """Number of records shown by category"""
+        
+        self._lines = []
+        """Lines to write on the next flush"""
+        
+        self._report = None
+        """The report file, if any"""
+        
+        self.reportError = ""
+        """Error message if the report file could not be opened"""
+        
+        if reportPath:
+            try:
+                self._report = open(reportPath, "w", encoding="utf-8", buffering=1 << 20)
+            except Exception as ex:
+                self.reportError = f"Cannot write report file '{reportPath}': {ex}"
+    
+    # Support with statements -----------------------------------------------------------------------------------------------------
+    def __enter__(self) -> RunLog:
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+    
+    # Public functions ============================================================================================================
+    
+    # Tell if records of a level are needed ---------------------------------------------------------------------------------------
+    def wants(self, level: int) -> bool:
+        """
+        Tell if records of a level are either shown or reported. Use it to skip producing records for nothing.
+
+        Args:
+            level (int): The level.
+
+        Returns:
+            bool: `True` if records of the level are needed.
+        """
+        
+        return (level >= self.level and not self.quiet) or self._report is not None
+    
+    # Add a line ------------------------------------------------------------------------------------------------------------------
+    def line(self, text: str = ""):
+        """
+        Add a line to show unconditionally, such as headers and summaries. Lines are not reported.
+
+        Args:
+            text (str, optional): The text of the line. Defaults to an empty line.
+        """
+        
+        if not self.quiet:
+            self._lines.append(text)
+    
+    # Add a record ----------------------------------------------------------------------------------------------------------------
+    def record(self, level: int, category: str, template: str, **fields):
+        """
+        Add a record.
+
+        Args:
+            level (int): Level of the record, such as `INFO`.
+            category (str): Category of the record, such as `RENAMED`. Sampling and counting is per category.
+            template (str): Template of the message to show, with fields as in `str.format()`.
+            **fields: Values of fields, also written to the report.
+        """
+        
+        self.counts[category] += 1
+        
+        if level >= self.level and not self.quiet and (self.sampleSize <= 0 or self._shown[category] < self.sampleSize):
+            self._shown[category] += 1
+            self._lines.append(f"{_levelMarkers[level]} {category.ljust(18, '.')}: {template.format(**fields)}")
+        
+        if self._report is not None:
+            self._report.write(json.dumps({"level": levelNames[level], "category": category, **fields}) + "\n")
+    
+    # Write a report entry --------------------------------------------------------------------------------------------------------
+    def report(self, **fields):
+        """
+        Write an entry to the report file only, such as run settings or a summary.
+
+        Args:
+            **fields: Content of the entry.
+        """
+        
+        if self._report is not None:
+            self._report.write(json.dumps(fields) + "\n")
+    
+    # Summarize records not shown -------------------------------------------------------------------------------------------------
+    def summarizeOmitted(self):
+        """
+        Add lines telling how many records have not been shown due to sampling, per category.
+        """
+        
+        for category, count in self.counts.items():
+            shown = self._shown[category]
+            if 0 < shown < count:
+                self._lines.append(f"  ... and {count - shown} more {category} record(s) not shown")
+    
+    # Write lines -----------------------------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Write all lines collected since the last flush at once.
+        """
+        
+        if self._lines:
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(self._lines) + "\n")
+            stream.flush()
+            self._lines = []
+        
+        if self._report is not None:
+            self._report.flush()
+    
+    # Finish ----------------------------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Flush and close the report file.
+        """
+        
+        self.flush()
+        
+        if self._report is not None:
+            self._report.close()
+            self._report = None
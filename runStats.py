@@ -0,0 +1,313 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for measuring the phases of a synchronizer run, and optionally profiling it.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+
+from __future__ import annotations
+import contextlib
+import os
+import time
+from datetime import datetime
+
+
+# Constants =======================================================================================================================
+
+phaseNames = ["gather", "filter", "plan", "apply", "log", "updateCheck"]
+"""
+Phases of a run, in order:
+* `gather`: enumerating objects in scope
+* `filter`: checking objects and taking a snapshot of their names
+* `plan`: indexing existing names and computing renames
+* `apply`: writing names
+* `log`: producing and writing log records and the report
+* `updateCheck`: requesting an update check
+"""
+
+
+# Statistics of a run #############################################################################################################
+class RunStats:
+    """
+    Wall time of each phase and counts of a synchronizer run. Phases may nest, in which case the time of the inner phase is not
+    counted for the outer one, so times add up to the total.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self):
+        
+        self.seconds = dict.fromkeys(phaseNames, 0.0)
+        """Seconds spent in each phase"""
+        
+        self.objectsScanned = 0
+        """Number of objects in scope, including those ignored"""
+        
+        self.objectsSkipped = 0
+        """Number of objects skipped for being remembered in sync and unchanged since"""
+        
+        self.datablocksWritten = 0
+        """Number of name writes, including writes of temporary names"""
+        
+        self.renames = 0
+        """Number of datablocks renamed (or that would be renamed in test mode)"""
+        
+        self.collisions = 0
+        """Number of datablocks whose desired name was taken"""
+        
+        self.planReused = False
+        """Tells if the plan of an earlier run has been reused instead of planning again"""
+        
+        self._started = time.perf_counter()
+        self._finished = None
+        
+        self._frames = []
+        """Phases entered, as lists of name, start time and seconds spent in nested phases"""
+    
+    # Public functions ============================================================================================================
+    
+    # Measure a phase -------------------------------------------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Measure the time of a `with` block as part of a phase. Can be entered several times for the same phase.
+
+        Args:
+            name (str): Name of the phase, see `phaseNames`.
+        """
+        
+        frame = [name, time.perf_counter(), 0.0]
+        self._frames.append(frame)
+        
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - frame[1]
+            self._frames.pop()
+            self.add(name, elapsed - frame[2])
+            
+            if self._frames:
+                self._frames[-1][2] += elapsed
+    
+    # Measure an iteration --------------------------------------------------------------------------------------------------------
+    def timedIter(self, iterable, name: str):
+        """
+        Iterate over items, counting the time spent in producing them as part of a phase (and not part of the phase the 
+        iteration happens in). Useful for lazy sequences, such as objects enumerated by `objectScope.iterObjects()`.
+
+        Args:
+            iterable: The items.
+            name (str): Name of the phase, see `phaseNames`.
+
+        Yields:
+            The items.
+        """
+        
+        clock = time.perf_counter
+        iterator = iter(iterable)
+        spent = 0.0
+        
+        try:
+            while True:
+                started = clock()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    spent += clock() - started
+                    return
+                spent += clock() - started
+                yield item
+        finally:
+            self.add(name, spent)
+            if self._frames:
+                self._frames[-1][2] += spent
+    
+    # Add time to a phase ---------------------------------------------------------------------------------------------------------
+    def add(self, name: str, seconds: float):
+        """
+        Add time measured elsewhere to a phase.
+
+        Args:
+            name (str): Name of the phase, see `phaseNames`.
+            seconds (float): Time to add.
+        """
+        
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+    
+    # Finish measurement ----------------------------------------------------------------------------------------------------------
+    def finish(self):
+        """Stop the clock of the total time"""
+        self._finished = time.perf_counter()
+    
+    # Get total time --------------------------------------------------------------------------------------------------------------
+    @property
+    def totalSeconds(self) -> float:
+        """Wall time from creation until `finish()` (or until now if not yet finished)"""
+        return (self._finished or time.perf_counter()) - self._started
+    
+    # Convert to dictionary -------------------------------------------------------------------------------------------------------
+    def asDict(self) -> dict:
+        """
+        Get statistics as a dictionary, such as for writing to a report.
+
+        Returns:
+            dict: Statistics.
+        """
+        
+        return {
+            "totalSeconds": self.totalSeconds,
+            "seconds": dict(self.seconds),
+            "objectsScanned": self.objectsScanned,
+            "objectsSkipped": self.objectsSkipped,
+            "datablocksWritten": self.datablocksWritten,
+            "renames": self.renames,
+            "collisions": self.collisions,
+            "planReused": self.planReused
+        }
+    
+    # Describe statistics ---------------------------------------------------------------------------------------------------------
+    def describe(self) -> str:
+        """
+        Describe statistics in a line, such as for Blender's info bar.
+
+        Returns:
+            str: The description.
+        """
+        
+        phases = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in self.seconds.items() if seconds > 0)
+        
+        return \
+            f"{self.objectsScanned} object(s) scanned{f' ({self.objectsSkipped} unchanged)' if self.objectsSkipped else ''}, " \
+            f"{self.datablocksWritten} name(s) written, " \
+            f"{self.collisions} collision(s){', plan reused' if self.planReused else ''} in {self.totalSeconds:.3f} s ({phases})"
+
+
+# Profiler of a run ###############################################################################################################
+class RunProfiler:
+    """
+    Profiles a run with `cProfile` and traces its memory allocations with `tracemalloc`, then saves both to files, which can
+    be inspected with `pstats` (or tools like SnakeViz) and `tracemalloc.Snapshot.load()`, respectively. 
+    
+    Profiling slows the run down considerably, so only use it to find out where time or memory is spent.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, folder: str, name: str = "t1nkr-mesh-name-sync"):
+        """
+        Prepare a profiler.
+
+        Args:
+            folder (str): Folder to save files to.
+            name (str, optional): Start of file names, which are completed by a timestamp. Defaults to `t1nkr-mesh-name-sync`.
+        """
+        
+        stem = os.path.join(folder, f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+        
+        self.profilePath = f"{stem}.prof"
+        """Path of the cProfile statistics file"""
+        
+        self.memoryPath = f"{stem}.tracemalloc"
+        """Path of the tracemalloc snapshot file"""
+        
+        self.error = ""
+        """Error message if the files could not be saved"""
+        
+        # Imported here, as profiling is rare and the add-on shall load fast
+        import cProfile
+        import tracemalloc
+        
+        self._profile = cProfile.Profile()
+        self._tracemalloc = tracemalloc
+        self._tracing = False
+    
+    # Support with statements -----------------------------------------------------------------------------------------------------
+    def __enter__(self) -> RunProfiler:
+        self.start()
+        return self
+    
+    def __exit__(self, *args):
+        self.stop()
+    
+    # Public functions ============================================================================================================
+    
+    # Start profiling -------------------------------------------------------------------------------------------------------------
+    def start(self):
+        """Start profiling and tracing memory allocations"""
+        
+        # Memory may already be traced by someone else, who shall not be interfered with
+        if not self._tracemalloc.is_tracing():
+            self._tracemalloc.start()
+            self._tracing = True
+        
+        self._profile.enable()
+    
+    # Stop profiling --------------------------------------------------------------------------------------------------------------
+    def stop(self):
+        """Stop profiling and save results. Errors are not raised but stored in `error`."""
+        
+        self._profile.disable()
+        
+        try:
+            snapshot = self._tracemalloc.take_snapshot() if self._tracemalloc.is_tracing() else None
+            
+            if self._tracing:
+                self._tracemalloc.stop()
+                self._tracing = False
+            
+            os.makedirs(os.path.dirname(self.profilePath) or ".", exist_ok=True)
+            self._profile.dump_stats(self.profilePath)
+            
+            if snapshot is not None:
+                snapshot.dump(self.memoryPath)
+            else:
+                self.memoryPath = ""
+        
+        except Exception as ex:
+            self.error = f"Cannot save profile: {ex}"
@@ -0,0 +1,390 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is the scripting API of the synchronizer, to call it from scripts without going through bpy.ops.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+#
+# USAGE ***************************************************************************************************************************
+#
+#   from t1nkrMeshNameSynchronizer import syncApi    # Use the name of the add-on's folder
+#
+#   settings = syncApi.SyncSettings(nameTemplate="{prefix}{object}", prefix="SM_", datablockKinds=frozenset({'DATA'}))
+#   result = syncApi.synchronize(bpy.data.objects, settings)
+#
+#   for rename in result.applied:
+#       print(rename.objectName, rename.nameBefore, "-->", rename.nameAfter)
+#
+# Unlike `bpy.ops.t1nker.meshnamesynchronizer()`, calls don't make undo steps, don't check for updates, don't read settings 
+# of the scene and don't print anything unless asked to, so they can be made thousands of times in a row.
+#
+# *********************************************************************************************************************************
+
+from __future__ import annotations
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+import bpy
+from . import namingTemplate
+from . import objectScope
+from . import runStats
+from . import syncRun
+
+
+# Settings of a run ###############################################################################################################
+@dataclass(frozen=True)
+class SyncSettings:
+    """
+    Immutable snapshot of the settings of a run, as plain values. Fields have the same names and meanings as those of 
+    `T1nkerMeshNameSynchronizerSettings`, see `fromSettings()`. Use `dataclasses.replace()` to derive variants.
+    """
+    
+    prefix: str = ""
+    """Value of the `prefix` field of the template"""
+    
+    suffix: str = ""
+    """Value of the `suffix` field of the template"""
+    
+    nameTemplate: str = namingTemplate.defaultTemplate
+    """Template of names, see `namingTemplate.fields`"""
+    
+    namePattern: str = ""
+    """Regular expression to replace in object names for the `object` field, empty to use names as they are"""
+    
+    nameReplacement: str = ""
+    """Replacement of matches of `namePattern`, as in `re.sub()`"""
+    
+    collisionPolicy: str = 'NUMBER'
+    """What to do if a name is taken, see `renamePlanner.collisionPolicies`"""
+    
+    sharedDataPolicy: str = 'KEEP_MATCHING'
+    """Which object to name shared data after, see `renamePlanner.sharedDataPolicies`"""
+    
+    scope: str = 'SELECTION'
+    """Where to look for objects if none are passed to `synchronize()`, see `objectScope.scopeModes`"""
+    
+    objectTypes: frozenset = objectScope.allObjectTypes
+    """Types of objects to process, see `objectScope.objectTypes`"""
+    
+    datablockKinds: frozenset = frozenset({'DATA'})
+    """Kinds of datablocks to rename, see `renamePlanner.datablockKinds`"""
+    
+    isTestOnly: bool = False
+    """If `True`, nothing is renamed, only planned"""
+    
+    isVerbose: bool = False
+    """If `True`, the log tells about objects not renamed too"""
+    
+    logSampleSize: int = 100
+    """Maximum number of log lines to show per category, 0 for no limit. See `runLog.RunLog`."""
+    
+    showLog: bool = False
+    """If `True`, the log is printed to the System Console, as in runs started from the UI"""
+    
+    reportFilePath: str = ""
+    """Path of a JSON Lines file to write all log records to, empty to not write one"""
+    
+    manifestFilePath: str = ""
+    """Path of a file to stream all writes to, empty to not write one. See `renameManifest.ManifestWriter`."""
+    
+    useRenameJournal: bool = False
+    """If `True`, renames are journaled to revert them, see `renameJournal.RenameJournal`"""
+    
+    useNameIndex: bool = False
+    """If `True`, objects remembered in sync in the scene are skipped, see `nameIndex.NameIndex`"""
+    
+    isProfiling: bool = False
+    """If `True`, the run is profiled, see `runStats.RunProfiler`"""
+    
+    # Public functions ============================================================================================================
+    
+    # Take a snapshot of settings -------------------------------------------------------------------------------------------------
+    @classmethod
+    def fromSettings(cls, settings, **changes) -> SyncSettings:
+        """
+        Take a snapshot of settings, such as those of a scene.
+
+        Args:
+            settings (T1nkerMeshNameSynchronizerSettings): The settings. Fields missing are left at their defaults.
+            **changes: Values to use instead of those of `settings`.
+
+        Returns:
+            SyncSettings: The snapshot.
+        """
+        
+        values = {item.name: getattr(settings, item.name) for item in dataclasses.fields(cls) if hasattr(settings, item.name)}
+        values.update(changes)
+        
+        for name in ("objectTypes", "datablockKinds"):
+            values[name] = frozenset(values.get(name, getattr(cls, name)))
+        
+        return cls(**values)
+    
+    # Get the naming rule ---------------------------------------------------------------------------------------------------------
+    def namingRule(self) -> namingTemplate.NamingRule:
+        """
+        Get the settings determining names.
+
+        Returns:
+            namingTemplate.NamingRule: The rule.
+        """
+        
+        return namingTemplate.NamingRule(
+            template=self.nameTemplate, 
+            prefix=self.prefix, 
+            suffix=self.suffix, 
+            pattern=self.namePattern, 
+            replacement=self.nameReplacement
+        )
+
+
+# A rename ########################################################################################################################
+@dataclass(frozen=True)
+class RenameRecord:
+    """
+    A datablock renamed, or to be renamed.
+    """
+    
+    objectName: str
+    """Name of the object the datablock is named after"""
+    
+    idType: str
+    """ID type of the datablock, such as `MESH`"""
+    
+    kind: str
+    """How the datablock belongs to the object, see `renamePlanner.datablockKinds`"""
+    
+    nameBefore: str
+    """Name of the datablock before the run"""
+    
+    nameAfter: str
+    """Name of the datablock after the run (or the name it would get in test mode)"""
+
+
+# An item skipped #################################################################################################################
+@dataclass(frozen=True)
+class SkippedItem:
+    """
+    An object or datablock left as is, and why.
+    """
+    
+    objectName: str
+    """Name of the object"""
+    
+    reason: str
+    """Why it has been skipped: `NO_DATA` if the object has no data to rename, `NOT_WRITABLE` if the datablock cannot be 
+    renamed (such as a linked one), `NAME_TAKEN` if the name the datablock shall get is taken, `WRITE_FAILED` if renaming it
+    has failed, `NOT_APPLIED` if the run stopped (due to cancellation or an error) before renaming it"""
+    
+    idType: str = ""
+    """ID type of the datablock, empty if the object has none"""
+    
+    name: str = ""
+    """Name of the datablock, empty if the object has none"""
+    
+    detail: str = ""
+    """Details of the reason, such as the key of `renamePlanner.writeProtections` or the error message"""
+
+
+# Result of a run #################################################################################################################
+@dataclass
+class SyncResult:
+    """
+    What a run has done.
+    """
+    
+    planned: list = field(default_factory=list)
+    """Renames planned, as `RenameRecord` objects"""
+    
+    applied: list = field(default_factory=list)
+    """Renames performed, as `RenameRecord` objects. Empty in test mode."""
+    
+    skipped: list = field(default_factory=list)
+    """Objects and datablocks left as is, as `SkippedItem` objects. Datablocks already in sync are not listed."""
+    
+    inSync: int = 0
+    """Number of datablocks already having the name they shall get"""
+    
+    redundantWritesAvoided: int = 0
+    """Number of renames of datablocks shared by several objects left out, see `renamePlanner.mergeSharedDatablocks()`"""
+    
+    errors: list = field(default_factory=list)
+    """Messages of errors stopping the run. Failures of renaming single datablocks are listed in `skipped`."""
+    
+    cancelled: bool = False
+    """Tells if the run has been cancelled"""
+    
+    timings: dict = field(default_factory=dict)
+    """Seconds spent in each phase, see `runStats.phaseNames`, and in total under `total`"""
+    
+    stats: runStats.RunStats = None
+    """All statistics of the run"""
+    
+    status: set = field(default_factory=lambda: {'CANCELLED'})
+    """What an operator performing the run shall return, see `syncRun.SyncRun.status`"""
+    
+    needsUndoStep: bool = False
+    """Tells if an operator performing the run shall make an undo step, see `syncRun.SyncRun.needsUndoStep`"""
+    
+    # Public functions ============================================================================================================
+    
+    # Tell if the run succeeded ---------------------------------------------------------------------------------------------------
+    @property
+    def ok(self) -> bool:
+        """`True` if the run has completed without errors and has not been cancelled"""
+        return not self.errors and not self.cancelled
+    
+    # Get the result of a run -----------------------------------------------------------------------------------------------------
+    @classmethod
+    def fromRun(cls, run: syncRun.SyncRun) -> SyncResult:
+        """
+        Get the result of a run completed.
+
+        Args:
+            run (syncRun.SyncRun): The run.
+
+        Returns:
+            SyncResult: The result.
+        """
+        
+        result = cls(
+            errors=list(run.errors), 
+            cancelled=run.cancelled, 
+            timings=dict(run.stats.seconds, total=run.stats.totalSeconds),
+            stats=run.stats, 
+            status=run.status,
+            needsUndoStep=run.needsUndoStep
+        )
+        
+        result.skipped = [SkippedItem(objectName, 'NO_DATA') for objectName in run.ignored]
+        result.skipped.extend(
+            SkippedItem(candidate.ownerName, 'NOT_WRITABLE', candidate.idType, candidate.currentName, protection)
+            for candidate, protection in run.protected
+        )
+        
+        plan = run.plan
+        if plan is None:
+            return result
+        
+        result.planned = [_recordOf(candidate) for candidate in plan.renames]
+        result.inSync = len(plan.inSync)
+        result.redundantWritesAvoided = plan.redundantWritesAvoided
+        
+        result.skipped.extend(
+            SkippedItem(candidate.ownerName, 'NAME_TAKEN', candidate.idType, candidate.currentName) 
+            for candidate in plan.collisions if not candidate.finalName
+        )
+        
+        if not run.settings.isTestOnly:
+            renamed = {id(candidate) for candidate in run.renamed}
+            failed = run.failures.errors
+            
+            result.applied = [record for candidate, record in zip(plan.renames, result.planned) if id(candidate) in renamed]
+            result.skipped.extend(
+                SkippedItem(candidate.ownerName, 'WRITE_FAILED', candidate.idType, candidate.currentName, error)
+                for candidate, error in failed.values()
+            )
+            result.skipped.extend(
+                SkippedItem(candidate.ownerName, 'NOT_APPLIED', candidate.idType, candidate.currentName)
+                for candidate in plan.renames if id(candidate) not in renamed and id(candidate) not in failed
+            )
+        
+        return result
+
+
+# Public functions ================================================================================================================
+
+# Synchronize names ---------------------------------------------------------------------------------------------------------------
+def synchronize(objects: Iterable = None, settings: SyncSettings = None, context = None, report: Callable = None, 
+                updateCheckSeconds: float = 0.0) -> SyncResult:
+    """
+    Synchronize names of the data of objects with the names of the objects, at once. This is what 
+    `T1NKER_OT_MeshNameSynchronizer` does, without any overhead of operators: no undo step is made (use 
+    `bpy.ops.ed.undo_push()` or `SyncSettings.useRenameJournal` to be able to revert), and updates are not checked. 
+    
+    Errors stopping the run are not raised, but listed in the result, along with what has been renamed until then.
+
+    Args:
+        objects (Iterable[bpy.types.Object], optional): The objects, consumed lazily. Only those of the types in 
+            `settings.objectTypes` are processed. Defaults to the objects in `settings.scope`.
+        settings (SyncSettings, optional): The settings. Defaults to the defaults of `SyncSettings`.
+        context (bpy.types.Context, optional): The context, whose scene stores the name index, and which determines the 
+            scope if no objects are passed. Defaults to `bpy.context`.
+        report (Callable, optional): Function to report messages to the user with, such as `bpy.types.Operator.report`. 
+            Defaults to none.
+        updateCheckSeconds (float, optional): Time spent requesting an update check, to include in the statistics. 
+            Defaults to 0.
+
+    Returns:
+        SyncResult: What has been done.
+    """
+    
+    settings = settings if settings is not None else SyncSettings()
+    
+    if objects is not None:
+        objects = objectScope.filterTypes(objects, settings.objectTypes)
+    
+    run = syncRun.SyncRun(
+        context if context is not None else bpy.context, 
+        settings, 
+        objects, 
+        report=report, 
+        updateCheckSeconds=updateCheckSeconds
+    )
+    run.run()
+    
+    return SyncResult.fromRun(run)
+
+
+# Private functions ===============================================================================================================
+
+# Make a record of a rename -------------------------------------------------------------------------------------------------------
+def _recordOf(candidate) -> RenameRecord:
+    """
+    Make a record of the rename of a candidate of a plan, see `renamePlanner.RenameCandidate`.
+    """
+    
+    return RenameRecord(candidate.ownerName, candidate.idType, candidate.kind, candidate.currentName, candidate.finalName)
@@ -0,0 +1,670 @@
+# T1nk-R's Mesh Name Synchronizer add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module is responsible for performing a run of the synchronizer, at once or in time-budgeted slices.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to synchronize the names of meshes with the names of their parent objects.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on is intended to change the name of the meshes and other data blocks under your Blender objects.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/T1nkR-Mesh-Name-Synchronizer
+#
+# *********************************************************************************************************************************
+
+
+
+from __future__ import annotations
+import itertools
+import os
+import time
+from datetime import datetime
+from typing import Callable, Iterable
+import bpy
+from . import renamePlanner
+from . import objectScope
+from . import runLog
+from . import runStats
+from . import namingTemplate
+from . import planCache
+from . import renameJournal
+from . import nameIndex
+from . import renameManifest
+
+
+# Constants =======================================================================================================================
+
+chunkSize = 256
+"""Number of objects or writes processed between checking whether the time budget of a slice is used up"""
+
+stages = ['START', 'SNAPSHOT', 'PLAN', 'APPLY', 'DONE']
+"""Stages of a run, in order"""
+
+
+# A run of the synchronizer #######################################################################################################
+class SyncRun:
+    """
+    A run of the synchronizer, from taking the snapshot of names to writing the summary. The run is split into stages, and 
+    taking the snapshot and applying the plan into chunks, so that it can be performed in slices of limited time, such as by 
+    a modal operator between UI updates, or all at once. 
+    
+    A run can be cancelled. If names are already being written, writing stops at the first point where no datablock is left
+    with a temporary name (see `renamePlanner.nextConsistentStop()`), so the part completed is consistent, and can be 
+    reverted by undo or the rename journal as usual.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, context, settings, objects: Iterable = None, report: Callable = None, updateCheckSeconds: float = 0.0):
+        """
+        Prepare a run. Nothing is done until `step()` or `run()` is called.
+
+        Args:
+            context (bpy.types.Context): The context to run in. Its scene stores the name index, see `nameIndex.NameIndex`.
+            settings (syncApi.SyncSettings): The settings to run with.
+            objects (Iterable[bpy.types.Object], optional): The objects to process, consumed lazily. Defaults to the objects in
+                the scope set in `settings`.
+            report (Callable, optional): Function to report messages to the user with, such as `bpy.types.Operator.report`. 
+                Defaults to none.
+            updateCheckSeconds (float, optional): Time spent requesting an update check, to include in the statistics. 
+                Defaults to 0.
+        """
+        
+        self.context = context
+        """The context to run in"""
+        
+        self.settings = settings
+        """The settings to run with"""
+        
+        self.stats = runStats.RunStats()
+        """Timing and counts of the run"""
+        
+        self.stats.add("updateCheck", updateCheckSeconds)
+        
+        self.stage = 'START'
+        """The stage to perform next, see `stages`"""
+        
+        self.status = {'CANCELLED'}
+        """
+        Outcome of the run to return from an operator: `{'FINISHED'}` once complete, including test runs and runs with nothing
+        to rename, `{'CANCELLED'}` if cancelled or stopped by an error. See `needsUndoStep` for undo.
+        """
+        
+        self.plan: renamePlanner.RenamePlan = None
+        """The plan, once made"""
+        
+        self.cancelled = False
+        """Tells if the run has been cancelled"""
+        
+        self.renamed = []
+        """Candidates of the plan renamed to their final name (or that would be in test mode), once the run is complete"""
+        
+        self.errors = []
+        """Messages of errors stopping the run"""
+        
+        self.protected = []
+        """Candidates left as is as their datablocks cannot be renamed, with the reason, see `renamePlanner.excludeProtected()`"""
+        
+        self.failures = renamePlanner.FailedWrites()
+        """Candidates not renamed as writing their names has failed, see `renamePlanner.iterWrites()`"""
+        
+        self._report = report if report is not None else lambda level, message: None
+        self._log: runLog.RunLog = None
+        self._manifest: renameManifest.ManifestWriter = None
+        self._profiler: runStats.RunProfiler = None
+        self._objects = objects
+        self._objectTotal = 1
+        self._index: nameIndex.NameIndex = None
+        self._targetNameFor = None
+        self._candidates = []
+        self._ignored = []
+        self._scanned = 0
+        self._applied = 0
+        self._stopAt = None
+        self._namesWritten = False
+        self._failed = False
+    
+    # Public functions ============================================================================================================
+    
+    # Perform the run at once -----------------------------------------------------------------------------------------------------
+    def run(self) -> set:
+        """
+        Perform the whole run at once.
+
+        Returns:
+            set: Outcome to return from an operator, see `status`.
+        """
+        
+        while not self.step():
+            pass
+        
+        return self.status
+    
+    # Perform a slice of the run --------------------------------------------------------------------------------------------------
+    def step(self, budgetSeconds: float = None) -> bool:
+        """
+        Perform the run until the time budget is used up, or until it's complete. The budget may be exceeded by processing
+        a chunk (see `chunkSize`), and by planning, which is done in one go.
+
+        Args:
+            budgetSeconds (float, optional): The time budget. Defaults to none, meaning to perform the whole run.
+
+        Returns:
+            bool: `True` if the run is complete.
+        """
+        
+        if self.stage == 'DONE':
+            return True
+        
+        deadline = None if budgetSeconds is None else time.perf_counter() + budgetSeconds
+        
+        try:
+            if self.stage == 'START':
+                self._start()
+                self.stage = 'SNAPSHOT'
+            
+            if self.stage == 'SNAPSHOT' and not self.cancelled:
+                if not self._takeSnapshot(deadline):
+                    return False
+                
+                self.stage = 'PLAN'
+                if _isTimeUp(deadline):
+                    return False
+            
+            if self.stage == 'PLAN' and not self.cancelled:
+                self._makePlan()
+                
+                self.stage = 'APPLY'
+                if _isTimeUp(deadline):
+                    return False
+            
+            if self.stage == 'APPLY':
+                if not self._applyPlan(deadline):
+                    return False
+        
+        except Exception as ex:
+            self._failed = True
+            self.errors.append(str(ex))
+            self._report({'ERROR'}, f"{ex}")
+            
+            # The log is made when starting, which may have failed before
+            if self._log is None:
+                self.stage = 'DONE'
+                return True
+            
+            self._log.record(runLog.ERROR, "ERROR", "{error}", error=str(ex))
+        
+        self._finish()
+        self.stage = 'DONE'
+        
+        return True
+    
+    # Cancel the run --------------------------------------------------------------------------------------------------------------
+    def cancel(self):
+        """
+        Cancel the run. If names are being written, writing continues to the next consistent point before stopping, 
+        see `renamePlanner.nextConsistentStop()`. Call `step()` to complete the run.
+        """
+        
+        if self.cancelled or self.stage == 'DONE':
+            return
+        
+        self.cancelled = True
+        
+        if self.stage == 'APPLY' and self.plan is not None:
+            self._stopAt = renamePlanner.nextConsistentStop(self.plan, self._applied)
+    
+    # Tell if an undo step is needed ----------------------------------------------------------------------------------------------
+    @property
+    def needsUndoStep(self) -> bool:
+        """
+        `True` if names have been written (even if the run was cancelled or failed later), and they are to be reverted by undo 
+        rather than the rename journal. Operators make the undo step themselves, so that runs writing nothing don't make one.
+        """
+        return self._namesWritten and not self.settings.useRenameJournal
+    
+    # Get progress ----------------------------------------------------------------------------------------------------------------
+    @property
+    def progress(self) -> float:
+        """Estimated progress of the run between 0 and 1"""
+        
+        if self.stage == 'SNAPSHOT':
+            return 0.3 * min(1.0, self._scanned / self._objectTotal)
+        
+        if self.stage == 'PLAN':
+            return 0.3
+        
+        if self.stage == 'APPLY' and self.plan is not None:
+            stop = self._stopAt if self._stopAt is not None else len(self.plan.steps)
+            return 0.4 + 0.6 * (self._applied / stop if stop > 0 else 1.0)
+        
+        return 1.0 if self.stage == 'DONE' else 0.0
+    
+    # Get objects ignored ---------------------------------------------------------------------------------------------------------
+    @property
+    def ignored(self) -> list:
+        """Names of objects scanned having no data to rename"""
+        return self._ignored
+    
+    # Private functions ===========================================================================================================
+    
+    # Start the run ---------------------------------------------------------------------------------------------------------------
+    def _start(self):
+        """
+        Open the log and write the header, and prepare enumerating objects.
+        """
+        
+        settings = self.settings
+        stats = self.stats
+        
+        self._started = f"{datetime.strftime(datetime.now(), '%Y-%m-%d %H:%M:%S')}"
+        
+        # Collect output in memory and write it at once in the end. Details are shown in test and verbose mode.
+        reportPath = bpy.path.abspath(settings.reportFilePath) if settings.reportFilePath else ""
+        
+        with stats.phase("log"):
+            self._log = log = runLog.RunLog(
+                level=runLog.DEBUG if settings.isVerbose or settings.isTestOnly else runLog.WARNING,
+                sampleSize=settings.logSampleSize,
+                reportPath=reportPath,
+                quiet=not settings.showLog
+            )
+        
+        # Stream writes to the manifest as they are performed
+        if settings.manifestFilePath and not settings.isTestOnly:
+            try:
+                self._manifest = renameManifest.ManifestWriter(bpy.path.abspath(settings.manifestFilePath), bpy.data.filepath)
+            except OSError as ex:
+                log.line(f"Cannot write manifest: {ex}")
+                self._report({'WARNING'}, f"Cannot write manifest: {ex}")
+        
+        if settings.isProfiling:
+            self._profiler = runStats.RunProfiler(os.path.dirname(reportPath) if reportPath else bpy.app.tempdir)
+            self._profiler.start()
+        
+        log.line()
+        log.line()
+        log.line(f"=" * 80)
+        log.line(f"T1nk-R Mesh Name Synchronizer started ({self._started})")
+        log.line(f"-" * 80)        
+        log.line()
+        
+        if settings.isTestOnly:
+            log.line(f"Operating in test mode, nothing will actually be changed")
+        else:
+            log.line(f"Operating in production mode, requested changes will apply")        
+        
+        if settings.isVerbose:
+            log.line(f"\t- Processing objects in scope '{settings.scope}'")
+            log.line(f"\t- Forming names as '{settings.nameTemplate}'")
+            
+            if set(settings.objectTypes) >= objectScope.allObjectTypes:
+                log.line(f"\t- Processing all kinds of objects")
+            else:
+                log.line(f"\t- Processing only objects of type {', '.join(sorted(settings.objectTypes))}")
+            
+            log.line(f"\t- Renaming {', '.join(sorted(settings.datablockKinds))} of objects")
+        
+        if log.reportError:
+            log.line(log.reportError)
+            self._report({'WARNING'}, log.reportError)
+        
+        log.line()
+        
+        log.report(
+            event="started", 
+            time=self._started, 
+            testOnly=settings.isTestOnly, 
+            scope=settings.scope,
+            objectTypes=sorted(settings.objectTypes),
+            datablockKinds=sorted(settings.datablockKinds)
+        )
+        
+        # Enumerate objects in scope lazily, they are consumed by taking the snapshot chunk by chunk
+        objects = self._objects
+        if objects is None:
+            objects = objectScope.iterObjects(self.context, settings.scope, settings.objectTypes)
+        
+        self._objectTotal = max(1, len(objects) if hasattr(objects, "__len__") else len(bpy.data.objects))
+        self._objects = stats.timedIter(objects, "gather")
+        
+        # Skip objects remembered to be in sync, unless they have changed since
+        rule = settings.namingRule()
+        if settings.useNameIndex and namingTemplate.dependsOnNamesOnly(rule):
+            self._index = nameIndex.NameIndex.load(
+                self.context.scene,
+                nameIndex.settingsChecksum(rule, settings.datablockKinds, settings.collisionPolicy, settings.sharedDataPolicy),
+                settings.datablockKinds
+            )
+            self._objects = self._index.changedObjects(self._objects)
+        
+        self._targetNameFor = namingTemplate.compileRule(rule, bpy.data.objects)
+    
+    # Take the snapshot -----------------------------------------------------------------------------------------------------------
+    def _takeSnapshot(self, deadline: float) -> bool:
+        """
+        Take a snapshot of the names of objects in scope, chunk by chunk, without changing anything.
+
+        Args:
+            deadline (float): Time (as by `time.perf_counter()`) to stop at, or `None` to take the whole snapshot.
+
+        Returns:
+            bool: `True` if the snapshot is complete.
+        """
+        
+        while True:
+            with self.stats.phase("filter"):
+                chunk = list(itertools.islice(self._objects, chunkSize))
+                
+                # Linked and other protected datablocks are sorted out before planning, so nothing is written for them
+                candidates, protected, ignored = renamePlanner.snapshotWritable(
+                    chunk, self._targetNameFor, self.settings.datablockKinds
+                )
+                
+                self._candidates.extend(candidates)
+                self.protected.extend(protected)
+                self._ignored.extend(ignored)
+                self._scanned += len(chunk)
+                
+                # Kept up to date in case the run is cancelled before the snapshot is complete
+                skipped = self._index.skipped if self._index is not None else 0
+                self.stats.objectsScanned = self._scanned + skipped
+                self.stats.objectsSkipped = skipped
+            
+            if len(chunk) < chunkSize:
+                return True
+            
+            if _isTimeUp(deadline):
+                return False
+    
+    # Make the plan ---------------------------------------------------------------------------------------------------------------
+    def _makePlan(self):
+        """
+        Compute what to do without changing anything, or reuse the plan of an earlier run, and log the plan.
+        """
+        
+        settings = self.settings
+        stats = self.stats
+        log = self._log
+        candidates = self._candidates
+        
+        with stats.phase("plan"):
+            # Reuse the plan of the previous run if made for the same inputs, such as when applying after a test run
+            inputs = planCache.fingerprint(candidates, bpy.data, settings.collisionPolicy, settings.sharedDataPolicy)
+            plan = planCache.PlanCache.get(inputs, candidates)
+            
+            if plan is not None and not planCache.isApplicable(plan, bpy.data):
+                plan = None
+            
+            stats.planReused = plan is not None
+            
+            if plan is None:
+                existingNames = renamePlanner.existingNamesIn(bpy.data, {candidate.idType for candidate in candidates})
+                plan = renamePlanner.planRenames(candidates, existingNames, settings.collisionPolicy, settings.sharedDataPolicy)
+                planCache.PlanCache.store(inputs, plan)
+            
+            self.plan = plan
+            stats.renames = len(plan.renames)
+            stats.collisions = len(plan.collisions)
+        
+        with stats.phase("log"):
+            if log.wants(runLog.DEBUG):
+                for objName in self._ignored:
+                    log.record(runLog.DEBUG, "IGNORED", "'{object}' is ignored for having no data to rename", object=objName)
+            
+            for candidate, protection in self.protected:
+                log.record(runLog.WARNING, "NOT WRITABLE", "{type} of '{object}': '{name}' is {reason}, skipped",
+                           object=candidate.ownerName, type=candidate.idType, name=candidate.currentName, 
+                           reason=renamePlanner.writeProtections[protection], protection=protection)
+            
+            if log.wants(runLog.DEBUG):
+                for candidate in plan.inSync:
+                    log.record(runLog.DEBUG, "NEEDS NO CHANGE", "{type} of '{object}': '{name}'", 
+                               object=candidate.ownerName, type=candidate.idType, name=candidate.currentName)
+                
+                for candidate in plan.renames + plan.inSync:
+                    if candidate.otherOwners:
+                        log.record(runLog.DEBUG, "SHARED", "{type} of '{object}' is also used by {users} other object(s), named once",
+                                   object=candidate.ownerName, type=candidate.idType, users=len(candidate.otherOwners), otherObjects=candidate.otherOwners)
+                
+                if len(plan.steps) > len(plan.renames):
+                    log.record(runLog.DEBUG, "SWAPS", "{cycles} cycle(s) of swapped names are resolved via temporary names",
+                               cycles=len(plan.steps) - len(plan.renames))
+            
+            for candidate in plan.collisions:
+                if candidate.finalName:
+                    log.record(runLog.WARNING, "NAME TAKEN", "{type} of '{object}': '{target}' is taken, using '{to}'",
+                               object=candidate.ownerName, type=candidate.idType, target=candidate.targetName, to=candidate.finalName)
+                else:
+                    log.record(runLog.WARNING, "NAME TAKEN", "{type} of '{object}': '{target}' is taken, skipped",
+                               object=candidate.ownerName, type=candidate.idType, target=candidate.targetName)
+    
+    # Apply the plan --------------------------------------------------------------------------------------------------------------
+    def _applyPlan(self, deadline: float) -> bool:
+        """
+        Write only what needs to be changed, in an order which vacates names before they are taken, chunk by chunk. Nothing
+        is written in test mode.
+
+        Args:
+            deadline (float): Time (as by `time.perf_counter()`) to stop at, or `None` to apply the whole plan.
+
+        Returns:
+            bool: `True` if applying is complete (or stopped as cancelled).
+        """
+        
+        settings = self.settings
+        plan = self.plan
+        
+        if settings.isTestOnly:
+            return True
+        
+        while True:
+            stop = self._stopAt if self._stopAt is not None else len(plan.steps)
+            if self._applied >= stop:
+                break
+            
+            with self.stats.phase("apply"):
+                # Set before writing, as some names may have been written even if an error occurs
+                self._namesWritten = True
+                self._applyChunk(self._applied, min(stop, self._applied + chunkSize))
+                self.stats.datablocksWritten = self._applied - self.failures.stepsSkipped
+            
+            if _isTimeUp(deadline):
+                return False
+        
+        # The index is only valid if the whole plan has been applied. Objects with protected datablocks are not remembered.
+        if self._index is not None and self._applied == len(plan.steps) and not self.failures \
+                and (self._candidates or self._ignored or self.protected):
+            with self.stats.phase("apply"):
+                protected = [candidate for candidate, _ in self.protected]
+                self._index.update(self._candidates + protected, self._ignored, plan)
+                if len(self._index.entries) > len(bpy.data.objects):
+                    self._index.prune(bpy.data.objects.keys())
+                self._index.save(self.context.scene)
+        
+        return True
+    
+    # Apply a chunk of the plan ---------------------------------------------------------------------------------------------------
+    def _applyChunk(self, start: int, stop: int):
+        """
+        Perform the writes of a part of the plan, journaling them and streaming them to the manifest as requested. A write
+        failing does not stop the others, see `failures`.
+
+        Args:
+            start (int): Index of the first step to perform.
+            stop (int): Index of the step to stop before.
+        """
+        
+        if self._manifest is None and not self.settings.useRenameJournal:
+            self._applied = renamePlanner.applySteps(self.plan, start, stop, self.failures)
+            return
+        
+        # Chain writes through the recorders, so each write is recorded as soon as it's performed
+        writes = renamePlanner.iterWrites(self.plan, start, stop, self.failures)
+        
+        if self.settings.useRenameJournal:
+            writes = renameJournal.RenameJournal.journaled(writes, newRun=start == 0)
+        
+        if self._manifest is not None:
+            writes = self._manifest.recorded(writes)
+        
+        # Tracked write by write, so that writes performed before an error (such as of the manifest) are known
+        self.failures.nextStep = start
+        try:
+            for _ in writes:
+                pass
+        finally:
+            self._applied = self.failures.nextStep
+    
+    # Finish the run --------------------------------------------------------------------------------------------------------------
+    def _finish(self):
+        """
+        Log what has been renamed, write the summary and close the log. Also determine `status`.
+        """
+        
+        settings = self.settings
+        stats = self.stats
+        log = self._log
+        plan = self.plan
+        
+        # Renames are complete if all steps up to their final name have been performed
+        renamed = []
+        if plan is not None:
+            failed = self.failures.errors
+            if settings.isTestOnly or (self._applied == len(plan.steps) and not failed):
+                renamed = plan.renames
+            else:
+                completed = {
+                    id(candidate) for candidate, name in plan.steps[:self._applied] 
+                    if name == candidate.finalName and id(candidate) not in failed
+                }
+                renamed = [candidate for candidate in plan.renames if id(candidate) in completed]
+        
+        self.renamed = renamed
+        
+        with stats.phase("log"):
+            if log.wants(runLog.INFO):
+                category = "WOULD RENAME" if settings.isTestOnly else "RENAMED"
+                for candidate in renamed:
+                    log.record(runLog.INFO, category, "{type} of '{object}': '{name}' --> '{to}'",
+                               object=candidate.ownerName, type=candidate.idType, name=candidate.currentName, to=candidate.finalName)
+            
+            for candidate, error in self.failures.errors.values():
+                log.record(runLog.ERROR, "RENAME FAILED", "{type} of '{object}': '{name}' could not be renamed: {error}",
+                           object=candidate.ownerName, type=candidate.idType, name=candidate.currentName, error=error)
+            
+            if self.cancelled and plan is None:
+                log.record(runLog.WARNING, "CANCELLED", "Cancelled before planning, nothing has been renamed")
+            elif self.cancelled:
+                log.record(runLog.WARNING, "CANCELLED", "Cancelled, {done} of {total} rename(s) completed", 
+                           done=0 if settings.isTestOnly else len(renamed), total=len(plan.renames))
+        
+        meshesRenamed = 0 if settings.isTestOnly else len(renamed)
+        
+        summary = \
+            f"No data block has been renamed for a total of {stats.objectsScanned} object(s)" \
+            if meshesRenamed == 0 else \
+            f"Renamed {meshesRenamed} data block(s) for a total of {stats.objectsScanned} object(s)" \
+        
+        if plan is not None and plan.redundantWritesAvoided > 0:
+            summary += f", {plan.redundantWritesAvoided} redundant rename(s) of shared data blocks avoided"
+        
+        if self.protected:
+            summary += f", {len(self.protected)} linked or protected data block(s) skipped"
+        
+        if self.failures:
+            summary += f", {len(self.failures)} rename(s) failed"
+            self._report({'WARNING'}, f"{len(self.failures)} data block(s) could not be renamed, see the System Console")
+        
+        if self.cancelled:
+            summary += ", cancelled"
+        
+        if self._manifest is not None:
+            self._manifest.close()
+            log.line(f"Manifest of {self._manifest.count} write(s) saved to {self._manifest.path}")
+        
+        if self._profiler is not None:
+            self._profiler.stop()
+            if self._profiler.error:
+                log.line(self._profiler.error)
+                self._report({'WARNING'}, self._profiler.error)
+            else:
+                log.line(f"Profile saved to {self._profiler.profilePath}")
+                if self._profiler.memoryPath:
+                    log.line(f"Memory snapshot saved to {self._profiler.memoryPath}")
+        
+        with stats.phase("log"):
+            log.summarizeOmitted()
+            
+            log.line()
+            log.line(f"-" * 80)        
+            log.line(summary)
+            log.line(f"-" * 80)
+            log.line(f"T1nk-R Mesh Name Synchronizer finished")                                            
+            log.line(f"=" * 80)
+            log.line()
+            
+            log.flush()
+        
+        # Statistics are complete once output is written, only the report is closed afterwards
+        stats.finish()
+        
+        self._report({'INFO'}, summary)
+        self._report({'INFO'}, stats.describe())
+        
+        log.report(
+            event="finished", 
+            summary=summary, 
+            cancelled=self.cancelled, 
+            manifest=self._manifest.path if self._manifest is not None else "",
+            counts=dict(log.counts), 
+            stats=stats.asDict()
+        )
+        log.close()
+        
+        # Undo steps are not tied to the outcome, see `needsUndoStep`
+        self.status = {'CANCELLED'} if self.cancelled or self._failed else {'FINISHED'}
+
+
+# Private functions ===============================================================================================================
+
+# Tell if time is up --------------------------------------------------------------------------------------------------------------
+def _isTimeUp(deadline: float) -> bool:
+    """Tell if a deadline (as by `time.perf_counter()`) has passed. `None` means no deadline."""
+    return deadline is not None and time.perf_counter() >= deadline
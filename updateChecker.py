@@ -49,10 +49,15 @@
 
 from __future__ import annotations
 from . import bl_info
-import requests
+from . import httpClient
 import json
 import contextlib
+import os
+import sys
+import threading
+import types
 from datetime import datetime, timedelta
+import bpy
 from bpy.types import PropertyGroup, Operator, Context
 from bpy.props import StringProperty, BoolProperty, IntProperty
 
@@ -102,27 +107,46 @@ class UpdateCheckingInfo:
     
     forceUpdateCheck: bool = False
     
+    serviceUrlVariable: str = "T1NKR_UPDATE_CHECK_URL"
+    """Environment variable to specify another service endpoint with, such as a local one for testing"""
+    
     @staticmethod
     def getUpdateCheckingServiceUrl() -> str:
         """URL to the service endpoint of tge GitHub Update Checker service"""
         
+        # Test URL, such as http://localhost:5000/getUpdateInfo
+        if os.environ.get(UpdateCheckingInfo.serviceUrlVariable):
+            return os.environ[UpdateCheckingInfo.serviceUrlVariable]
+        
         # Production URL
         return "https://apps.imprestige.biz/gitHubUpdateChecker/getUpdateInfo"
-        
-        # Test URL
-        #return "http://localhost:5000/getUpdateInfo"
     
     
     @staticmethod
-    def getRequestBody():
+    def getRequestBody(repoSlug: str = None, currentVersion: str = None):
+        """Body of a request checking a single add-on, this one by default"""
         return {
                 "appInfo": 
                     {
-                        "repoSlug": UpdateCheckingInfo._repoSlug,
-                        "currentVersion": UpdateCheckingInfo.currentVersion
+                        "repoSlug": repoSlug or UpdateCheckingInfo._repoSlug,
+                        "currentVersion": currentVersion if currentVersion is not None else UpdateCheckingInfo.currentVersion
                     },
                     "forceUpdateCheck": UpdateCheckingInfo.forceUpdateCheck
             }
+    
+    @staticmethod
+    def getBatchRequestBody(apps: dict):
+        """Body of a request checking several add-ons at once, specified as a dictionary of slugs and current versions"""
+        return {
+                "appInfos": [
+                    {
+                        "repoSlug": repoSlug,
+                        "currentVersion": currentVersion
+                    }
+                    for repoSlug, currentVersion in apps.items()
+                ],
+                "forceUpdateCheck": UpdateCheckingInfo.forceUpdateCheck
+            }
         
             
     
@@ -132,6 +156,16 @@ class T1nkerMeshNameSynchronizerUpdateInfo(PropertyGroup):
     Information about the current and the latest update
     """
     
+    checkForUpdates: BoolProperty(
+        name="Check for updates",
+        description="Check for new versions of the add-on time to time. Checks can also be disabled by setting the " \
+            "T1NKR_NO_UPDATE_CHECK environment variable, such as on offline machines",
+        default=True
+    ) # type: ignore
+    """
+    Tells whether to check for updates at all. See also `BackgroundUpdateChecker.disablingVariable`.
+    """
+    
     checkFrequencyDays: IntProperty(
         name="Update check frequency (days)",
         default=1
@@ -180,6 +214,856 @@ class T1nkerMeshNameSynchronizerUpdateInfo(PropertyGroup):
     Date and time of last successful check for updates.
     """
         
+        
+# Persistent update check cache ###################################################################################################
+class UpdateCheckCache:
+    """
+    On-disk cache of update check results, shared by all Blender sessions of the user. Add-on preferences are not necessarily
+    saved, and Blender may be started hundreds of times a day on workstations and farm nodes, so this cache makes sure a fresh
+    answer is reused across sessions. Entries are keyed by repository slug and installed version, and also store the validators
+    (`ETag` and `Last-Modified`) of the response so that the service can confirm an unchanged answer with a `304 Not Modified`.
+    
+    Failed checks are recorded too, so that machines which can't reach the service, such as offline render nodes, don't wait
+    for a timeout at each start of Blender. After a failure, no check is performed for `backoffSeconds`, doubled for each
+    further consecutive failure. After `failureThreshold` consecutive failures the circuit breaker opens, and no check is 
+    performed for `openCircuitSeconds`. Then a single check is tried again, and a success closes the breaker.
+    
+    The cache file is a small JSON document in Blender's user config folder. All functions but `defaultPath()` are safe to call
+    from a worker thread as they don't access `bpy`.
+    """
+    
+    fileName = "t1nkr-update-check-cache.json"
+    """Name of the cache file within the user config folder"""
+    
+    _lock = threading.Lock()
+    """Serializes read-modify-write cycles of the cache file within this process"""
+    
+    backoffSeconds: float = 15 * 60
+    """Time not to check after a failure, doubled for each further consecutive failure (seconds)"""
+    
+    failureThreshold: int = 3
+    """Number of consecutive failures opening the circuit breaker"""
+    
+    openCircuitSeconds: float = 24 * 60 * 60
+    """Time not to check while the circuit breaker is open (seconds)"""
+    
+    _failureFields = ("failures", "lastError", "failedAt", "retryAfter")
+    """Fields of an entry recording failures"""
+    
+    # Public functions ============================================================================================================
+    
+    # Get the location of the cache file ------------------------------------------------------------------------------------------
+    @staticmethod
+    def defaultPath() -> str:
+        """
+        Get the path of the cache file in Blender's user config folder. Must be called on the main thread.
+
+        Returns:
+            str: Path to the cache file, or `None` if the config folder is not available.
+        """
+        
+        try:
+            return os.path.join(bpy.utils.user_resource('CONFIG', path="t1nkr", create=True), UpdateCheckCache.fileName)
+        except Exception:
+            return None
+    
+    # Form the key of an entry ----------------------------------------------------------------------------------------------------
+    @staticmethod
+    def key(repoSlug: str, currentVersion: str) -> str:
+        """Key of the cache entry for the specified repository and installed version"""
+        return f"{repoSlug}@{currentVersion}"
+    
+    # Get an entry ----------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def getEntry(path: str, key: str) -> dict:
+        """
+        Get a cache entry.
+
+        Args:
+            path (str): Path to the cache file.
+            key (str): Key of the entry as returned by `key()`.
+
+        Returns:
+            dict: The entry, or `None` if there is no such entry or the cache cannot be read.
+        """
+        
+        if not path:
+            return None
+        
+        with UpdateCheckCache._lock:
+            return UpdateCheckCache._load(path).get(key)
+    
+    # Get all entries -------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def getEntries(path: str) -> dict:
+        """
+        Get all cache entries at once, reading the cache file only once.
+
+        Args:
+            path (str): Path to the cache file.
+
+        Returns:
+            dict: The entries by key as returned by `key()`, empty if the cache cannot be read.
+        """
+        
+        if not path:
+            return {}
+        
+        with UpdateCheckCache._lock:
+            return UpdateCheckCache._load(path)
+    
+    # Store an entry --------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def storeEntry(path: str, key: str, entry: dict):
+        """
+        Store a cache entry. The file is replaced atomically so that concurrently starting Blender instances never read a
+        half-written cache. Errors are silently ignored, as the cache is just an optimization.
+
+        Args:
+            path (str): Path to the cache file.
+            key (str): Key of the entry as returned by `key()`.
+            entry (dict): The entry to store.
+        """
+        
+        if not path:
+            return
+        
+        with UpdateCheckCache._lock, contextlib.suppress(Exception):
+            entries = UpdateCheckCache._load(path)
+            entries[key] = entry
+            
+            tempPath = f"{path}.{os.getpid()}.tmp"
+            with open(tempPath, "w", encoding="utf-8") as cacheFile:
+                json.dump(entries, cacheFile, indent=1)
+            os.replace(tempPath, path)
+    
+    # Tell if an entry can be served ----------------------------------------------------------------------------------------------
+    @staticmethod
+    def isFresh(entry: dict, checkFrequencyDays: int) -> bool:
+        """
+        Tell if a cache entry is recent enough to be served without asking the service.
+
+        Args:
+            entry (dict): The entry, may be `None`.
+            checkFrequencyDays (int): Number of days after which cached information expires.
+
+        Returns:
+            bool: `True` if the entry can be served, `False` otherwise.
+        """
+        
+        try:
+            checkedAt = datetime.strptime(entry["checkedAt"], BackgroundUpdateChecker.timestampFormat)
+        except Exception:
+            return False
+        
+        return (datetime.now() - checkedAt).days < checkFrequencyDays
+    
+    # Record a failure ------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def recordFailure(entry: dict, error: str, now: datetime = None) -> dict:
+        """
+        Record a failed check in an entry, and determine when to check again.
+
+        Args:
+            entry (dict): The entry, may be `None`. The last successful result stored in it is kept.
+            error (str): Description of the failure.
+            now (datetime, optional): Time of the failure. Defaults to the current time.
+
+        Returns:
+            dict: A new entry with the failure recorded.
+        """
+        
+        now = now or datetime.now()
+        entry = dict(entry or {})
+        failures = int(entry.get("failures", 0)) + 1
+        
+        if failures >= UpdateCheckCache.failureThreshold:
+            waitSeconds = UpdateCheckCache.openCircuitSeconds
+        else:
+            waitSeconds = UpdateCheckCache.backoffSeconds * 2 ** (failures - 1)
+        
+        entry.update(
+            failures=failures,
+            lastError=error,
+            failedAt=datetime.strftime(now, BackgroundUpdateChecker.timestampFormat),
+            retryAfter=datetime.strftime(now + timedelta(seconds=waitSeconds), BackgroundUpdateChecker.timestampFormat)
+        )
+        
+        return entry
+    
+    # Forget failures -------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def clearFailures(entry: dict) -> dict:
+        """Get a copy of an entry without failures recorded, to be stored after a successful check"""
+        return {name: value for name, value in entry.items() if name not in UpdateCheckCache._failureFields}
+    
+    # Tell if checks shall be avoided ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def isBackingOff(entry: dict, now: datetime = None) -> bool:
+        """
+        Tell if a check shall not be performed because of recent failures.
+
+        Args:
+            entry (dict): The entry, may be `None`.
+            now (datetime, optional): The time to tell it for. Defaults to the current time.
+
+        Returns:
+            bool: `True` if no check shall be performed yet, `False` otherwise.
+        """
+        
+        try:
+            retryAfter = datetime.strptime(entry["retryAfter"], BackgroundUpdateChecker.timestampFormat)
+        except Exception:
+            return False
+        
+        return (now or datetime.now()) < retryAfter
+    
+    # Tell if the circuit breaker is open -----------------------------------------------------------------------------------------
+    @staticmethod
+    def isCircuitOpen(entry: dict, now: datetime = None) -> bool:
+        """Tell if checks are suspended for too many consecutive failures, see `isBackingOff()` for arguments"""
+        
+        return UpdateCheckCache.isBackingOff(entry, now) \
+            and int(entry.get("failures", 0)) >= UpdateCheckCache.failureThreshold
+    
+    # Private functions ===========================================================================================================
+    
+    # Read all entries ------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _load(path: str) -> dict:
+        """Read all entries of the cache file, or return an empty dictionary if the file is missing or unreadable"""
+        
+        try:
+            with open(path, encoding="utf-8") as cacheFile:
+                entries = json.load(cacheFile)
+            return entries if isinstance(entries, dict) else {}
+        except Exception:
+            return {}
+
+
+# Coordinator of update checks of all T1nk-R add-ons ##############################################################################
+class UpdateCheckCoordinator:
+    """
+    Performs update checks for all T1nk-R add-ons enabled in the process, so that they share a single worker thread and make a
+    single batched request instead of a round-trip each. Each add-on ships its own copy of this class, and the first one
+    needing it publishes an instance under `sharedName` in `sys.modules`, which is then used by all of them, see `shared()`.
+    
+    Add-ons register their slug and version when they are enabled (see `registerApp()`). When any of them requests a check,
+    all registered add-ons whose information in the `UpdateCheckCache` has expired are checked in the same request. Results are
+    stored in the cache, which is shared by all add-ons, and also kept for the add-ons waiting for them (see `takeResult()`), 
+    so each of them gets its own answer without asking the service again. Only one check runs at a time: requests arriving 
+    while a check is running are collected and served together once it completes.
+    
+    If the service does not accept batched requests, add-ons are checked one by one, still on the same thread and connection.
+    Nothing here accesses `bpy`, so it's safe to run on the worker thread.
+    """
+    
+    protocol: int = 1
+    """Version of the interface of this class. An instance published by an add-on with an older version is replaced."""
+    
+    sharedName: str = "t1nkr_update_check_coordinator"
+    """Name of the module in `sys.modules` holding the shared instance"""
+    
+    unsupportedBatchStatuses: tuple = (400, 404, 405, 415, 422)
+    """HTTP statuses meaning that the service does not understand batched requests"""
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self):
+        
+        self.worker: threading.Thread = None
+        """The worker thread performing checks, if running"""
+        
+        self.supportsBatches = True
+        """Tells if the service is assumed to accept batched requests, turned off when it refuses one"""
+        
+        self.requestCount = 0
+        """Number of requests sent to the service"""
+        
+        self._lock = threading.Lock()
+        """Guards the state below, as it is accessed from the main thread and the worker thread"""
+        
+        self._apps = {}
+        """Add-ons registered, as slugs mapped to their current version and `checkFrequencyDays`"""
+        
+        self._requested = {}
+        """Slugs of add-ons requesting a check not yet started, mapped to whether the check is forced"""
+        
+        self._inFlight = set()
+        """Slugs of add-ons being checked"""
+        
+        self._results = {}
+        """Outcomes of checks not yet taken, by slug"""
+        
+        self._cachePath = None
+        """Path to the cache file, as found by the add-on requesting the last check"""
+    
+    # Public functions ============================================================================================================
+    
+    # Get the shared coordinator --------------------------------------------------------------------------------------------------
+    @staticmethod
+    def shared() -> UpdateCheckCoordinator:
+        """
+        Get the coordinator shared by all T1nk-R add-ons in the process, publishing a new one if there is none yet, or if the
+        one published is older than this one. Must be called on the main thread.
+
+        Returns:
+            UpdateCheckCoordinator: The coordinator.
+        """
+        
+        holder = sys.modules.get(UpdateCheckCoordinator.sharedName)
+        coordinator = getattr(holder, "coordinator", None)
+        
+        if coordinator is not None and getattr(coordinator, "protocol", 0) >= UpdateCheckCoordinator.protocol:
+            return coordinator
+        
+        replacement = UpdateCheckCoordinator()
+        if coordinator is not None:
+            # Keep add-ons registered with the older one
+            replacement._apps.update(getattr(coordinator, "_apps", {}))
+        
+        holder = types.ModuleType(UpdateCheckCoordinator.sharedName)
+        holder.coordinator = replacement
+        sys.modules[UpdateCheckCoordinator.sharedName] = holder
+        
+        return replacement
+    
+    # Register an add-on ----------------------------------------------------------------------------------------------------------
+    def registerApp(self, repoSlug: str, currentVersion: str, checkFrequencyDays: int = 1):
+        """
+        Register an add-on to be checked along with others.
+
+        Args:
+            repoSlug (str): Slug of the repository of the add-on.
+            currentVersion (str): Version of the installed add-on in `x.y.z` format.
+            checkFrequencyDays (int, optional): Number of days after which information on the add-on expires. Defaults to 1.
+        """
+        
+        with self._lock:
+            self._apps[repoSlug] = {"currentVersion": currentVersion, "checkFrequencyDays": checkFrequencyDays}
+    
+    # Unregister an add-on --------------------------------------------------------------------------------------------------------
+    def unregisterApp(self, repoSlug: str):
+        """Stop checking an add-on along with others, such as when it's disabled"""
+        
+        with self._lock:
+            self._apps.pop(repoSlug, None)
+            self._results.pop(repoSlug, None)
+    
+    # Request a check -------------------------------------------------------------------------------------------------------------
+    def request(self, repoSlug: str, currentVersion: str, cachePath: str, force: bool = False, 
+                checkFrequencyDays: int = 1) -> bool:
+        """
+        Request a check of an add-on, also registering it. The check is performed on the worker thread along with those of 
+        other add-ons due, and its outcome is available from `takeResult()` once `isPending()` turns `False`. Returns 
+        immediately.
+
+        Args:
+            repoSlug (str): Slug of the repository of the add-on.
+            currentVersion (str): Version of the installed add-on in `x.y.z` format.
+            cachePath (str): Path to the cache file, or `None` if not available.
+            force (bool, optional): Ask the service to bypass its own cache, and skip conditional revalidation. Defaults to 
+                `False`.
+            checkFrequencyDays (int, optional): Number of days after which information on the add-on expires. Defaults to 1.
+
+        Returns:
+            bool: `True` if a check has been started or scheduled, `False` if the add-on is already being checked.
+        """
+        
+        with self._lock:
+            self._apps[repoSlug] = {"currentVersion": currentVersion, "checkFrequencyDays": checkFrequencyDays}
+            self._cachePath = cachePath
+            
+            if repoSlug in self._requested or (repoSlug in self._inFlight and not force):
+                return False
+            
+            self._results.pop(repoSlug, None)
+            self._requested[repoSlug] = force
+            
+            if self.worker is None or not self.worker.is_alive():
+                self.worker = threading.Thread(target=self._work, name="t1nkr-update-check", daemon=True)
+                self.worker.start()
+        
+        return True
+    
+    # Tell if a check is pending --------------------------------------------------------------------------------------------------
+    def isPending(self, repoSlug: str) -> bool:
+        """Tell if an add-on is being checked or waiting to be checked"""
+        
+        with self._lock:
+            return repoSlug in self._requested or repoSlug in self._inFlight
+    
+    # Take the outcome of a check -------------------------------------------------------------------------------------------------
+    def takeResult(self, repoSlug: str) -> dict:
+        """
+        Take the outcome of the last check of an add-on, so that it's delivered only once.
+
+        Args:
+            repoSlug (str): Slug of the repository of the add-on.
+
+        Returns:
+            dict: The outcome, with `succeeded` telling if the check has succeeded, or `None` if there is none.
+        """
+        
+        with self._lock:
+            return self._results.pop(repoSlug, None)
+    
+    # Private functions ===========================================================================================================
+    
+    # Perform checks (worker thread) ----------------------------------------------------------------------------------------------
+    def _work(self):
+        """
+        Check add-ons requested, along with other add-ons registered and due, until no more requests arrive.
+        """
+        
+        while True:
+            with self._lock:
+                requested = self._requested
+                self._requested = {}
+                
+                if not requested:
+                    self._inFlight = set()
+                    self.worker = None
+                    return
+                
+                # Keep add-ons requesting a check pending while finding out which others are due
+                self._inFlight = set(requested)
+                cachePath = self._cachePath
+                apps = dict(self._apps)
+            
+            # Don't block the main thread on reading the cache file
+            cacheEntries = UpdateCheckCache.getEntries(cachePath)
+            
+            # Add-ons not requesting a check are checked only if their information has expired, and not failing recently
+            batch = {}
+            for repoSlug, info in apps.items():
+                if repoSlug not in requested:
+                    entry = cacheEntries.get(UpdateCheckCache.key(repoSlug, info["currentVersion"]))
+                    if UpdateCheckCache.isFresh(entry, info["checkFrequencyDays"]) or UpdateCheckCache.isBackingOff(entry):
+                        continue
+                
+                batch[repoSlug] = info["currentVersion"]
+            
+            with self._lock:
+                self._inFlight = set(batch)
+            
+            results = self._check(batch, any(requested.values()), cachePath, cacheEntries)
+            
+            with self._lock:
+                self._results.update(results)
+                self._inFlight = set()
+    
+    # Check add-ons (worker thread) -----------------------------------------------------------------------------------------------
+    def _check(self, batch: dict, force: bool, cachePath: str, cacheEntries: dict) -> dict:
+        """
+        Check add-ons in a single request if possible, and update the cache.
+
+        Args:
+            batch (dict): Slugs of add-ons mapped to their current version.
+            force (bool): Ask the service to bypass its own cache, and skip conditional revalidation.
+            cachePath (str): Path to the cache file, or `None` if not available.
+            cacheEntries (dict): All entries of the cache, as returned by `UpdateCheckCache.getEntries()`.
+
+        Returns:
+            dict: Outcomes by slug, see `takeResult()`.
+        """
+        
+        UpdateCheckingInfo.forceUpdateCheck = force
+        cacheEntries = {
+            repoSlug: cacheEntries.get(UpdateCheckCache.key(repoSlug, currentVersion))
+            for repoSlug, currentVersion in batch.items()
+        }
+        
+        if len(batch) > 1 and self.supportsBatches:
+            try:
+                self.requestCount += 1
+                response = httpClient.HttpClient.postJson(
+                    UpdateCheckingInfo.getUpdateCheckingServiceUrl(), UpdateCheckingInfo.getBatchRequestBody(batch), 
+                    timeout=BackgroundUpdateChecker.requestTimeoutSeconds
+                )
+                
+                if response.status not in UpdateCheckCoordinator.unsupportedBatchStatuses:
+                    # For errors, enable raising exceptions
+                    response.raiseForStatus()
+                    responseBody = response.json()
+                
+                if response.status in UpdateCheckCoordinator.unsupportedBatchStatuses or "results" not in responseBody:
+                    # Check add-ons one by one below
+                    self.supportsBatches = False
+                else:
+                    answers = {answer["repoSlug"]: answer for answer in responseBody["results"]}
+                    results = {}
+                    
+                    for repoSlug, currentVersion in batch.items():
+                        if repoSlug in answers:
+                            entry = UpdateCheckCoordinator._entryFrom(answers[repoSlug])
+                            results[repoSlug] = self._succeeded(repoSlug, currentVersion, cachePath, entry)
+                        else:
+                            error = "No version info received"
+                            results[repoSlug] = self._failed(repoSlug, currentVersion, cachePath, cacheEntries[repoSlug], error)
+                    
+                    return results
+            except Exception as ex:
+                error = UpdateCheckCoordinator._describeError(ex)
+                return {
+                    repoSlug: self._failed(repoSlug, currentVersion, cachePath, cacheEntries[repoSlug], error)
+                    for repoSlug, currentVersion in batch.items()
+                }
+        
+        return {
+            repoSlug: self._checkOne(repoSlug, currentVersion, force, cachePath, cacheEntries[repoSlug])
+            for repoSlug, currentVersion in batch.items()
+        }
+    
+    # Check an add-on (worker thread) ---------------------------------------------------------------------------------------------
+    def _checkOne(self, repoSlug: str, currentVersion: str, force: bool, cachePath: str, cacheEntry: dict) -> dict:
+        """
+        Check a single add-on, asking the service to confirm the previous answer if possible, and update the cache.
+
+        Args:
+            repoSlug (str): Slug of the repository of the add-on.
+            currentVersion (str): Version of the installed add-on in `x.y.z` format.
+            force (bool): Whether to skip conditional revalidation.
+            cachePath (str): Path to the cache file, or `None` if not available.
+            cacheEntry (dict): The previous cache entry, or `None`. Its validators are used for a conditional request.
+
+        Returns:
+            dict: The outcome, see `takeResult()`.
+        """
+        
+        try: # if anything goes wrong we silently fail, no need to perform double-checks
+            payload = UpdateCheckingInfo.getRequestBody(repoSlug, currentVersion)
+            
+            # Ask the service to confirm the previous answer instead of sending it again
+            headers = {}
+            if cacheEntry and not force:
+                if cacheEntry.get("etag"):
+                    headers["If-None-Match"] = cacheEntry["etag"]
+                if cacheEntry.get("lastModified"):
+                    headers["If-Modified-Since"] = cacheEntry["lastModified"]
+            
+            self.requestCount += 1
+            response = httpClient.HttpClient.postJson(
+                UpdateCheckingInfo.getUpdateCheckingServiceUrl(), payload, headers=headers, 
+                timeout=BackgroundUpdateChecker.requestTimeoutSeconds
+            )
+            
+            if response.status == 304 and cacheEntry:
+                # Nothing has changed since the last check
+                entry = UpdateCheckCache.clearFailures(cacheEntry)
+            else:
+                # For errors, enable raising exceptions
+                response.raiseForStatus()
+                
+                # Being here means a response has been received successfully
+                entry = UpdateCheckCoordinator._entryFrom(response.json())
+                entry["etag"] = response.headers.get("etag", "")
+                entry["lastModified"] = response.headers.get("last-modified", "")
+            
+            return self._succeeded(repoSlug, currentVersion, cachePath, entry)
+            
+        except Exception as ex:
+            return self._failed(repoSlug, currentVersion, cachePath, cacheEntry, UpdateCheckCoordinator._describeError(ex))
+    
+    # Record a success (worker thread) --------------------------------------------------------------------------------------------
+    def _succeeded(self, repoSlug: str, currentVersion: str, cachePath: str, entry: dict) -> dict:
+        """Store the cache entry of a successful check, and return the outcome"""
+        
+        entry["checkedAt"] = datetime.strftime(datetime.now(), BackgroundUpdateChecker.timestampFormat)
+        UpdateCheckCache.storeEntry(cachePath, UpdateCheckCache.key(repoSlug, currentVersion), entry)
+        
+        return dict(entry, succeeded=True)
+    
+    # Record a failure (worker thread) --------------------------------------------------------------------------------------------
+    def _failed(self, repoSlug: str, currentVersion: str, cachePath: str, cacheEntry: dict, error: str) -> dict:
+        """Record a failed check in the cache, so that it's not tried again for a while, and return the outcome"""
+        
+        failedEntry = UpdateCheckCache.recordFailure(cacheEntry, error)
+        UpdateCheckCache.storeEntry(cachePath, UpdateCheckCache.key(repoSlug, currentVersion), failedEntry)
+        
+        return {"succeeded": False, "error": error, "retryAfter": failedEntry["retryAfter"]}
+    
+    # Make a cache entry of an answer ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def _entryFrom(answer: dict) -> dict:
+        """Make a cache entry of the answer of the service on an add-on"""
+        
+        repoInfo = answer["repository"]
+        
+        return {
+            "latestVersion": repoInfo["latestVersion"],
+            "latestVersionName": repoInfo["latestVersionName"],
+            "updateAvailable": bool(answer["updateAvailable"])
+        }
+    
+    # Describe an error -----------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _describeError(error: Exception) -> str:
+        """Describe an error of a check, to be recorded and printed"""
+        
+        if isinstance(error, httpClient.HttpTimeout):
+            # Timeout, let's not bother the user
+            return "Version checking timed out"
+        
+        if isinstance(error, httpClient.HttpError):
+            return f"Version checking failed: {error}" if error.status else f"Cannot connect for version checking: {error}"
+        
+        return f"Error during version check: {error}"
+
+
+# Background update checking ######################################################################################################
+class BackgroundUpdateChecker:
+    """
+    Runs update checks on a worker thread so that no network traffic ever blocks Blender's UI or the synchronizer operator.
+    
+    The HTTP request is performed by the `UpdateCheckCoordinator` shared by all T1nk-R add-ons, on a daemon thread which must
+    not touch any `bpy` data, along with checks of other add-ons. The result is handed back to 
+    `T1nkerMeshNameSynchronizerUpdateInfo` on the main thread by a `bpy.app.timers` callback polling for the outcome.
+    At most one automatic check is started per Blender session, and only if neither add-on preferences nor the
+    `UpdateCheckCache` hold information younger than `T1nkerMeshNameSynchronizerUpdateInfo.checkFrequencyDays`.
+    
+    Requests are sent by `httpClient.HttpClient`, which loads an HTTP library only when the first check is performed, on the
+    worker thread, and keeps connections alive for the whole Blender session, so that repeated checks reuse the connection
+    instead of setting up TCP and TLS again.
+    """
+    
+    _lock = threading.Lock()
+    """Guards the state below, as it is accessed from both the main and the worker thread"""
+    
+    _startedThisSession: bool = False
+    """Tells whether a check has already been started in this session"""
+    
+    requestTimeoutSeconds: float = 5.0
+    """Time to wait for connecting to the service, and for its response (seconds)"""
+    
+    disablingVariable: str = "T1NKR_NO_UPDATE_CHECK"
+    """Environment variable disabling update checks if set to anything but `0` or empty"""
+    
+    pollIntervalSeconds: float = 0.5
+    """How often the main thread shall look for the outcome of a running check (seconds)"""
+    
+    timestampFormat: str = '%Y-%m-%d %H:%M:%S'
+    """Format of `T1nkerMeshNameSynchronizerUpdateInfo.lastCheckedTimestamp` and cache timestamps"""
+    
+    # Public functions ============================================================================================================
+    
+    # Tell if checks are disabled -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def isDisabled(updateInfo: T1nkerMeshNameSynchronizerUpdateInfo) -> bool:
+        """
+        Tell if update checks are disabled in preferences or by the environment variable named `disablingVariable`.
+
+        Args:
+            updateInfo (T1nkerMeshNameSynchronizerUpdateInfo): The update info stored in add-on preferences.
+
+        Returns:
+            bool: `True` if no check shall be performed.
+        """
+        
+        if os.environ.get(BackgroundUpdateChecker.disablingVariable, "0") not in ("", "0"):
+            return True
+        
+        return not updateInfo.checkForUpdates
+    
+    # Tell if cached update info is outdated --------------------------------------------------------------------------------------
+    @staticmethod
+    def isCheckDue(updateInfo: T1nkerMeshNameSynchronizerUpdateInfo) -> bool:
+        """
+        Tell if the update information cached in preferences has expired as per `checkFrequencyDays`.
+
+        Args:
+            updateInfo (T1nkerMeshNameSynchronizerUpdateInfo): The update info stored in add-on preferences.
+
+        Returns:
+            bool: `True` if a new check shall be performed, `False` if cached information can be served.
+        """
+        try:
+            lastCheckDate = datetime.strptime(updateInfo.lastCheckedTimestamp, BackgroundUpdateChecker.timestampFormat)
+        except Exception:
+            # Never checked, or the timestamp is unreadable
+            return True
+        
+        return (datetime.now() - lastCheckDate).days >= updateInfo.checkFrequencyDays
+    
+    # Join checks of other add-ons ------------------------------------------------------------------------------------------------
+    @staticmethod
+    def registerApp(context: Context = None):
+        """
+        Register the add-on with the `UpdateCheckCoordinator` shared by T1nk-R add-ons, so that it's checked along with any 
+        other one checked, unless checks are disabled. Nothing is sent to the service. Call it when the add-on is registered.
+
+        Args:
+            context (bpy.types.Context, optional): A context object passed on by Blender. Defaults to `bpy.context`.
+        """
+        
+        context = context or bpy.context
+        
+        try:
+            updateInfo = context.preferences.addons[__package__].preferences.updateInfo
+        except Exception:
+            # Preferences are not available (yet), the add-on will register when requesting a check
+            return
+        
+        coordinator = UpdateCheckCoordinator.shared()
+        
+        if BackgroundUpdateChecker.isDisabled(updateInfo):
+            coordinator.unregisterApp(UpdateCheckingInfo._repoSlug)
+        else:
+            coordinator.registerApp(
+                UpdateCheckingInfo._repoSlug, ".".join([str(i) for i in bl_info["version"]]), updateInfo.checkFrequencyDays
+            )
+    
+    # Start a check in the background if needed -----------------------------------------------------------------------------------
+    @staticmethod
+    def requestCheck(context: Context = None, force: bool = False) -> bool:
+        """
+        Start an update check on a worker thread unless checks are disabled, the cached information has not yet expired, recent
+        checks have failed (see `UpdateCheckCache`), or a check has already been started in this session. Fresh information 
+        found in the on-disk cache is copied to preferences right away. Returns immediately in all cases.
+
+        Args:
+            context (bpy.types.Context, optional): A context object passed on by Blender. Defaults to `bpy.context`.
+            force (bool, optional): Ignore caches and failures and perform a check unless one is already running or checks are 
+                disabled. Defaults to `False`.
+
+        Returns:
+            bool: `True` if a check has been started, `False` otherwise.
+        """
+        
+        context = context or bpy.context
+        
+        try:
+            updateInfo = context.preferences.addons[__package__].preferences.updateInfo
+        except Exception:
+            # Preferences are not available (yet), nothing to do
+            return False
+        
+        if BackgroundUpdateChecker.isDisabled(updateInfo):
+            return False
+        
+        # Collect everything the worker needs here, as it must not access bpy data
+        currentVersion = ".".join([str(i) for i in bl_info["version"]])
+        updateInfo.currentVersion = currentVersion
+        
+        cachePath = UpdateCheckCache.defaultPath()
+        cacheKey = UpdateCheckCache.key(UpdateCheckingInfo._repoSlug, currentVersion)
+        cacheEntry = UpdateCheckCache.getEntry(cachePath, cacheKey)
+        
+        if not force:
+            # Serve a recent answer of another session
+            if UpdateCheckCache.isFresh(cacheEntry, updateInfo.checkFrequencyDays):
+                try:
+                    BackgroundUpdateChecker._applyResult(updateInfo, cacheEntry)
+                    return False
+                except Exception:
+                    # The entry is damaged, perform a check to replace it
+                    pass
+            
+            # Don't wait for a timeout again if the service could not be reached recently
+            if UpdateCheckCache.isBackingOff(cacheEntry):
+                return False
+            
+            if not BackgroundUpdateChecker.isCheckDue(updateInfo):
+                return False
+        
+        with BackgroundUpdateChecker._lock:
+            if BackgroundUpdateChecker._startedThisSession and not force:
+                return False
+            
+            BackgroundUpdateChecker._startedThisSession = True
+        
+        # Checked along with other T1nk-R add-ons due, or along with the check already running
+        coordinator = UpdateCheckCoordinator.shared()
+        started = coordinator.request(
+            UpdateCheckingInfo._repoSlug, currentVersion, cachePath, force=force, checkFrequencyDays=updateInfo.checkFrequencyDays
+        )
+        
+        if not bpy.app.timers.is_registered(BackgroundUpdateChecker._deliverResult):
+            bpy.app.timers.register(
+                BackgroundUpdateChecker._deliverResult, 
+                first_interval=BackgroundUpdateChecker.pollIntervalSeconds, 
+                persistent=True
+            )
+        
+        return started
+    
+    # Stop delivering results -----------------------------------------------------------------------------------------------------
+    @staticmethod
+    def shutdown():
+        """
+        Stop polling for results and close pooled connections, to be called when the add-on is unregistered. A running worker 
+        thread is a daemon thread and will simply finish without anyone consuming its result.
+        """
+        
+        with contextlib.suppress(Exception):
+            if bpy.app.timers.is_registered(BackgroundUpdateChecker._deliverResult):
+                bpy.app.timers.unregister(BackgroundUpdateChecker._deliverResult)
+        
+        with contextlib.suppress(Exception):
+            UpdateCheckCoordinator.shared().unregisterApp(UpdateCheckingInfo._repoSlug)
+        
+        with contextlib.suppress(Exception):
+            httpClient.HttpClient.close()
+    
+    # Private functions ===========================================================================================================
+    
+    # Hand the result over to Blender (main thread) -------------------------------------------------------------------------------
+    @staticmethod
+    def _deliverResult():
+        """
+        Timer callback running on the main thread. Stores the outcome of the check in add-on preferences once the worker
+        thread has finished.
+
+        Returns:
+            float: Seconds until the next poll, or `None` to stop polling.
+        """
+        
+        coordinator = UpdateCheckCoordinator.shared()
+        result = coordinator.takeResult(UpdateCheckingInfo._repoSlug)
+        
+        if result is None:
+            # Keep polling while the check is pending, stop if the worker has died without leaving a result
+            worker = coordinator.worker
+            isRunning = worker is not None and worker.is_alive()
+            return BackgroundUpdateChecker.pollIntervalSeconds \
+                if isRunning and coordinator.isPending(UpdateCheckingInfo._repoSlug) else None
+        
+        try:
+            updateInfo = bpy.context.preferences.addons[__package__].preferences.updateInfo
+        except Exception:
+            # The add-on has probably been disabled in the meantime
+            return None
+        
+        if result["succeeded"]:
+            BackgroundUpdateChecker._applyResult(updateInfo, result)
+            print(f"{__package__}: Checking for updates completed, there is {'a' if updateInfo.updateAvailable else 'no' } new version available")
+        else:
+            print(
+                f"{__package__}: {result.get('error', 'Version checking failed')}, "
+                f"not checking again until {result.get('retryAfter')}"
+            )
+            updateInfo.updateAvailable = False
+        
+        return None
+    
+    # Copy a result to preferences (main thread) ----------------------------------------------------------------------------------
+    @staticmethod
+    def _applyResult(updateInfo: T1nkerMeshNameSynchronizerUpdateInfo, result: dict):
+        """
+        Copy a successful result or a cache entry to the update info stored in add-on preferences.
+
+        Args:
+            updateInfo (T1nkerMeshNameSynchronizerUpdateInfo): The update info stored in add-on preferences.
+            result (dict): The result or cache entry.
+        """
+        
+        updateInfo.latestVersionName = result["latestVersionName"]
+        updateInfo.latestVersion = result["latestVersion"]
+        updateInfo.updateAvailable = result["updateAvailable"]
+        updateInfo.lastCheckedTimestamp = result["checkedAt"]
+    
+        
 # Operator for checking updates ###################################################################################################
 class T1NKER_OT_MeshNameSynchronizerUpdateChecker(Operator):    
     """
@@ -192,7 +1076,7 @@ class T1NKER_OT_MeshNameSynchronizerUpdateChecker(Operator):
     bl_idname = "t1nker.meshnamesynchronizerupdatechecker"
     bl_label = "Check updates for T1nk-R Mesh Names Synchronizer"
     bl_description = "Check updates for T1nk-R Mesh Names Synchronizer"
-    bl_options = {'REGISTER', 'UNDO'}    
+    bl_options = {'REGISTER'}    
     bl_category = "T1nk-R Utils"
 
     # Other properties ------------------------------------------------------------------------------------------------------------
@@ -205,73 +1089,26 @@ class T1NKER_OT_MeshNameSynchronizerUpdateChecker(Operator):
     # Public functions ============================================================================================================
     
     # Perform the operation -------------------------------------------------------------------------------------------------------
-    def execute(self, context: Context):  # sourcery skip: extract-method
+    def execute(self, context: Context):
         """
-        Performs update check for the add-on and caches results. The cache expires in some days as specified in
-        `updateInfo.T1nkerMeshNameSynchronizerUpdateInfo.checkFrequencyDays`, and then new check is performed. Until that the
-        cached information is served.
+        Starts an update check for the add-on in the background, unless one has already been started in this session. The 
+        results are cached and expire in some days as specified in 
+        `updateInfo.T1nkerMeshNameSynchronizerUpdateInfo.checkFrequencyDays`. Until that the cached information is served.
+        This operator returns immediately, results arrive in add-on preferences once the check completes.
 
         Args:
             context (bpy.types.Context): A context object passed on by Blender for the current context.
-            event: The event triggering the operation, as passed on by Blender.
 
         Returns:
-            {'FINISHED'} or {'ERROR'}, indicating success or failure of the operation.
+            {'FINISHED'}, as failing to check updates is never an error for the user.
         """
-                
-        updateInfo = context.preferences.addons[__package__].preferences.updateInfo
-
-        # Check cache expiry only if update check is not forced
-        if not self.forceUpdateCheck:            
-            # Check if update check shall be performed based on frequency
-            with contextlib.suppress(Exception):
-                lastCheckDate = datetime.strptime(updateInfo.lastCheckedTimestamp, '%Y-%m-%d %H:%M:%S')
-                delta = datetime.now() - lastCheckDate
-                if delta.days < updateInfo.checkFrequencyDays: # Successfully checked for updates in the last checkFrequencyDays number of days
-                    # Do not flood the repo API, use cached info
-                    return
-        else: # turn forcing check off to prevent accidental flooding                
-            self.forceUpdateCheck = False
-
-        try: # if anything goes wrong we silently fail, no need to perform double-checks
-            print(f"{__package__}: Trying to check for updates")
-            
-            # Get installed version (already stored as a list by Blender)
-
-            installedVersionTags = bl_info["version"]
-            updateInfo.currentVersion = ".".join([str(i) for i in installedVersionTags])
-
-            UpdateCheckingInfo._repoSlug = "T1nkR-Mesh-Name-Synchronizer"
-            UpdateCheckingInfo.currentVersion = updateInfo.currentVersion
-            headers = {'Content-Type': 'application/json'}
-            payload = UpdateCheckingInfo.getRequestBody()
-            response = requests.post(UpdateCheckingInfo.getUpdateCheckingServiceUrl(), headers=headers, json=payload, timeout=5)
-
-            # For errors, enable raising exceptions
-            if response.status_code != 200:
-                response.raise_for_status()
-
-            # Being here means a response has been received successfully
-
-            repoInfo = response.json()["repository"]
-
-            updateInfo.latestVersionName = repoInfo["latestVersionName"]
-            updateInfo.latestVersion = repoInfo["latestVersion"]                        
-            updateInfo.releaseUrl = repoInfo["latestVersion"]
-            updateInfo.repoUrl = repoInfo["repoUrl"]
-            updateInfo.updateAvailable = response.json()["updateAvailable"]
-
-            # Save timestamp
-            updateInfo.lastCheckedTimestamp = f"{datetime.strftime(datetime.now(), '%Y-%m-%d %H:%M:%S')}"
-            
-            print(f"{__package__}: Checking for updates completed, there is {'a' if updateInfo.updateAvailable else 'no' } new version available")
-
-        except requests.exceptions.Timeout as tex:
-            # Timeout, let's not bother the user
-            print(f"{__package__}: Version checking timed out")
-            updateInfo.updateAvailable = False
-        except Exception as ex: 
-            print(f"{__package__}: Error during version check: {ex}")
-            updateInfo.updateAvailable = False
+        
+        force = self.forceUpdateCheck
+        
+        # Turn forcing check off to prevent accidental flooding
+        self.forceUpdateCheck = False
+        
+        if BackgroundUpdateChecker.requestCheck(context, force=force):
+            print(f"{__package__}: Checking for updates in the background")
 
-        return {'FINISHED'}
\ No newline at end of file
+        return {'FINISHED'}